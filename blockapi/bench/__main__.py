@@ -0,0 +1,5 @@
+import sys
+
+from blockapi.bench.runner import main
+
+sys.exit(main())
@@ -0,0 +1,194 @@
+"""
+Parser benchmark cases. Each case fetches its recorded responses from the
+test tree once (served by requests_mock, so no network is involved) and
+returns the parse call to be timed.
+"""
+
+import json
+from pathlib import Path
+from typing import Callable, Sized
+
+import attr
+from requests_mock import ANY, Mocker
+
+from blockapi.utils.num import _raw_to_decimals, raw_to_decimals
+from blockapi.v2.api import BlockchairBitcoinApi, SolanaApi
+from blockapi.v2.api.debank import (
+    DebankBalanceParser,
+    DebankPortfolioParser,
+    DebankProtocolCache,
+    DebankProtocolParser,
+)
+from blockapi.v2.api.nft.magic_eden import MagicEdenSolanaApi
+from blockapi.v2.api.nft.opensea import OpenSeaApi
+from blockapi.v2.api.nft.simple_hash import SimpleHashBitcoinApi
+from blockapi.v2.api.nft.unisat import UnisatApi
+from blockapi.v2.base import ISleepProvider
+from blockapi.v2.models import Blockchain, BtcNftType
+
+DATA_DIR = Path(__file__).parent.parent / 'test' / 'v2' / 'api'
+
+BTC_ADDRESS = '35hK24tcLEWcgNA4JxpvbkNkoAcDGqQPsP'
+SOLANA_ADDRESS = '5PjMxaijeVVQtuEzxK2NxyJeWwUbpTsi2uXuZ653WoHu'
+ETHEREUM_ADDRESS = '0x539C92186f7C6CC4CbF443F26eF84C595baBBcA1'
+ORDINALS_ADDRESS = 'bc1p3rwga6xsfal6f5d085scecg8lu4gsjl8drk5e07uqzk3cg9dq43s734vje'
+MAGIC_EDEN_ADDRESS = 'FEeSRuEDk8ENZbpzXjn4uHPz3LQijbeKRzhqVr5zPSJ9'
+
+# parse call returning the parsed items
+ParseCall = Callable[[], Sized]
+
+
+@attr.s(auto_attribs=True, slots=True, frozen=True)
+class BenchCase:
+    name: str
+    setup: Callable[[], ParseCall]
+
+
+class NoSleepProvider(ISleepProvider):
+    def sleep(self, url: str, seconds: float) -> None:
+        pass
+
+
+def read_data(file_name: str) -> str:
+    return (DATA_DIR / file_name).read_text(encoding='utf-8')
+
+
+def debank_balances() -> ParseCall:
+    response = json.loads(read_data('debank/data/balance_response.json'))
+    parser = DebankBalanceParser(DebankProtocolCache())
+    return lambda: parser.parse(response)
+
+
+def debank_portfolio() -> ParseCall:
+    response = json.loads(read_data('debank/data/complex_portfolio_response.json'))
+    parser = DebankPortfolioParser(
+        DebankProtocolParser(), DebankBalanceParser(DebankProtocolCache())
+    )
+    return lambda: parser.parse(response)
+
+
+def _raw_amounts() -> list[tuple[int, int]]:
+    response = json.loads(read_data('debank/data/balance_response.json'))
+    return [(int(i['raw_amount_hex_str'], 16), i['decimals']) for i in response]
+
+
+def raw_amounts() -> ParseCall:
+    amounts = _raw_amounts()
+    return lambda: [raw_to_decimals(raw, decimals) for raw, decimals in amounts]
+
+
+def raw_amounts_generic() -> ParseCall:
+    """Conversion through Decimal arithmetics only, for comparison."""
+    amounts = _raw_amounts()
+    return lambda: [_raw_to_decimals(raw, decimals) for raw, decimals in amounts]
+
+
+def solana_balances() -> ParseCall:
+    responses = iter(
+        [
+            '{"jsonrpc":"2.0","result":{"context":{"slot":1},"value":1500000000},"id":1}',
+            read_data('data/solana/token_accounts_response.json'),
+            '{"jsonrpc":"2.0","result":{"context":{"slot":1},"value":[]},"id":1}',
+            read_data('data/solana/das_get_asset_batch_response.json'),
+            read_data('data/solana/staked_solana_response.json'),
+        ]
+    )
+    api = SolanaApi(sleep_provider=NoSleepProvider())
+    with Mocker() as mocker:
+        mocker.post(ANY, text=lambda request, context: next(responses))
+        fetch_result = api.fetch_balances(SOLANA_ADDRESS)
+
+    return lambda: api.parse_balances(fetch_result).data
+
+
+def blockchair_transactions() -> ParseCall:
+    response = json.loads(read_data('data/blockchair_btc_transaction_response.json'))
+    api = BlockchairBitcoinApi()
+    return lambda: list(api._parse_transactions(BTC_ADDRESS, response['data']))
+
+
+def opensea_nfts() -> ParseCall:
+    api = OpenSeaApi('bench-key', Blockchain.ETHEREUM, NoSleepProvider())
+    url = (
+        f'https://api.opensea.io/api/v2/chain/ethereum/account/{ETHEREUM_ADDRESS}/nfts'
+    )
+    with Mocker() as mocker:
+        mocker.get(url, text=read_data('data/opensea/nfts.json'))
+        mocker.get(
+            f'{url}?next=LXBrPTE0MDMyMTEyOTU=',
+            text=read_data('data/opensea/nfts-next.json'),
+        )
+        fetch_result = api.fetch_nfts(ETHEREUM_ADDRESS)
+
+    return lambda: api.parse_nfts(fetch_result).data
+
+
+def opensea_listings() -> ParseCall:
+    api = OpenSeaApi('bench-key', Blockchain.ETHEREUM, NoSleepProvider())
+    with Mocker() as mocker:
+        mocker.get(ANY, text=read_data('data/opensea/listings.json'))
+        fetch_result = api.fetch_listings('ever-fragments-of-civitas')
+
+    return lambda: api.parse_listings(fetch_result).data
+
+
+def simple_hash_nfts() -> ParseCall:
+    api = SimpleHashBitcoinApi('bench-key', NoSleepProvider())
+    with Mocker() as mocker:
+        mocker.get(
+            'https://api.simplehash.com/api/v0/nfts/owners',
+            text=read_data('data/simplehash/nfts.json'),
+        )
+        mocker.get('https://api.simplehash.com/api/v0/fungibles/balances', text='[]')
+        fetch_result = api.fetch_nfts(ORDINALS_ADDRESS)
+
+    return lambda: api.parse_nfts(fetch_result).data
+
+
+def unisat_listings() -> ParseCall:
+    api = UnisatApi(api_key='bench-key', sleep_provider=NoSleepProvider())
+    with Mocker() as mocker:
+        mocker.post(
+            f'{api.api_options.base_url}v3/market/collection/auction/list',
+            text=read_data('data/unisat/listings.json'),
+        )
+        fetch_result = api.fetch_listings(BtcNftType.COLLECTION)
+
+    return lambda: api.parse_listings(fetch_result).data
+
+
+def magic_eden_nfts() -> ParseCall:
+    api = MagicEdenSolanaApi(NoSleepProvider())
+    with Mocker() as mocker:
+        mocker.get(
+            f'https://api-mainnet.magiceden.dev/v2/wallets/{MAGIC_EDEN_ADDRESS}/tokens',
+            text=read_data('data/magiceden/wallet-response.json'),
+        )
+        fetch_result = api.fetch_nfts(MAGIC_EDEN_ADDRESS)
+
+    return lambda: api.parse_nfts(fetch_result).data
+
+
+def magic_eden_listings() -> ParseCall:
+    api = MagicEdenSolanaApi(NoSleepProvider())
+    with Mocker() as mocker:
+        mocker.get(ANY, text=read_data('data/magiceden/listings.json'))
+        fetch_result = api.fetch_listings('magicticket')
+
+    return lambda: api.parse_listings(fetch_result).data
+
+
+CASES = [
+    BenchCase('debank_balances', debank_balances),
+    BenchCase('debank_portfolio', debank_portfolio),
+    BenchCase('solana_balances', solana_balances),
+    BenchCase('raw_amounts', raw_amounts),
+    BenchCase('raw_amounts_generic', raw_amounts_generic),
+    BenchCase('blockchair_transactions', blockchair_transactions),
+    BenchCase('opensea_nfts', opensea_nfts),
+    BenchCase('opensea_listings', opensea_listings),
+    BenchCase('simple_hash_nfts', simple_hash_nfts),
+    BenchCase('unisat_listings', unisat_listings),
+    BenchCase('magic_eden_nfts', magic_eden_nfts),
+    BenchCase('magic_eden_listings', magic_eden_listings),
+]
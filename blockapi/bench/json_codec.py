@@ -0,0 +1,77 @@
+"""
+Decode / encode time of the JSON codecs on the recorded API responses in
+the test tree (encoding is the standard library's for every codec):
+
+    python -m blockapi.bench.json_codec [--repeat N]
+"""
+
+import argparse
+import time
+from pathlib import Path
+from typing import Iterable, Optional
+
+from blockapi.utils.json import CODECS, JsonCodec, create_codec
+
+FIXTURES_DIR = Path(__file__).parent.parent / 'test'
+
+
+def load_fixtures(root: Path = FIXTURES_DIR) -> list[bytes]:
+    return [path.read_bytes() for path in sorted(root.rglob('*.json'))]
+
+
+def available_codecs() -> list[JsonCodec]:
+    codecs = []
+    for name in CODECS:
+        try:
+            codecs.append(create_codec(name))
+        except ImportError:
+            continue
+
+    return codecs
+
+
+def measure(codec: JsonCodec, documents: Iterable[bytes], repeat: int) -> dict:
+    documents = list(documents)
+    decoded = [codec.loads(d) for d in documents]
+    size = sum(len(d) for d in documents)
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for document in documents:
+            codec.loads(document)
+    decode = (time.perf_counter() - started) / repeat
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for obj in decoded:
+            codec.dumps(obj, default=str)
+    encode = (time.perf_counter() - started) / repeat
+
+    return dict(
+        codec=codec.name,
+        documents=len(documents),
+        bytes=size,
+        decode_ms=decode * 1000,
+        encode_ms=encode * 1000,
+        decode_mb_s=size / decode / 1e6,
+    )
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args(argv)
+
+    documents = load_fixtures()
+    print(f'{len(documents)} documents, {sum(map(len, documents))} bytes')
+    print(f'{"codec":<8} {"decode ms":>10} {"encode ms":>10} {"decode MB/s":>12}')
+    for codec in available_codecs():
+        r = measure(codec, documents, args.repeat)
+        print(
+            f'{r["codec"]:<8} {r["decode_ms"]:>10.2f} {r["encode_ms"]:>10.2f}'
+            f' {r["decode_mb_s"]:>12.1f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,184 @@
+"""
+Throughput and allocations of the fetch-free parse paths, on the recorded
+responses in the test tree:
+
+    python -m blockapi.bench [--case NAME] [--save-baseline] [--tolerance 0.3]
+
+Results are compared with the stored baseline; the run fails if a case got
+slower (items/s) or allocates more (blocks retained per item) than the
+tolerance allows. Timings depend on the machine, so refresh the baseline
+with `--save-baseline` when moving to a different one.
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import logging
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Iterable, Optional
+
+import attr
+
+from blockapi.bench.cases import CASES, BenchCase
+
+BASELINE_PATH = Path(__file__).parent / 'baseline.json'
+
+
+@attr.s(auto_attribs=True, slots=True, frozen=True)
+class BenchResult:
+    name: str
+    items: int
+    items_per_sec: float
+    allocs_per_item: float
+    peak_bytes_per_item: float
+
+    def to_dict(self) -> dict:
+        return attr.asdict(self)
+
+
+def run_case(case: BenchCase, min_time: float = 0.2, rounds: int = 5) -> BenchResult:
+    """
+    Best of `rounds` timings, each running the parse call for at least
+    `min_time` seconds; allocations are measured on a separate call.
+    """
+    # some fetches print, keep the report clean
+    with contextlib.redirect_stdout(io.StringIO()):
+        parse = case.setup()
+
+    items = len(parse())
+    if not items:
+        raise ValueError(f'Case {case.name!r} parsed no items')
+
+    best = float('inf')
+    for _ in range(rounds):
+        calls = 0
+        started = time.perf_counter()
+        while True:
+            parse()
+            calls += 1
+            elapsed = time.perf_counter() - started
+            if elapsed >= min_time:
+                break
+
+        best = min(best, elapsed / calls)
+
+    allocs, peak = _measure_allocations(parse)
+    return BenchResult(
+        name=case.name,
+        items=items,
+        items_per_sec=items / best,
+        allocs_per_item=allocs / items,
+        peak_bytes_per_item=peak / items,
+    )
+
+
+def _measure_allocations(parse) -> tuple[int, int]:
+    """
+    Memory blocks retained by the parsed items, and traced peak in bytes.
+    """
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    tracemalloc.start()
+    try:
+        result = parse()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    gc.collect()
+    allocs = sys.getallocatedblocks() - blocks
+    del result
+    return max(allocs, 0), peak
+
+
+def compare(
+    results: Iterable[BenchResult], baseline: dict, tolerance: float
+) -> list[str]:
+    """
+    Regressions against the baseline, as human readable messages.
+    """
+    regressions = []
+    for result in results:
+        if (expected := baseline.get(result.name)) is None:
+            continue
+
+        min_speed = expected['items_per_sec'] * (1 - tolerance)
+        if result.items_per_sec < min_speed:
+            regressions.append(
+                f'{result.name}: {result.items_per_sec:.0f} items/s, '
+                f'baseline {expected["items_per_sec"]:.0f}'
+            )
+
+        max_allocs = expected['allocs_per_item'] * (1 + tolerance)
+        if result.allocs_per_item > max_allocs:
+            regressions.append(
+                f'{result.name}: {result.allocs_per_item:.1f} allocs/item, '
+                f'baseline {expected["allocs_per_item"]:.1f}'
+            )
+
+    return regressions
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> dict:
+    if not path.exists():
+        return {}
+
+    return json.loads(path.read_text())
+
+
+def save_baseline(results: Iterable[BenchResult], path: Path = BASELINE_PATH) -> None:
+    """
+    Store results, keeping the baseline of cases that weren't run.
+    """
+    data = load_baseline(path)
+    data.update({r.name: r.to_dict() for r in results})
+    path.write_text(json.dumps(data, indent=2, sort_keys=True) + '\n')
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--case', action='append', help='run only given case(s)')
+    parser.add_argument('--min-time', type=float, default=0.2)
+    parser.add_argument('--tolerance', type=float, default=0.3)
+    parser.add_argument('--baseline', type=Path, default=BASELINE_PATH)
+    parser.add_argument('--save-baseline', action='store_true')
+    args = parser.parse_args(argv)
+
+    cases = [c for c in CASES if not args.case or c.name in args.case]
+    if not cases:
+        parser.error(f'unknown case(s): {", ".join(args.case)}')
+
+    logging.disable(logging.CRITICAL)
+    try:
+        results = []
+        print(
+            f'{"case":<24} {"items":>6} {"items/s":>10} {"allocs/item":>12}'
+            f' {"peak B/item":>12}'
+        )
+        for case in cases:
+            r = run_case(case, min_time=args.min_time)
+            results.append(r)
+            print(
+                f'{r.name:<24} {r.items:>6} {r.items_per_sec:>10.0f}'
+                f' {r.allocs_per_item:>12.1f} {r.peak_bytes_per_item:>12.0f}'
+            )
+    finally:
+        logging.disable(logging.NOTSET)
+
+    if args.save_baseline:
+        save_baseline(results, args.baseline)
+        print(f'Baseline saved to {args.baseline}')
+        return 0
+
+    regressions = compare(results, load_baseline(args.baseline), args.tolerance)
+    for message in regressions:
+        print(f'REGRESSION {message}')
+
+    return 1 if regressions else 0
@@ -1,11 +1,11 @@
 import inspect
 from abc import ABC, abstractmethod
 from datetime import datetime
-from time import sleep
 
 import requests
 
 import blockapi
+from blockapi.v2.rate_limiter import get_rate_limiter
 
 
 class Service(ABC):
@@ -56,9 +56,8 @@ class Service(ABC):
             response = reqobj.get(request_url, headers=headers)
 
         self.last_response = response
-        # Naive local time on purpose: only used to measure elapsed time against
-        # datetime.now() in wait_for_next_request (rate limiting), never compared
-        # with tz-aware datetimes.
+        # Kept for subclasses reading it, pacing is done by the shared rate
+        # limiter. Naive local time, as it always was.
         self.last_response_time = datetime.now()
 
         if response.status_code != 200:
@@ -67,23 +66,11 @@ class Service(ABC):
         return response.json()
 
     def wait_for_next_request(self):
-        if not self.last_response_time:
-            return
-
-        diff = (datetime.now() - self.last_response_time).total_seconds()
-        wait = self.rate_limit - diff
-
-        if wait > 0:
-            sleep(wait)
-
-        # use date from last response
-        # doesn't work very good, time on server can differ from local time
-        # if self.last_response.headers.get('Date'):
-        # last_resp_time = date_parse(self.last_response.headers.get('Date'))
-        # last_resp_time.replace(tzinfo=UTC)
-        # wait_until = last_resp_time + timedelta(seconds=self.rate_limit)
-        #
-        # now = datetime.utcnow().replace(tzinfo=UTC)
+        # Bucket is shared by all instances calling the same base_url, so
+        # pacing holds even though a new instance is created per address.
+        limiter = get_rate_limiter(self.base_url, self.rate_limit)
+        if limiter:
+            limiter.acquire()
 
     def process_error_response(self, response):
         if response.status_code == 500:
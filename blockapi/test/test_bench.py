@@ -0,0 +1,30 @@
+import pytest
+
+from blockapi.bench.cases import CASES
+from blockapi.bench.runner import BenchResult, compare, run_case
+
+
+@pytest.mark.parametrize('case', CASES, ids=lambda c: c.name)
+def test_run_case(case):
+    result = run_case(case, min_time=0.0, rounds=1)
+
+    assert result.items > 0
+    assert result.items_per_sec > 0
+    assert result.peak_bytes_per_item > 0
+
+
+def test_compare():
+    baseline = {
+        'fast': dict(items_per_sec=1000, allocs_per_item=10),
+        'slow': dict(items_per_sec=1000, allocs_per_item=10),
+    }
+    results = [
+        BenchResult('fast', 10, 900, 11, 100),
+        BenchResult('slow', 10, 500, 20, 100),
+        BenchResult('new', 10, 1, 100, 100),
+    ]
+
+    assert compare(results, baseline, tolerance=0.3) == [
+        'slow: 500 items/s, baseline 1000',
+        'slow: 20.0 allocs/item, baseline 10.0',
+    ]
@@ -0,0 +1,96 @@
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+from enum import Enum
+
+import pytest
+
+from blockapi.utils.json import (
+    CODECS,
+    DECIMAL_PARSE_ARGS,
+    STRING_PARSE_ARGS,
+    create_codec,
+    get_codec,
+    set_codec,
+)
+from blockapi.v2.models import FetchResult
+
+
+def _create(name):
+    try:
+        return create_codec(name)
+    except ImportError:
+        pytest.skip(f'{name} is not installed')
+
+
+@pytest.fixture(params=list(CODECS))
+def codec(request):
+    return _create(request.param)
+
+
+@pytest.mark.parametrize(
+    'document',
+    [
+        b'{"a": [1, 2.5, "x", null, true], "b": {"c": -3}}',
+        '{"name": "žluťoučký"}',
+        b'[115792089237316195423570985008687907853269984665640564039457584007913129639935]',
+        b'{"balance": -12345678901234567890, "decimals": 18}',
+        b'[NaN]',
+    ],
+)
+def test_loads_matches_stdlib(codec, document):
+    assert repr(codec.loads(document)) == repr(json.loads(document))
+
+
+def test_loads_invalid_document(codec):
+    with pytest.raises(ValueError):
+        codec.loads(b'{"a": ')
+
+
+def test_loads_decimal_parse_args(codec):
+    assert codec.loads(b'[1.10, 7]', **DECIMAL_PARSE_ARGS) == [Decimal('1.10'), 7]
+    assert codec.loads(b'[1.10, 7]', **STRING_PARSE_ARGS) == ['1.10', '7']
+
+
+def test_dumps_round_trip(codec):
+    obj = {'a': [1, 2**80, 'x'], 1: Decimal('1.5'), 'dt': datetime(2024, 1, 1)}
+
+    assert json.loads(codec.dumps(obj, default=str)) == {
+        'a': [1, 2**80, 'x'],
+        '1': '1.5',
+        'dt': '2024-01-01 00:00:00',
+    }
+
+
+class Color(Enum):
+    RED = 'red'
+
+
+def test_dumps_matches_stdlib(codec):
+    obj = {'a': [1, 2.5, float('nan'), None], 'color': Color.RED, 'x': 'ž'}
+
+    assert codec.dumps(obj, default=str) == json.dumps(obj, default=str)
+
+
+def test_set_codec():
+    previous = set_codec('json')
+    try:
+        assert get_codec().name == 'json'
+    finally:
+        set_codec(previous)
+
+    assert get_codec() is previous
+
+
+def test_fetch_result_json():
+    result = FetchResult(
+        status_code=200,
+        data={'amount': Decimal('1.5')},
+        time=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+
+    assert json.loads(result.json()) == {
+        'status_code': 200,
+        'data': {'amount': '1.5'},
+        'time': '2024-01-01 00:00:00+00:00',
+    }
@@ -1,7 +1,83 @@
-from decimal import Decimal
+from decimal import Decimal, localcontext
 
-from blockapi.utils.num import decimals_to_raw
+import pytest
+
+from blockapi.utils.num import (
+    _raw_to_decimals,
+    decimals_to_raw,
+    raw_to_decimals,
+    raw_to_decimals_many,
+    to_decimal,
+)
+
+RAW_AMOUNTS = [
+    (0, 18),
+    (1, 0),
+    (1500000000, 9),
+    (10**18, 18),
+    (123456789012345678, 18),
+    (-2500, 2),
+    ('5000000', 6),
+    ('0012', 1),
+    (10**28 - 1, 30),
+    (10**40 + 1, 18),
+    ('1.50', 2),
+    ('-7', 3),
+    (1.5, 2),
+    (True, 2),
+    (12345, '2'),
+    (5, -2),
+]
 
 
 def test_decimals_to_raw():
     assert decimals_to_raw("1.2", 2) == Decimal(120)
+
+
+@pytest.mark.parametrize(
+    'raw, decimals, expected',
+    [
+        (1500000000, 9, '1.5'),
+        (10**18, 18, '1'),
+        (0, 18, '0'),
+        (-2500, 2, '-25'),
+        ('5000000', 6, '5'),
+        (10**40 + 1, 18, '10000000000000000000000'),
+    ],
+)
+def test_raw_to_decimals(raw, decimals, expected):
+    assert str(raw_to_decimals(raw, decimals)) == expected
+
+
+@pytest.mark.parametrize('raw, decimals', RAW_AMOUNTS)
+def test_raw_to_decimals_same_as_decimal_arithmetics(raw, decimals):
+    assert (
+        raw_to_decimals(raw, decimals).as_tuple()
+        == _raw_to_decimals(raw, decimals).as_tuple()
+    )
+
+
+def test_raw_to_decimals_context_precision():
+    with localcontext() as context:
+        context.prec = 10
+        for raw in (123456789, 12345678901, 10**12 + 1):
+            assert (
+                raw_to_decimals(raw, 3).as_tuple()
+                == _raw_to_decimals(raw, 3).as_tuple()
+            )
+
+
+def test_raw_to_decimals_many():
+    raws = [raw for raw, _ in RAW_AMOUNTS]
+
+    for decimals in (0, 8, 18, '18'):
+        assert [d.as_tuple() for d in raw_to_decimals_many(raws, decimals)] == [
+            _raw_to_decimals(raw, decimals).as_tuple() for raw in raws
+        ]
+
+
+def test_to_decimal():
+    assert str(to_decimal(1.01)) == '1.01'
+    assert to_decimal(True) == Decimal(1)
+    with pytest.raises(TypeError):
+        to_decimal(None)
@@ -1,9 +1,12 @@
 import json
 import os
 from typing import Union
+from unittest.mock import patch
 
 import pytest
 
+from blockapi.v2.rate_limiter import reset_rate_limiters
+
 
 def read_json_file(file_name: str) -> Union[list, dict]:
     json_path = os.path.abspath(os.path.join(os.path.dirname(__file__), file_name))
@@ -22,3 +25,12 @@ def vcr_config():
     return {
         'decode_compressed_response': True,
     }
+
+
+@pytest.fixture(autouse=True)
+def rate_limiters():
+    # fresh per-host buckets for every test, waits without sleep provider
+    # don't really sleep
+    reset_rate_limiters()
+    with patch('blockapi.v2.base.time.sleep'):
+        yield
@@ -18,6 +18,12 @@ from blockapi.v2.coins import COIN_ETH
 from blockapi.v2.models import BalanceItem, Blockchain, Pool, PoolInfo, Protocol
 
 
+@pytest.fixture(autouse=True)
+def _clear_coin_table():
+    yield
+    DebankBalanceParser.default_coin_table.clear()
+
+
 @pytest.fixture()
 def real_debank_api():
     key = os.environ.get('DEBANK_API_KEY')
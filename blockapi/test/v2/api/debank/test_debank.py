@@ -1,4 +1,8 @@
+import asyncio
 from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
 
 from blockapi.utils.address import make_checksum_address
 from blockapi.v2.api import DebankApi
@@ -307,6 +311,41 @@ def test_get_portfolio_fetches_protocols(
     assert parsed_items[0].items[0].protocol.name == "YFLink"
 
 
+def test_iter_portfolio_matches_get_portfolio(
+    debank_api, yflink_protocol_response_raw, portfolio_response_raw, requests_mock
+):
+    requests_mock.get(
+        "https://pro-openapi.debank.com/v1/protocol/all_list",
+        text=yflink_protocol_response_raw,
+    )
+    requests_mock.get(
+        "https://pro-openapi.debank.com/v1/user/all_complex_protocol_list?id=0xca8fa8f0b631ecdb18cda619c4fc9d197c8affca",
+        text=portfolio_response_raw,
+    )
+    debank_api.stream_chunk_size = 100
+
+    streamed = list(
+        debank_api.iter_portfolio("0xca8fa8f0b631ecdb18cda619c4fc9d197c8affca")
+    )
+
+    assert streamed == debank_api.get_portfolio(
+        "0xca8fa8f0b631ecdb18cda619c4fc9d197c8affca"
+    )
+
+
+def test_iter_portfolio_error_response(debank_api, protocol_cache, requests_mock):
+    requests_mock.get(
+        "https://pro-openapi.debank.com/v1/user/all_complex_protocol_list?id=0xca8fa8f0b631ecdb18cda619c4fc9d197c8affca",
+        text='{"message": "rate limited"}',
+    )
+    protocol_cache.update({})
+
+    assert (
+        list(debank_api.iter_portfolio("0xca8fa8f0b631ecdb18cda619c4fc9d197c8affca"))
+        == []
+    )
+
+
 def test_protocol_cache_is_shared_by_instances():
     one = DebankApi('dummy-key', True)
     two = DebankApi('dummy-key', True)
@@ -326,3 +365,79 @@ def test_get_usage(debank_api, debank_usage_response_raw, requests_mock):
     )
     usage = debank_api.get_usage()
     assert usage.balance == Decimal('351014')
+
+
+@pytest.fixture
+def token_list_by_chain(balances_response, requests_mock):
+    address = '0xca8fa8f0b631ecdb18cda619c4fc9d197c8affca'
+    requests_mock.get(
+        f'https://pro-openapi.debank.com/v1/user/used_chain_list?id={address}',
+        json=[{'id': c} for c in ('eth', 'bsc', 'matic', 'ftm', 'unknown-chain')],
+    )
+    for chain in ('eth', 'bsc', 'matic'):
+        requests_mock.get(
+            'https://pro-openapi.debank.com/v1/user/token_list'
+            f'?id={address}&chain_id={chain}&is_all=True',
+            json=[b for b in balances_response if b['chain'] == chain],
+        )
+    requests_mock.get(
+        'https://pro-openapi.debank.com/v1/user/token_list'
+        f'?id={address}&chain_id=ftm&is_all=True',
+        text='{"message": "rate limited"}',
+    )
+    return address
+
+
+def test_fetch_balances_by_chain(protocol_cache, token_list_by_chain, requests_mock):
+    protocol_cache.update({})
+    api = DebankApi('dummy-key', True, protocol_cache, balances_by_chain=True)
+
+    parsed = api.parse_balances(api.fetch_balances(token_list_by_chain))
+
+    assert sorted(b.raw['chain'] for b in parsed.data) == sorted(
+        ['eth'] * 18 + ['bsc'] * 5 + ['matic'] * 3
+    )
+    assert parsed.errors == [
+        {'chain': 'ftm', 'error': {'error': None, 'message': 'rate limited'}}
+    ]
+    # unknown chain isn't fetched
+    assert requests_mock.call_count == 5
+
+
+def test_get_balance_by_chain_keeps_other_chains(
+    protocol_cache, token_list_by_chain, requests_mock
+):
+    protocol_cache.update({})
+    requests_mock.get(
+        'https://pro-openapi.debank.com/v1/user/token_list'
+        f'?id={token_list_by_chain}&chain_id=bsc&is_all=True',
+        status_code=500,
+    )
+    api = DebankApi('dummy-key', True, protocol_cache, balances_by_chain=True)
+
+    balances = api.get_balance(token_list_by_chain)
+    assert sorted(b.raw['chain'] for b in balances) == sorted(
+        ['eth'] * 18 + ['matic'] * 3
+    )
+
+    parsed = api.get_balances([token_list_by_chain])[token_list_by_chain]
+    assert len(parsed.data) == 18 + 3
+    assert [e['chain'] for e in parsed.errors] == ['bsc', 'ftm']
+
+
+def test_fetch_balances_by_chain_async(protocol_cache, balances_response):
+    protocol_cache.update({})
+    api = DebankApi('dummy-key', True, protocol_cache, balances_by_chain=True)
+
+    async def get_data_async(request_method, **kwargs):
+        if request_method == 'get_used_chains':
+            return FetchResult(data=[{'id': 'eth'}, {'id': 'bsc'}])
+
+        chain = kwargs['chain_id']
+        return FetchResult(data=[b for b in balances_response if b['chain'] == chain])
+
+    with patch.object(api, 'get_data_async', side_effect=get_data_async):
+        fetched = asyncio.run(api.fetch_balances_async('0xca8f'))
+
+    assert len(api.parse_balances(fetched).data) == 18 + 5
+    assert fetched.errors is None
@@ -4,7 +4,11 @@ from decimal import Decimal
 
 import pytest
 
-from blockapi.v2.api.debank import DebankModelBalanceItem
+from blockapi.v2.api.debank import (
+    DebankBalanceParser,
+    DebankModelBalanceItem,
+    DebankProtocolCache,
+)
 from blockapi.v2.coins import (
     COIN_ASTR,
     COIN_AURORA,
@@ -244,3 +248,40 @@ def test_skip_balance_with_unknown_chain(balance_parser):
 
     item = balance_parser.parse_item(balance)
     assert not item
+
+
+def test_parse_reuses_coins(balance_parser, balances_response):
+    first = balance_parser.parse(balances_response)
+    second = balance_parser.parse(balances_response)
+
+    assert first == second
+    assert all(a.coin is b.coin for a, b in zip(first, second))
+
+
+def test_parse_validates_new_schema(balance_parser, balances_response):
+    balance_parser.parse(balances_response)
+    item = {k: v for k, v in balances_response[0].items() if k != 'amount'}
+
+    with pytest.raises(ValueError):
+        balance_parser.parse([item])
+
+
+@pytest.mark.parametrize('change', [{'name': None}, {'decimals': 18.7}])
+def test_parse_validates_items_regardless_of_order(
+    balance_parser, balances_response, change
+):
+    item = {**balances_response[0], **change}
+
+    with pytest.raises(ValueError):
+        balance_parser.parse([item])
+
+    balance_parser.parse([balances_response[0]])
+    with pytest.raises(ValueError):
+        balance_parser.parse([item])
+
+
+def test_validated_schemas_are_per_parser(balances_response):
+    parser = DebankBalanceParser(DebankProtocolCache())
+    parser.parse(balances_response)
+
+    assert DebankBalanceParser(DebankProtocolCache())._validated_schemas == set()
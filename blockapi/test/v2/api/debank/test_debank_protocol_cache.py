@@ -1,3 +1,12 @@
+import asyncio
+import os
+import threading
+import time
+from unittest.mock import Mock
+
+from blockapi.v2.api.debank import DebankProtocolCache
+
+
 def test_protocol_cache_has_timeout(protocol_cache):
     assert protocol_cache._timeout == 3600
 
@@ -18,3 +27,81 @@ def test_cache_update_items(protocol_cache, yflink_cache_data, protocol_yflink):
 def test_cache_updating_items_changes_timeout(protocol_cache, yflink_cache_data):
     protocol_cache.update(yflink_cache_data)
     assert protocol_cache.needs_update() is False
+
+
+def test_refresh_loads_empty_cache_inline(yflink_cache_data):
+    cache = DebankProtocolCache(refresh_ahead=600)
+
+    cache.refresh(lambda: yflink_cache_data)
+
+    assert cache._refresh_thread is None
+    assert cache.needs_update() is False
+
+
+def test_refresh_ahead_serves_stale_data(protocol_yflink, protocol_trader_joe):
+    cache = DebankProtocolCache(timeout=300, refresh_ahead=600)
+    cache.update({'yflink': protocol_yflink})
+    started, release = threading.Event(), threading.Event()
+
+    def load():
+        started.set()
+        release.wait(5)
+        return {'trader_joe': protocol_trader_joe}
+
+    cache.refresh(load)
+    started.wait(5)
+    # refreshing already, current protocols are served meanwhile
+    cache.refresh(load)
+    assert cache.get('yflink') is protocol_yflink
+
+    release.set()
+    cache._refresh_thread.join(5)
+    assert cache.get('trader_joe') is protocol_trader_joe
+    assert cache.get('yflink') is None
+
+
+def test_failed_refresh_keeps_data(protocol_yflink):
+    cache = DebankProtocolCache(refresh_ahead=600)
+    cache.update({'yflink': protocol_yflink})
+    cache.invalidate()
+
+    cache.refresh(dict)
+    cache._refresh_thread.join(5)
+
+    assert cache.get('yflink') is protocol_yflink
+    assert cache.needs_refresh() is False
+
+
+def test_refresh_async(protocol_yflink, protocol_trader_joe):
+    cache = DebankProtocolCache(refresh_ahead=600)
+    cache.update({'yflink': protocol_yflink})
+    cache.invalidate()
+
+    async def load():
+        return {'trader_joe': protocol_trader_joe}
+
+    async def run():
+        await cache.refresh_async(load)
+        assert cache.get('yflink') is protocol_yflink
+        await cache._refresh_task
+
+    asyncio.run(run())
+    assert cache.get('trader_joe') is protocol_trader_joe
+
+
+def test_snapshot_is_shared(tmp_path, yflink_cache_data, protocol_trader_joe):
+    path = tmp_path / 'protocols.json'
+    cache = DebankProtocolCache(snapshot_path=path)
+    cache.update(yflink_cache_data)
+
+    other = DebankProtocolCache(snapshot_path=path)
+    assert other.get('yflink') == yflink_cache_data['yflink']
+    assert other.needs_update() is False
+
+    # refreshed by the other process
+    other.update({protocol_trader_joe.protocol_id: protocol_trader_joe})
+    os.utime(path, (time.time() + 1, time.time() + 1))
+    cache.invalidate()
+    cache.refresh(Mock(side_effect=AssertionError('not downloaded')))
+
+    assert cache.get(protocol_trader_joe.protocol_id) == protocol_trader_joe
@@ -0,0 +1,111 @@
+import pytest
+
+from blockapi.v2.api import DebankApi
+from blockapi.v2.api.debank_scheduler import DebankScheduler
+
+BASE_URL = 'https://pro-openapi.debank.com/v1'
+WALLETS = ['0xaaa', '0xbbb', '0xccc']
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def usage(requests_mock):
+    usage = {'balance': 1000, 'stats': []}
+    requests_mock.get(f'{BASE_URL}/account/units', json=lambda r, c: usage)
+    return usage
+
+
+@pytest.fixture
+def scheduler(protocol_cache, requests_mock, balances_response, usage, clock):
+    protocol_cache.update({})
+    for address in WALLETS:
+        requests_mock.get(
+            f'{BASE_URL}/user/all_token_list?id={address}&is_all=True',
+            json=balances_response if address == '0xccc' else [],
+        )
+
+    api = DebankApi('dummy-key', True, protocol_cache)
+    scheduler = DebankScheduler(
+        api, reserve=10, low_budget=100, throttled_share=0.5, clock=clock
+    )
+    for address in WALLETS:
+        scheduler.add_wallet(address, min_interval=60)
+
+    return scheduler
+
+
+def test_run_once_refreshes_due_wallets(scheduler, clock):
+    assert set(scheduler.run_once()) == set(WALLETS)
+    assert scheduler.due_wallets() == []
+
+    clock.now += 60
+    # valued by the refreshed balances
+    assert scheduler.due_wallets()[0] == '0xccc'
+
+
+def test_failed_refresh_keeps_wallet_state(scheduler, requests_mock, clock):
+    scheduler.run_once()
+    clock.now += 60
+    requests_mock.get(
+        f'{BASE_URL}/user/all_token_list?id=0xccc&is_all=True', status_code=500
+    )
+
+    assert scheduler.refresh('0xccc').errors
+    wallet = {c.address: c for c in scheduler.report()}['0xccc']
+    assert wallet.value_usd > 0
+    # still due and first, not marked refreshed by the failure
+    assert scheduler.due_wallets()[0] == '0xccc'
+
+
+def test_priority_by_value_and_staleness(scheduler, clock):
+    scheduler.run_once()
+    scheduler.add_wallet('0xaaa', value_usd=10)
+    scheduler.add_wallet('0xbbb', value_usd=0)
+    clock.now += 100
+    scheduler.refresh('0xccc')
+    scheduler.add_wallet('0xccc', value_usd=5)
+    clock.now += 100
+
+    # 10 * 200s, 5 * 100s, 1 * 200s
+    assert scheduler.due_wallets() == ['0xaaa', '0xccc', '0xbbb']
+
+
+def test_run_once_throttles_on_low_budget(scheduler, usage, clock):
+    usage['balance'] = 12
+    # 2 units above reserve, half of them spent while throttled
+    assert list(scheduler.run_once()) == [WALLETS[0]]
+
+    usage['balance'] = 10
+    clock.now += 300
+    assert scheduler.run_once() == {}
+
+
+def test_report_and_calibration(scheduler, usage, clock):
+    scheduler.run_once()
+    clock.now += 300
+    # three requests cost six units
+    usage['balance'] = 994
+
+    assert scheduler.remaining_units() == 994
+    assert scheduler.unit_scale == 2
+    assert scheduler.tracker.calls == {'get_balance': 3}
+    report = scheduler.report()
+    assert [c.units_per_refresh for c in report] == [2, 2, 2]
+    assert report[0].refreshes == 1
+
+
+def test_scheduler_observes_its_api_only(scheduler):
+    assert scheduler.tracker in scheduler.api.observers
+    assert scheduler.tracker not in DebankApi.observers
@@ -1,11 +1,22 @@
+import asyncio
+import base64
+import itertools
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
+import base58
 import pytest
+from requests import Response
 from requests_mock import ANY, Mocker
 
 from blockapi.test.v2.api.conftest import read_file
 from blockapi.v2.api import SolanaApi, SolscanApi
+from blockapi.v2.api.solana import DasAssetCache, SqliteDasAssetCache, StakeAccountCache
+from blockapi.v2.base import ApiException, InvalidAddressException
 from blockapi.v2.models import (
     AssetType,
     BalanceItem,
@@ -14,13 +25,18 @@ from blockapi.v2.models import (
     CoinContract,
     CoinInfo,
 )
+from blockapi.v2.single_flight import get_single_flight
 
 
 @pytest.fixture(autouse=True)
 def _reset_caches():
     SolanaApi._das_cache = {}
+    SolanaApi._stake_accounts.clear()
+    SolanaApi._token_account_states.clear()
     yield
     SolanaApi._das_cache = {}
+    SolanaApi._stake_accounts.clear()
+    SolanaApi._token_account_states.clear()
 
 
 def test_merge_balances_with_different_coins(solana_api, balances_with_different_coins):
@@ -69,6 +85,17 @@ def test_use_custom_url():
     assert api.api_options.base_url == 'https://api.mainnet-beta.solana.com/'
 
 
+def test_rate_limit_is_used_by_each_client():
+    default = SolanaApi()
+    paced = SolanaApi(rate_limit=0.5)
+    dedicated = SolanaApi(rate_limit=0.01)
+
+    assert default.rate_limiter is None
+    assert dedicated.rate_limiter is not paced.rate_limiter
+    assert dedicated.rate_limiter.rate == pytest.approx(100)
+    assert paced.rate_limiter.rate == pytest.approx(2)
+
+
 def test_use_base_url():
     api = SolanaApi()
     assert api.base_url == 'https://api.mainnet-beta.solana.com/'
@@ -252,6 +279,246 @@ def test_das_cache_stores_sentinel_for_unknown_mint():
     assert api._das_cache[unknown_mint] == {}
 
 
+def test_fetch_balances_async(
+    sol_balance_response,
+    token_accounts_response,
+    das_asset_batch_response,
+    staked_solana_response,
+):
+    test_addr = '5PjMxaijeVVQtuEzxK2NxyJeWwUbpTsi2uXuZ653WoHu'
+    empty_token_accounts = {'result': {'value': []}}
+
+    async def request(method, params):
+        if method == 'getBalance':
+            return json.loads(sol_balance_response)
+        if method == 'getTokenAccountsByOwner':
+            if params[1]['programId'] == SolanaApi.TOKEN_PROGRAM_ID:
+                return json.loads(token_accounts_response)
+            return empty_token_accounts
+        if method == 'getAssetBatch':
+            return json.loads(das_asset_batch_response)
+        if method == 'getProgramAccounts':
+            return json.loads(staked_solana_response)
+
+    api = SolanaApi()
+    with patch.object(api, '_request_async', side_effect=request):
+        balances = asyncio.run(api.get_balance_async(test_addr))
+
+    assert {b.asset_type for b in balances} == {
+        AssetType.AVAILABLE,
+        AssetType.STAKED,
+        AssetType.LOCKED,
+    }
+    assert api._das_cache
+
+
+@pytest.fixture
+def rpc_handler(
+    sol_balance_response,
+    token_accounts_response,
+    das_asset_batch_response,
+    staked_solana_response,
+):
+    invalid_addr = 'invalid'
+
+    def handle(call: dict) -> dict:
+        method, params = call['method'], call['params']
+        if isinstance(params, list) and params[0] == invalid_addr:
+            response = {'error': {'code': -32602, 'message': 'Invalid param'}}
+        elif method == 'getBalance':
+            response = json.loads(sol_balance_response)
+        elif method == 'getTokenAccountsByOwner':
+            if params[1]['programId'] == SolanaApi.TOKEN_PROGRAM_ID:
+                response = json.loads(token_accounts_response)
+            else:
+                response = {'result': {'value': []}}
+            if params[2]['encoding'] == 'base64':
+                response = _binary_token_accounts(response)
+        elif method == 'getMultipleAccounts' and 'dataSlice' in params[1]:
+            response = _mint_decimals_response(token_accounts_response, params[0])
+        elif method == 'getAssetBatch':
+            response = json.loads(das_asset_batch_response)
+        else:
+            response = json.loads(staked_solana_response)
+
+        return {**response, 'jsonrpc': '2.0', 'id': call['id']}
+
+    def respond(request, context):
+        body = request.json()
+        if isinstance(body, list):
+            # batch responses may come in any order
+            return [handle(call) for call in reversed(body)]
+
+        return handle(body)
+
+    return respond
+
+
+def _binary_token_accounts(response: dict) -> dict:
+    """Encode jsonParsed token accounts like a base64 response would."""
+    accounts = []
+    for account in response['result']['value']:
+        info = account['account']['data']['parsed']['info']
+        data = (
+            base58.b58decode(info['mint'])
+            + base58.b58decode(info['owner'])
+            + int(info['tokenAmount']['amount']).to_bytes(8, 'little')
+            + bytes(93)
+        )
+        accounts.append(
+            {
+                'pubkey': account['pubkey'],
+                'account': {
+                    **account['account'],
+                    'data': [base64.b64encode(data).decode(), 'base64'],
+                },
+            }
+        )
+
+    return {'result': {'value': accounts}}
+
+
+def _mint_decimals_response(token_accounts_response: str, mints: list[str]) -> dict:
+    decimals = {
+        info['mint']: info['tokenAmount']['decimals']
+        for account in json.loads(token_accounts_response)['result']['value']
+        if (info := account['account']['data']['parsed']['info'])
+    }
+    return {
+        'result': {
+            'value': [
+                {'data': [base64.b64encode(bytes([decimals[m]])).decode(), 'base64']}
+                for m in mints
+            ]
+        }
+    }
+
+
+@pytest.mark.parametrize('das_known', [True, False])
+def test_binary_token_accounts(
+    requests_mock, rpc_handler, token_accounts_response, das_known
+):
+    test_addr = '5PjMxaijeVVQtuEzxK2NxyJeWwUbpTsi2uXuZ653WoHu'
+    requests_mock.post(ANY, json=rpc_handler)
+    if not das_known:
+        # unknown to DAS, decimals come from the mint accounts
+        SolanaApi._das_cache = {
+            account['account']['data']['parsed']['info']['mint']: {}
+            for account in json.loads(token_accounts_response)['result']['value']
+        }
+
+    balances = SolanaApi(include_nfts=True).get_balance(test_addr)
+    binary = SolanaApi(include_nfts=True, binary_token_accounts=True).get_balance(
+        test_addr
+    )
+
+    assert [(b.coin, b.balance, b.asset_type) for b in binary] == [
+        (b.coin, b.balance, b.asset_type) for b in balances
+    ]
+    decimals_requests = [
+        r.json()
+        for r in requests_mock.request_history
+        if r.json()['method'] == 'getMultipleAccounts'
+    ]
+    assert len(decimals_requests) == (0 if das_known else 1)
+
+
+def test_fetch_balances_batched(requests_mock, rpc_handler):
+    test_addr = '5PjMxaijeVVQtuEzxK2NxyJeWwUbpTsi2uXuZ653WoHu'
+    requests_mock.post(ANY, json=rpc_handler)
+
+    balances = SolanaApi().get_balance(test_addr)
+    batched = SolanaApi(batch_requests=True).get_balance(test_addr)
+
+    # raw responses differ in request ids only
+    assert [(b.coin, b.balance_raw, b.asset_type) for b in batched] == [
+        (b.coin, b.balance_raw, b.asset_type) for b in balances
+    ]
+    # 5 sequential calls, then one batch (DAS metadata is cached already)
+    assert requests_mock.call_count == 5 + 1
+    assert len(requests_mock.request_history[5].json()) == 4
+
+
+def test_fetch_balances_batched_invalid_address(requests_mock, rpc_handler):
+    requests_mock.post(ANY, json=rpc_handler)
+
+    with pytest.raises(InvalidAddressException):
+        SolanaApi(batch_requests=True).fetch_balances('invalid')
+
+
+def test_fetch_balances_many(requests_mock, rpc_handler):
+    addresses = ['5PjMxaijeVVQtuEzxK2NxyJeWwUbpTsi2uXuZ653WoHu', 'invalid']
+    requests_mock.post(ANY, json=rpc_handler)
+
+    api = SolanaApi()
+    api.RPC_BATCH_SIZE = 3
+    results = api.fetch_balances_many(addresses)
+
+    assert list(results) == addresses
+    assert len(api.parse_balances(results[addresses[0]]).data) == 12
+    # stake lookup filters by the address, isn't rejected
+    assert results['invalid'].errors == ['Invalid param'] * 3
+    assert api.parse_balances(results['invalid']).errors == ['Invalid param'] * 3
+    # 8 calls in batches of 3, DAS call
+    assert requests_mock.call_count == 3 + 1
+
+
+def test_coalesced_batches_correlate_for_every_caller():
+    api = SolanaApi()
+    flight = get_single_flight()
+    coalesced = flight.coalesced + 1
+    started = threading.Event()
+    release = threading.Event()
+    bodies = []
+
+    def fake_post(url, data=None, **kwargs):
+        bodies.append(data)
+        started.set()
+        release.wait(1)
+        response = Response()
+        response.status_code = 200
+        response._content = json.dumps(
+            [
+                {'jsonrpc': '2.0', 'id': r['id'], 'result': r['method']}
+                for r in json.loads(data)
+            ]
+        ).encode()
+        return response
+
+    def release_when_coalesced():
+        deadline = time.monotonic() + 1
+        while flight.coalesced < coalesced and time.monotonic() < deadline:
+            threading.Event().wait(0.001)
+        release.set()
+
+    calls = [('getBalance', ['a']), ('getSlot', [])]
+    with patch.object(api._session, 'post', side_effect=fake_post):
+        with ThreadPoolExecutor(2) as executor:
+            futures = [executor.submit(api._request_batch, calls) for _ in range(2)]
+            started.wait(1)
+            release_when_coalesced()
+            results = [f.result(timeout=1) for f in futures]
+
+    assert len(bodies) == 1
+    assert [[r['result'] for r in result] for result in results] == [
+        ['getBalance', 'getSlot']
+    ] * 2
+
+
+def test_fetch_balances_many_async(rpc_handler):
+    addresses = ['5PjMxaijeVVQtuEzxK2NxyJeWwUbpTsi2uXuZ653WoHu', 'invalid']
+
+    async def post_async(body, **kwargs):
+        return rpc_handler(Mock(json=lambda: json.loads(body)), None)
+
+    api = SolanaApi()
+    with patch.object(api, 'post_async', side_effect=post_async):
+        results = asyncio.run(api.fetch_balances_many_async(addresses))
+
+    assert len(api.parse_balances(results[addresses[0]]).data) == 12
+    assert results['invalid'].errors
+
+
 def test_das_cache_prevents_refetch():
     api = SolanaApi()
     # Pre-populate cache
@@ -267,6 +534,407 @@ def test_das_cache_prevents_refetch():
         mock_request.assert_not_called()
 
 
+def test_fetch_das_assets_concurrently():
+    api = SolanaApi(das_concurrency=2)
+    api.DAS_BATCH_SIZE = 1
+    active = []
+    max_active = []
+    lock = threading.Lock()
+
+    def request(method, params):
+        (mint,) = params['ids']
+        with lock:
+            active.append(mint)
+            max_active.append(len(active))
+
+        # time.sleep is patched by the rate limiter fixture
+        threading.Event().wait(0.05)
+        with lock:
+            active.remove(mint)
+
+        if mint == 'bad':
+            raise ApiException('DAS unavailable')
+
+        return {'result': [{'id': mint}]}
+
+    with patch.object(api, '_request', side_effect=request):
+        errors = api._fetch_das_assets(['mint1', 'mint2', 'bad', 'mint3'])
+
+    assert max(max_active) == 2
+    assert errors == {'bad': 'DAS metadata of bad unavailable: DAS unavailable'}
+    assert api._das_cache['mint3'] == {'id': 'mint3'}
+    assert 'bad' not in api._das_cache
+
+
+def test_fetch_das_assets_concurrently_async():
+    api = SolanaApi(das_concurrency=2)
+    api.DAS_BATCH_SIZE = 1
+    active = []
+    max_active = []
+
+    async def request(method, params):
+        (mint,) = params['ids']
+        active.append(mint)
+        max_active.append(len(active))
+        await asyncio.sleep(0.01)
+        active.remove(mint)
+        if mint == 'bad':
+            raise ApiException('DAS unavailable')
+
+        return {'result': [{'id': mint}]}
+
+    with patch.object(api, '_request_async', side_effect=request):
+        errors = asyncio.run(
+            api._fetch_das_assets_async(['mint1', 'mint2', 'bad', 'mint3'])
+        )
+
+    assert max(max_active) == 2
+    assert list(errors) == ['bad']
+    assert api._das_cache['mint3'] == {'id': 'mint3'}
+
+
+def test_fetch_balances_reports_das_errors(requests_mock, rpc_handler):
+    test_addr = '5PjMxaijeVVQtuEzxK2NxyJeWwUbpTsi2uXuZ653WoHu'
+
+    def respond(request, context):
+        body = request.json()
+        if body['method'] == 'getAssetBatch':
+            error = {'code': -32000, 'message': 'DAS unavailable'}
+            return {'jsonrpc': '2.0', 'id': body['id'], 'error': error}
+
+        return rpc_handler(request, context)
+
+    requests_mock.post(ANY, json=respond)
+
+    api = SolanaApi()
+    fetch_result = api.fetch_balances(test_addr)
+    parsed = api.parse_balances(fetch_result)
+
+    assert fetch_result.errors is None
+    das_errors = fetch_result.extra['das_errors']
+    assert das_errors
+    assert all('DAS unavailable' in e for e in das_errors)
+    assert parsed.errors == das_errors
+    # balances are still parsed, without metadata
+    assert len(parsed.data) == 12
+
+
+def test_get_balance_keeps_balances_on_das_failure(requests_mock, rpc_handler):
+    test_addr = '5PjMxaijeVVQtuEzxK2NxyJeWwUbpTsi2uXuZ653WoHu'
+
+    def respond(request, context):
+        if request.json()['method'] == 'getAssetBatch':
+            context.status_code = 500
+            return {}
+
+        return rpc_handler(request, context)
+
+    requests_mock.post(ANY, json=respond)
+    api = SolanaApi()
+
+    balances = api.get_balance(test_addr)
+    assert len(balances) == 12
+
+    result = api.get_balances([test_addr])[test_addr]
+    assert len(result.data) == 12
+    assert all('unavailable' in e for e in result.errors)
+
+
+def _stake_account(lamports: int, stake: int) -> dict:
+    data = base64.b64encode(stake.to_bytes(8, 'little')).decode()
+    return {'lamports': lamports, 'data': [data, 'base64']}
+
+
+class StakeRpc:
+    def __init__(self, accounts: dict, epoch: int = 600):
+        self.accounts = accounts
+        self.epoch = epoch
+        self.calls = []
+
+    def __call__(self, method, params):
+        self.calls.append(method)
+        if method == 'getEpochInfo':
+            return {'result': {'epoch': self.epoch}}
+
+        if method == 'getProgramAccounts':
+            assert params[1]['filters'][0] == {'dataSize': 200}
+            assert params[1]['dataSlice'] == {'offset': 156, 'length': 8}
+            return {
+                'result': [
+                    {'pubkey': pubkey, 'account': account}
+                    for pubkey, account in self.accounts.items()
+                ]
+            }
+
+        assert method == 'getMultipleAccounts'
+        return {'result': {'value': [self.accounts.get(p) for p in params[0]]}}
+
+
+def test_filtered_stake_lookup():
+    rpc = StakeRpc(
+        {
+            'stake1': _stake_account(5_002_282_880, 5_000_000_000),
+            'stake2': _stake_account(2_282_880, 0),
+        }
+    )
+    api = SolanaApi(filtered_stake_lookup=True)
+
+    with patch.object(api, '_request', side_effect=rpc):
+        first = api._fetch_staked_sol('owner')
+        del rpc.accounts['stake2']
+        second = api._fetch_staked_sol('owner')
+
+    assert rpc.calls == ['getEpochInfo', 'getProgramAccounts', 'getMultipleAccounts']
+    assert len(first['result']) == 2
+    assert [r['pubkey'] for r in second['result']] == ['stake1']
+
+    staked = api._parse_staked_balance(first)
+    assert staked.balance_raw == 5_000_000_000
+    assert api._parse_rent_reserve(staked, first).balance_raw == 2 * 2_282_880
+
+
+def test_filtered_stake_lookup_caches_owners_without_stake():
+    rpc = StakeRpc({})
+    api = SolanaApi(filtered_stake_lookup=True)
+
+    with patch.object(api, '_request', side_effect=rpc):
+        api._fetch_staked_sol('owner')
+        assert api._fetch_staked_sol('owner') == {'result': []}
+
+    assert rpc.calls == ['getEpochInfo', 'getProgramAccounts']
+
+
+def test_filtered_stake_lookup_new_epoch():
+    rpc = StakeRpc({'stake1': _stake_account(1, 1)})
+    api = SolanaApi(filtered_stake_lookup=True)
+    api._stake_accounts = StakeAccountCache(epoch_check_interval=0)
+
+    with patch.object(api, '_request', side_effect=rpc):
+        api._fetch_staked_sol('owner')
+        rpc.epoch += 1
+        api._fetch_staked_sol('owner')
+
+    assert rpc.calls == ['getEpochInfo', 'getProgramAccounts'] * 2
+
+
+def test_filtered_stake_lookup_async():
+    rpc = StakeRpc({'stake1': _stake_account(1, 1)})
+    api = SolanaApi(filtered_stake_lookup=True)
+
+    async def request(method, params):
+        return rpc(method, params)
+
+    async def fetch_twice():
+        await api._fetch_staked_sol_async('owner')
+        return await api._fetch_staked_sol_async('owner')
+
+    with patch.object(api, '_request_async', side_effect=request):
+        response = asyncio.run(fetch_twice())
+
+    assert rpc.calls == ['getEpochInfo', 'getProgramAccounts', 'getMultipleAccounts']
+    assert api._parse_staked_balance(response).balance_raw == 1
+
+
+def test_skip_stake_addresses(requests_mock, rpc_handler):
+    test_addr = '5PjMxaijeVVQtuEzxK2NxyJeWwUbpTsi2uXuZ653WoHu'
+    requests_mock.post(ANY, json=rpc_handler)
+
+    api = SolanaApi(batch_requests=True, skip_stake_addresses=[test_addr])
+    balances = api.get_balance(test_addr)
+
+    batch, _ = requests_mock.request_history
+    assert [call['method'] for call in batch.json()] == [
+        'getBalance',
+        'getTokenAccountsByOwner',
+        'getTokenAccountsByOwner',
+    ]
+    assert AssetType.STAKED not in {b.asset_type for b in balances}
+
+
+def test_get_delegated_stake_full_account_data():
+    data = bytearray(200)
+    data[156:164] = (42).to_bytes(8, 'little')
+    account = {'data': [base64.b64encode(bytes(data)).decode(), 'base64']}
+
+    assert SolanaApi()._get_delegated_stake(account) == 42
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def das_cache(request, tmp_path):
+    if request.param == 'memory':
+        yield DasAssetCache(max_entries=2, ttl=100, negative_ttl=10)
+        return
+
+    cache = SqliteDasAssetCache(
+        str(tmp_path / 'das.db'), max_entries=2, ttl=100, negative_ttl=10
+    )
+    yield cache
+    cache.close()
+
+
+def _token_accounts_rpc(token_accounts: dict, das_asset_batch_response: str):
+    def handle(call: dict) -> dict:
+        if call['method'] == 'getAssetBatch':
+            response = json.loads(das_asset_batch_response)
+        elif call['params'][1]['programId'] == SolanaApi.TOKEN_PROGRAM_ID:
+            response = token_accounts
+        else:
+            context = token_accounts['result']['context']
+            response = {'result': {'context': context, 'value': []}}
+
+        return {**response, 'jsonrpc': '2.0', 'id': call['id']}
+
+    def respond(request, context):
+        body = request.json()
+        if isinstance(body, list):
+            return [handle(call) for call in body]
+
+        return handle(body)
+
+    return respond
+
+
+def test_fetch_token_account_changes(
+    requests_mock, token_accounts_response, das_asset_batch_response
+):
+    test_addr = '5PjMxaijeVVQtuEzxK2NxyJeWwUbpTsi2uXuZ653WoHu'
+    token_accounts = json.loads(token_accounts_response)
+    requests_mock.post(
+        ANY, json=_token_accounts_rpc(token_accounts, das_asset_batch_response)
+    )
+    api = SolanaApi(include_nfts=True)
+
+    changes = api.parse_token_account_changes(
+        api.fetch_token_account_changes(test_addr)
+    )
+    assert changes.slot == 268207149
+    assert len(changes.added) == 10
+    assert not changes.changed and not changes.removed
+
+    # one account moved, one was closed
+    accounts = token_accounts['result']['value']
+    accounts[0]['account']['data']['parsed']['info']['tokenAmount']['amount'] = '40'
+    closed = accounts.pop()
+    token_accounts['result']['context']['slot'] += 10
+    calls = requests_mock.call_count
+
+    changes = api.parse_token_account_changes(
+        api.fetch_token_account_changes(test_addr)
+    )
+    assert changes.slot == 268207159
+    assert not changes.added
+    assert list(changes.changed) == [accounts[0]['pubkey']]
+    assert changes.changed[accounts[0]['pubkey']].balance_raw == 40
+    assert changes.removed == [closed['pubkey']]
+    # DAS metadata cached already
+    assert requests_mock.call_count == calls + 2
+
+    # node behind the last seen slot
+    token_accounts['result']['context']['slot'] -= 5
+    accounts.pop()
+    changes = api.parse_token_account_changes(
+        api.fetch_token_account_changes(test_addr)
+    )
+    assert changes.slot == 268207159
+    assert not changes.added and not changes.changed and not changes.removed
+
+
+def test_fetch_token_account_changes_failure_keeps_state(
+    requests_mock, token_accounts_response, das_asset_batch_response
+):
+    test_addr = '5PjMxaijeVVQtuEzxK2NxyJeWwUbpTsi2uXuZ653WoHu'
+    token_accounts = json.loads(token_accounts_response)
+    requests_mock.post(
+        ANY, json=_token_accounts_rpc(token_accounts, das_asset_batch_response)
+    )
+    api = SolanaApi(include_nfts=True)
+
+    with patch.object(api, '_fetch_mint_metadata', side_effect=ApiException('DAS')):
+        with pytest.raises(ApiException):
+            api.fetch_token_account_changes(test_addr)
+
+    changes = api.parse_token_account_changes(
+        api.fetch_token_account_changes(test_addr)
+    )
+    assert len(changes.added) == 10
+
+
+def test_fetch_token_account_changes_async(
+    requests_mock, token_accounts_response, das_asset_batch_response
+):
+    test_addr = '5PjMxaijeVVQtuEzxK2NxyJeWwUbpTsi2uXuZ653WoHu'
+    rpc = _token_accounts_rpc(
+        json.loads(token_accounts_response), das_asset_batch_response
+    )
+    requests_mock.post(ANY, json=rpc)
+
+    async def post_async(body, **kwargs):
+        return rpc(Mock(json=lambda: json.loads(body)), None)
+
+    api = SolanaApi(include_nfts=True, batch_requests=True)
+    with patch.object(api, 'post_async', side_effect=post_async):
+        first = api.parse_token_account_changes(
+            asyncio.run(api.fetch_token_account_changes_async(test_addr))
+        )
+    second = api.parse_token_account_changes(api.fetch_token_account_changes(test_addr))
+
+    assert len(first.added) == 10
+    assert not second.added and not second.changed and not second.removed
+
+
+def test_das_asset_cache_ttl(das_cache):
+    with patch('blockapi.v2.api.solana.time.time', return_value=1000):
+        das_cache.update({'mint1': {'id': 'mint1'}, 'unknown': {}})
+
+    with patch('blockapi.v2.api.solana.time.time', return_value=1050):
+        assert das_cache['mint1'] == {'id': 'mint1'}
+        # negative entries expire sooner
+        assert 'unknown' not in das_cache
+        assert das_cache.get('unknown') is None
+
+    with patch('blockapi.v2.api.solana.time.time', return_value=1100):
+        assert 'mint1' not in das_cache
+
+
+def test_das_asset_cache_lru(das_cache):
+    with patch('blockapi.v2.api.solana.time.time', side_effect=itertools.count(1)):
+        das_cache['mint1'] = {'id': 'mint1'}
+        das_cache['mint2'] = {'id': 'mint2'}
+        assert das_cache.get('mint1')
+        das_cache['mint3'] = {'id': 'mint3'}
+
+        assert len(das_cache) == 2
+        assert 'mint2' not in das_cache
+        assert [mint for mint, _ in das_cache.items()] == ['mint3', 'mint1']
+
+
+def test_das_asset_cache_snapshot(das_cache, tmp_path):
+    das_cache.update({'mint1': {'id': 'mint1'}, 'unknown': {}})
+    path = tmp_path / 'snapshot.json'
+
+    assert das_cache.save_snapshot(path) == 1
+
+    cache = DasAssetCache()
+    assert cache.load_snapshot(path) == 1
+    assert cache['mint1'] == {'id': 'mint1'}
+
+
+def test_sqlite_das_asset_cache_persists(tmp_path):
+    path = str(tmp_path / 'das.db')
+    cache = SqliteDasAssetCache(path)
+    cache['mint1'] = {'id': 'mint1', 'token_info': {'decimals': 6}}
+    cache.close()
+
+    cache = SqliteDasAssetCache(path)
+    api = SolanaApi(das_cache=cache)
+    with patch.object(api, '_request') as mock_request:
+        api._fetch_das_assets(['mint1'])
+        mock_request.assert_not_called()
+
+    assert api.get_coin(('mint1', 6)).decimals == 6
+    cache.close()
+
+
 def test_solscan_get_staked_balance(requests_mock, solscan_staked_response):
     test_addr = '5PjMxaijeVVQtuEzxK2NxyJeWwUbpTsi2uXuZ653WoHu'
     requests_mock.get(
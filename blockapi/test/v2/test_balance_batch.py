@@ -0,0 +1,160 @@
+import json
+import time
+from decimal import Decimal
+
+import pytest
+from cytoolz import reduceby
+
+from blockapi.test.v2.api.conftest import read_file
+from blockapi.v2.api.debank import DebankBalanceParser, DebankProtocolCache
+from blockapi.v2.balance_batch import BalanceBatch
+from blockapi.v2.models import (
+    AssetType,
+    BalanceItem,
+    Blockchain,
+    Coin,
+    CoinContract,
+    ParseResult,
+    Protocol,
+)
+
+
+def _coin(symbol: str, address: str) -> Coin:
+    return Coin.from_api(
+        blockchain=Blockchain.ETHEREUM,
+        decimals=6,
+        symbol=symbol,
+        address=address,
+    )
+
+
+USDC = _coin('USDC', '0xa0b8')
+USDT = _coin('USDT', '0xdac1')
+AAVE = Protocol.from_api(
+    protocol_id='aave', chain=Blockchain.ETHEREUM, name='Aave', user_deposit=1
+)
+
+
+@pytest.fixture
+def items():
+    return [
+        BalanceItem.from_api(balance_raw=1_000000, coin=USDC, raw={'i': 0}),
+        BalanceItem.from_api(
+            balance_raw=2_500000,
+            coin=_coin('USDC', '0xa0b8'),
+            raw={'i': 1},
+            protocol=AAVE,
+            asset_type=AssetType.LENDING,
+            is_wallet=False,
+        ),
+        BalanceItem.from_api(balance_raw=3_000000, coin=USDT, raw={'i': 2}),
+        BalanceItem.from_api(
+            balance_raw=4,
+            coin_contract=CoinContract(
+                blockchain=Blockchain.ETHEREUM, contract='0xunknown', decimals=0
+            ),
+            raw={'i': 3},
+        ),
+    ]
+
+
+def test_round_trip(items):
+    batch = BalanceBatch.from_parse_result(ParseResult(data=items))
+
+    assert len(batch) == 4
+    assert len(batch.coins) == 3
+    assert batch.to_items() == items
+
+
+def test_filter(items):
+    batch = BalanceBatch.from_items(items)
+
+    lending = batch.filter(asset_types=[AssetType.LENDING])
+    assert lending.to_items() == [items[1]]
+
+    assert batch.filter(protocols=[None], coins=[USDC]).to_items() == [items[0]]
+    assert batch.filter(is_wallet=True, min_balance=3).to_items() == [
+        items[2],
+        items[3],
+    ]
+
+
+def test_sum_by_coin(items):
+    batch = BalanceBatch.from_items(items)
+
+    assert batch.totals() == {
+        (Blockchain.ETHEREUM, '0xa0b8', None, 'USDC', 6): Decimal('3.5'),
+        (Blockchain.ETHEREUM, '0xdac1', None, 'USDT', 6): Decimal(3),
+        (Blockchain.ETHEREUM, '0xunknown', 0): Decimal(4),
+    }
+    usdc = batch.sum_by('coin').to_items()[0]
+    assert usdc.coin == USDC
+    assert usdc.balance_raw == 3_500000
+    assert usdc.raw == {}
+
+
+def test_aggregated_items_have_own_raw(items):
+    batch = BalanceBatch.from_items(items).sum_by('coin')
+    concat = BalanceBatch.concat([batch, batch])
+
+    for aggregated in (batch.to_items(), concat.to_items()):
+        aggregated[0].raw['note'] = 'x'
+        assert [i.raw for i in aggregated[1:]] == [{}] * (len(aggregated) - 1)
+
+
+def test_from_generator_of_new_coins():
+    # coins built per item and freed right away must not share codes
+    items = (
+        BalanceItem.from_api(
+            balance_raw=1_000000,
+            coin=_coin('USDC', '0xa0b8') if i % 2 else _coin('USDT', '0xdac1'),
+            raw={},
+        )
+        for i in range(2000)
+    )
+
+    assert list(BalanceBatch.from_items(items).totals().values()) == [
+        Decimal(1000),
+        Decimal(1000),
+    ]
+
+
+def test_sum_by_several_keys(items):
+    batch = BalanceBatch.concat([BalanceBatch.from_items(items)] * 2)
+
+    assert len(batch) == 8
+    assert batch.totals('asset_type') == {
+        AssetType.AVAILABLE: Decimal(16),
+        AssetType.LENDING: Decimal(5),
+    }
+    assert batch.totals('protocol') == {None: Decimal(16), AAVE: Decimal(5)}
+    assert [i.balance for i in batch.sum_by('coin', 'protocol').to_items()] == [
+        Decimal(2),
+        Decimal(5),
+        Decimal(6),
+        Decimal(8),
+    ]
+
+    with pytest.raises(ValueError):
+        batch.sum_by('symbol')
+
+
+def test_sum_by_faster_than_merging_items():
+    parser = DebankBalanceParser(DebankProtocolCache())
+    response = json.loads(read_file('debank/data/balance_response.json'))
+    items = [i for _ in range(20) for i in parser.parse(response)]
+    key = lambda b: (b.coin.address, b.coin.symbol)
+
+    started = time.perf_counter()
+    merged = reduceby(key, lambda a, b: a + b, items)
+    merge_time = time.perf_counter() - started
+
+    batch = BalanceBatch.from_items(items)
+    started = time.perf_counter()
+    totals = batch.sum_by('coin').to_items()
+    batch_time = time.perf_counter() - started
+
+    assert {key(b): b.balance for b in totals} == {
+        k: b.balance for k, b in merged.items()
+    }
+    assert batch_time < merge_time
@@ -1,12 +1,20 @@
+import asyncio
+import json
 import logging
-from unittest.mock import MagicMock, patch
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import attr
 import pytest
-from requests import HTTPError
+from requests import HTTPError, Response
 from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.structures import CaseInsensitiveDict
 
 from blockapi.test.v2.api.fake_sleep_provider import FakeSleepProvider
-from blockapi.v2.base import CustomizableBlockchainApi
+from blockapi.v2.api import EthplorerApi
+from blockapi.v2.base import BalanceMixin, CustomizableBlockchainApi, ISleepProvider
+from blockapi.v2.models import ApiOptions, Blockchain, FetchResult, ParseResult
+from blockapi.v2.rate_limiter import reset_rate_limiters
 
 
 @pytest.fixture()
@@ -18,7 +26,7 @@ def customizable_api():
 def mocked_get_response_with_some_errors():
     mocked_response = MagicMock()
     mocked_response.status_code = 200
-    mocked_response.json.return_value = {}
+    mocked_response.content = b'{}'
     mocked_response.headers = {}
 
     with patch('blockapi.v2.base.CustomizableBlockchainApi._get_response') as patched:
@@ -77,7 +85,7 @@ def mocked_unauthorized_response():
     mocked_response.raise_for_status.side_effect = HTTPError(
         "test_method", 401, "exception", {}, None
     )
-    mocked_response.json.return_value = {}
+    mocked_response.content = b'{}'
     mocked_response.headers = {}
 
     with patch('blockapi.v2.base.CustomizableBlockchainApi._get_response') as patched:
@@ -99,12 +107,12 @@ def mocked_500_with_success_response():
     mocked_failure.raise_for_status.side_effect = HTTPError(
         "test_method", 500, "exception", {}, None
     )
-    mocked_failure.json.return_value = {}
+    mocked_failure.content = b'{}'
     mocked_failure.headers = {}
 
     mocked_success = MagicMock()
     mocked_success.status_code = 200
-    mocked_success.json.return_value = {}
+    mocked_success.content = b'{}'
     mocked_success.headers = {}
 
     with patch('blockapi.v2.base.CustomizableBlockchainApi._get_response') as patched:
@@ -127,12 +135,12 @@ def mocked_429_with_success_response():
     mocked_throttled.raise_for_status.side_effect = HTTPError(
         "test_method", 429, "exception", {}, None
     )
-    mocked_throttled.json.return_value = {}
+    mocked_throttled.content = b'{}'
     mocked_throttled.headers = {}
 
     mocked_success = MagicMock()
     mocked_success.status_code = 200
-    mocked_success.json.return_value = {}
+    mocked_success.content = b'{}'
     mocked_success.headers = {}
 
     with patch('blockapi.v2.base.CustomizableBlockchainApi._get_response') as patched:
@@ -161,7 +169,7 @@ def mocked_429_only_response():
     mocked_throttled.raise_for_status.side_effect = HTTPError(
         "test_method", 429, "exception", {}, None
     )
-    mocked_throttled.json.return_value = {}
+    mocked_throttled.content = b'{}'
     mocked_throttled.headers = {}
 
     with patch('blockapi.v2.base.CustomizableBlockchainApi._get_response') as patched:
@@ -175,3 +183,161 @@ def test_429_exhausted_logs_error(customizable_api, mocked_429_only_response, ca
 
     assert response.status_code == 429
     assert any(r.levelno == logging.ERROR for r in caplog.records)
+
+
+def _build_response(status_code, json_data=None, headers=None):
+    response = Response()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers or {})
+    response._content = json.dumps(json_data or {}).encode()
+    return response
+
+
+def test_get_data_async_success(customizable_api):
+    with patch.object(
+        CustomizableBlockchainApi,
+        '_get_response_async',
+        new=AsyncMock(return_value=_build_response(200, {'result': 1})),
+    ):
+        response = asyncio.run(customizable_api.get_data_async("test_method"))
+
+    assert response.status_code == 200
+    assert response.data == {'result': 1}
+
+
+def test_get_data_async_retries_with_sleep_provider(customizable_api):
+    with patch.object(
+        CustomizableBlockchainApi,
+        '_get_response_async',
+        new=AsyncMock(
+            side_effect=[
+                _build_response(429, headers={'retry-after': '3'}),
+                RequestsConnectionError("Wrong!"),
+                _build_response(200),
+            ]
+        ),
+    ):
+        response = asyncio.run(customizable_api.get_data_async("test_method"))
+
+    assert response.status_code == 200
+    assert customizable_api.sleep_provider.calls == [
+        ("fake_base", 3),
+        ("fake_base", 10),
+    ]
+
+
+def test_get_data_async_unauthorized_will_not_retry(customizable_api):
+    with patch.object(
+        CustomizableBlockchainApi,
+        '_get_response_async',
+        new=AsyncMock(return_value=_build_response(401)),
+    ) as patched:
+        response = asyncio.run(customizable_api.get_data_async("test_method"))
+
+    assert response.status_code == 401
+    assert patched.call_count == 1
+
+
+def test_sleep_async_does_not_block_event_loop():
+    released = threading.Event()
+    woken = []
+
+    class BlockingSleepProvider(ISleepProvider):
+        def sleep(self, url, seconds):
+            woken.append(released.wait(1))
+
+    async def sleep_while_loop_runs():
+        task = asyncio.create_task(
+            BlockingSleepProvider().sleep_async('https://api/', 1)
+        )
+        await asyncio.sleep(0.01)
+        released.set()
+        await task
+
+    asyncio.run(sleep_while_loop_runs())
+    # released by the loop while the sleep was blocked, not by the timeout
+    assert woken == [True]
+
+
+def test_get_balance_async_falls_back_to_thread():
+    class Api(BalanceMixin):
+        def fetch_balances(self, address):
+            return FetchResult(data=address)
+
+        def parse_balances(self, fetch_result):
+            return ParseResult(data=[fetch_result.data])
+
+    assert asyncio.run(Api().get_balance_async('addr')) == ['addr']
+
+
+@pytest.fixture()
+def balance_api():
+    def fetch_balances(address):
+        if address == 'broken':
+            raise ValueError('broken address')
+        if address == 'missing':
+            return FetchResult(errors=['not found'])
+
+        return FetchResult(data=address)
+
+    api = EthplorerApi(sleep_provider=FakeSleepProvider())
+    with patch.object(api, 'fetch_balances', side_effect=fetch_balances), patch.object(
+        api,
+        'parse_balances',
+        side_effect=lambda fetch_result: ParseResult(data=[fetch_result.data]),
+    ):
+        yield api
+
+
+def test_get_balances(balance_api):
+    result = balance_api.get_balances(
+        ['a', 'b', 'missing', 'broken', 'a'], max_workers=2
+    )
+
+    assert result == {
+        'a': ParseResult(data=['a']),
+        'b': ParseResult(data=['b']),
+        'missing': ParseResult(errors=['not found']),
+        'broken': ParseResult(errors=['ValueError: broken address']),
+    }
+
+
+class RateLimitedApi(CustomizableBlockchainApi):
+    coin = None
+    api_options = ApiOptions(
+        blockchain=Blockchain.ETHEREUM,
+        base_url='https://rate-limited/',
+        rate_limit=0.5,
+        rate_limit_burst=2,
+        enforce_rate_limit=True,
+    )
+
+
+def test_get_data_waits_for_rate_limiter(requests_mock):
+    reset_rate_limiters()
+    requests_mock.get('https://rate-limited/', json={})
+    sleep_provider = FakeSleepProvider()
+    api = RateLimitedApi(sleep_provider=sleep_provider)
+    other = RateLimitedApi(sleep_provider=sleep_provider)
+
+    api.get_data('test_method')
+    other.get_data('test_method')
+    assert sleep_provider.calls == []
+
+    api.get_data('test_method')
+    assert sleep_provider.calls == [
+        ('https://rate-limited/', pytest.approx(0.5, abs=0.1))
+    ]
+
+
+def test_rate_limit_is_not_enforced_by_default(requests_mock):
+    class Api(RateLimitedApi):
+        api_options = attr.evolve(RateLimitedApi.api_options, enforce_rate_limit=False)
+
+    requests_mock.get('https://rate-limited/', json={})
+    api = Api(sleep_provider=FakeSleepProvider())
+    for _ in range(3):
+        api.get_data('test_method')
+
+    assert api.rate_limiter is None
+    assert api.sleep_provider.calls == []
@@ -1,10 +1,16 @@
+from unittest.mock import patch
+
 import pytest
 
 from blockapi.v2.blockchain_mapping import (
+    DEBANK_BLOCKCHAINS_MAP,
+    ChainTable,
     get_blockchain_from_chain_id,
     get_blockchain_from_coingecko_chain,
     get_blockchain_from_debank_chain,
     get_blockchain_from_rango_chain,
+    get_chain_id,
+    get_debank_chain,
 )
 from blockapi.v2.models import Blockchain
 
@@ -233,3 +239,32 @@ def test_map_by_id():
 )
 def test_map_debank(chain: str, expected: Blockchain):
     assert get_blockchain_from_debank_chain(chain) == expected
+
+
+def test_reverse_mapping():
+    assert get_debank_chain(Blockchain.BINANCE_SMART_CHAIN) == 'bsc'
+    assert get_debank_chain(Blockchain.BASE) == 'base'
+    # not supported by DeBank, still named by the value
+    assert get_debank_chain(Blockchain.BITCOIN) == 'bitcoin'
+    assert get_chain_id(Blockchain.ETHEREUM) == '1'
+    assert get_chain_id(Blockchain.BITCOIN) is None
+
+    for chain, blockchain in DEBANK_BLOCKCHAINS_MAP.items():
+        assert get_blockchain_from_debank_chain(get_debank_chain(blockchain)) == (
+            blockchain
+        )
+
+
+@patch('blockapi.v2.blockchain_mapping.time.monotonic')
+def test_unknown_chain_warned_once(clock, caplog):
+    table = ChainTable('Test', {'one': Blockchain.ETHEREUM})
+    clock.return_value = 0.0
+
+    assert table.get('unknown') is None
+    assert table.get('UNKNOWN') is None
+    assert len(caplog.records) == 1
+
+    clock.return_value = ChainTable.WARNING_INTERVAL
+    assert table.get('unknown') is None
+    assert len(caplog.records) == 2
+    assert '(1 more times since)' in caplog.records[1].message
@@ -0,0 +1,168 @@
+import asyncio
+import time
+
+import pytest
+
+from blockapi.v2.base import CustomizableBlockchainApi
+from blockapi.v2.cache import (
+    CachedResponse,
+    MemoryResponseCache,
+    SqliteResponseCache,
+    make_cache_key,
+)
+from blockapi.v2.models import ApiOptions, Blockchain
+
+
+class CachedApi(CustomizableBlockchainApi):
+    coin = None
+    api_options = ApiOptions(
+        blockchain=Blockchain.ETHEREUM,
+        base_url='https://cached/',
+    )
+
+    supported_requests = {
+        'get_protocols': 'protocols',
+        'get_balance': 'balance/{address}',
+    }
+
+    cache_ttls = {'get_protocols': 60}
+
+
+@pytest.fixture
+def api():
+    api = CachedApi()
+    api.response_cache = MemoryResponseCache()
+    return api
+
+
+def _entry(key: str, expires_at: float = None) -> CachedResponse:
+    return CachedResponse(
+        status_code=200,
+        headers={'ETag': f'"{key}"'},
+        content=key.encode(),
+        expires_at=time.time() + 60 if expires_at is None else expires_at,
+    )
+
+
+def test_make_cache_key_sorts_params():
+    assert make_cache_key('get_x', 'https://a/x', None) == 'get_x https://a/x'
+    assert make_cache_key('get_x', 'https://a/x', {'b': 2, 'a': 1}) == (
+        'get_x https://a/x a=1&b=2'
+    )
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryResponseCache(max_entries=2)
+    cache.set('a', _entry('a'))
+    cache.set('b', _entry('b'))
+    cache.get('a')
+    cache.set('c', _entry('c'))
+
+    assert cache.get('b') is None
+    assert cache.get('a').content == b'a'
+    assert cache.get('c').content == b'c'
+    assert len(cache) == 2
+
+
+def test_sqlite_cache_persists_and_evicts(tmp_path):
+    path = str(tmp_path / 'cache.db')
+    cache = SqliteResponseCache(path, max_entries=2)
+    cache.set('a', _entry('a'))
+    cache.set('b', _entry('b'))
+    cache.set('c', _entry('c'))
+    cache.close()
+
+    cache = SqliteResponseCache(path, max_entries=2)
+    assert cache.get('a') is None
+    assert cache.get('c') == _entry('c', expires_at=cache.get('c').expires_at)
+    assert cache.get('b').etag == '"b"'
+
+
+def test_get_data_serves_fresh_response_from_cache(api, requests_mock):
+    requests_mock.get('https://cached/protocols', json={'a': 1})
+
+    assert api.get_data('get_protocols').data == {'a': 1}
+    assert api.get_data('get_protocols').data == {'a': 1}
+    assert api.get('get_protocols') == {'a': 1}
+    assert requests_mock.call_count == 1
+
+
+def test_uncached_request_method_is_always_sent(api, requests_mock):
+    requests_mock.get('https://cached/balance/0x1', json={})
+
+    api.get_data('get_balance', address='0x1')
+    api.get_data('get_balance', address='0x1')
+
+    assert requests_mock.call_count == 2
+    assert len(api.response_cache) == 0
+
+
+def test_cache_is_opt_in(requests_mock):
+    requests_mock.get('https://cached/protocols', json={})
+    api = CachedApi()
+
+    api.get_data('get_protocols')
+    api.get_data('get_protocols')
+
+    assert requests_mock.call_count == 2
+
+
+def test_stale_entry_is_revalidated(api, requests_mock):
+    requests_mock.get(
+        'https://cached/protocols',
+        [
+            {'json': {'a': 1}, 'headers': {'ETag': '"v1"'}},
+            {'status_code': 304},
+        ],
+    )
+    api.get_data('get_protocols')
+    key = make_cache_key('get_protocols', 'https://cached/protocols', None)
+    api.response_cache.set(key, api.response_cache.get(key).refreshed(-1))
+
+    result = api.get_data('get_protocols')
+
+    assert result.data == {'a': 1}
+    assert requests_mock.last_request.headers['If-None-Match'] == '"v1"'
+    assert api.response_cache.get(key).is_fresh()
+
+
+def test_stale_entry_is_replaced_by_new_response(api, requests_mock):
+    requests_mock.get(
+        'https://cached/protocols',
+        [
+            {'json': {'a': 1}, 'headers': {'Last-Modified': 'yesterday'}},
+            {'json': {'a': 2}},
+        ],
+    )
+    api.get_data('get_protocols')
+    key = make_cache_key('get_protocols', 'https://cached/protocols', None)
+    api.response_cache.set(key, api.response_cache.get(key).refreshed(-1))
+
+    assert api.get_data('get_protocols').data == {'a': 2}
+    assert requests_mock.last_request.headers['If-Modified-Since'] == 'yesterday'
+    assert api.get_data('get_protocols').data == {'a': 2}
+    assert requests_mock.call_count == 2
+
+
+def test_error_response_is_not_cached(api, requests_mock):
+    requests_mock.get('https://cached/protocols', status_code=404)
+
+    assert api.get_data('get_protocols').status_code == 404
+    assert len(api.response_cache) == 0
+
+
+def test_get_data_async_serves_from_cache(api):
+    key = make_cache_key('get_protocols', 'https://cached/protocols', None)
+    api.response_cache.set(
+        key,
+        CachedResponse(
+            status_code=200,
+            headers={'Content-Type': 'application/json'},
+            content=b'{"a": 1}',
+            expires_at=time.time() + 60,
+        ),
+    )
+
+    result = asyncio.run(api.get_data_async('get_protocols'))
+
+    assert result.data == {'a': 1}
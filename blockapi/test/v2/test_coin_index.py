@@ -0,0 +1,47 @@
+from blockapi.v2.coin_index import CoinIndex, coin_index
+from blockapi.v2.coins import COIN_DAI, COIN_ETH, COIN_RON, COIN_SOL, COIN_WETH
+from blockapi.v2.models import Blockchain, Coin, CoingeckoId
+
+
+def test_get_by_contract():
+    assert coin_index.get_by_contract(Blockchain.ETHEREUM, COIN_WETH.address) is (
+        COIN_WETH
+    )
+    assert (
+        coin_index.get_by_contract(
+            Blockchain.ETHEREUM, '0xC02AAA39B223FE8D0A0E5C4F27EAD9083C756CC2'
+        )
+        is COIN_WETH
+    )
+    assert coin_index.get_by_contract(Blockchain.POLYGON, COIN_WETH.address) is None
+    assert coin_index.get_by_contract(Blockchain.ETHEREUM, None) is None
+
+
+def test_base58_contract_is_case_sensitive():
+    mint = 'EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v'
+    coin = Coin.from_api(
+        blockchain=Blockchain.SOLANA, decimals=6, symbol='USDC', address=mint
+    )
+    index = CoinIndex([coin])
+
+    assert index.get_by_contract(Blockchain.SOLANA, mint) is coin
+    assert index.get_by_contract(Blockchain.SOLANA, mint.lower()) is None
+
+
+def test_get_by_symbol():
+    assert coin_index.get_by_symbol('DAI') is COIN_DAI
+    assert coin_index.get_by_symbol('DAI', Blockchain.ETHEREUM) is COIN_DAI
+    assert coin_index.get_by_symbol('DAI', Blockchain.SOLANA) is None
+    # first defined coin wins
+    assert coin_index.get_by_symbol('RON') is COIN_RON
+
+
+def test_get_by_coingecko_id():
+    assert (
+        coin_index.get_by_coingecko_id(Blockchain.ETHEREUM, CoingeckoId.ETHEREUM)
+        is COIN_ETH
+    )
+    assert coin_index.get_by_coingecko_id(Blockchain.SOLANA, 'solana') is COIN_SOL
+    assert coin_index.get_coingecko_id(Blockchain.ETHEREUM, COIN_WETH.address) == (
+        CoingeckoId.WETH
+    )
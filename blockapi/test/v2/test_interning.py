@@ -0,0 +1,150 @@
+import gc
+import json
+import tracemalloc
+
+import attr
+import pytest
+
+from blockapi.test.v2.api.conftest import read_file
+from blockapi.v2.api.debank import (
+    DebankBalanceParser,
+    DebankCoinTable,
+    DebankProtocolCache,
+)
+from blockapi.v2.interning import NO_RAW, InternRegistry, InternTable
+from blockapi.v2.models import (
+    BalanceItem,
+    Blockchain,
+    Coin,
+    CoinInfo,
+    Pool,
+    PoolInfo,
+    Protocol,
+)
+
+# bytes retained per interned balance without raw payload
+MAX_BYTES_PER_ITEM = 500
+
+
+def _coin(**kwargs) -> Coin:
+    return Coin.from_api(
+        **{
+            'blockchain': Blockchain.ETHEREUM,
+            'decimals': 18,
+            'symbol': 'DAI',
+            'address': '0x6B175474E89094C44Da98b954EedeAC495271d0F',
+            'standards': ['ERC20'],
+            'info': CoinInfo(logo_url='https://logo', coingecko_id='dai'),
+            **kwargs,
+        }
+    )
+
+
+def _balance(coin: Coin, protocol: Protocol = None) -> BalanceItem:
+    return BalanceItem.from_api(
+        balance_raw=10**18, coin=coin, raw={'amount': 1}, protocol=protocol
+    )
+
+
+@pytest.fixture
+def registry():
+    return InternRegistry()
+
+
+def test_intern_equal_coins(registry):
+    first = registry.coin(_coin())
+    second = registry.coin(_coin())
+
+    assert second is first
+    assert second == _coin()
+
+
+def test_intern_changed_coin_replaces(registry):
+    registry.coin(_coin())
+    renamed = registry.coin(_coin(name='Dai Stablecoin'))
+
+    assert renamed.name == 'Dai Stablecoin'
+    assert registry.coin(_coin(name='Dai Stablecoin')) is renamed
+
+
+def test_intern_shares_coin_info(registry):
+    native = registry.coin(_coin(address=None, symbol='ETH'))
+
+    assert native.info is registry.coin(_coin()).info
+
+
+def test_intern_balance_item(registry):
+    protocol = Protocol.from_api(
+        protocol_id='maker', chain=Blockchain.ETHEREUM, name='Maker', user_deposit=1
+    )
+    first = registry.balance_item(_balance(_coin(), protocol))
+    second = registry.balance_item(_balance(_coin(), attr.evolve(protocol)))
+
+    assert second.coin is first.coin
+    assert second.protocol is first.protocol
+    assert second.raw == {'amount': 1}
+    assert registry.balance_item(first) is first
+
+
+def test_intern_balance_item_drop_raw(registry):
+    item = _balance(_coin())
+
+    interned = registry.balance_item(item, drop_raw=True)
+
+    assert interned.raw is NO_RAW
+    assert attr.evolve(interned, raw=item.raw) == item
+
+
+def test_intern_pools(registry):
+    protocol = Protocol.from_api(
+        protocol_id='maker', chain=Blockchain.ETHEREUM, name='Maker', user_deposit=1
+    )
+    pools = [
+        Pool.from_api(
+            pool_info=PoolInfo.from_api(pool_id=str(i), project_id='maker'),
+            protocol=attr.evolve(protocol),
+            items=[_balance(_coin())],
+        )
+        for i in range(2)
+    ]
+
+    interned = registry.intern_pools(pools)
+
+    assert interned == pools
+    assert interned[0].protocol is interned[1].protocol
+    assert interned[0].items[0].coin is interned[1].items[0].coin
+
+
+def test_intern_table_is_bounded():
+    table = InternTable(max_entries=2)
+    for key in range(3):
+        table.intern(key, str(key))
+
+    assert len(table) == 2
+    assert table.intern(0, 'other') == 'other'
+
+
+def test_memory_per_interned_balance(registry):
+    response = read_file('debank/data/balance_response.json')
+
+    def parse_wallets(count: int) -> list[BalanceItem]:
+        items = []
+        for _ in range(count):
+            # a fresh payload and coins per wallet, as from separate fetches
+            parser = DebankBalanceParser(DebankProtocolCache(), DebankCoinTable())
+            parsed = parser.parse(json.loads(response))
+            items.extend(registry.intern_balances(parsed, drop_raw=True))
+
+        return items
+
+    parse_wallets(1)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        items = parse_wallets(30)
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert retained / len(items) < MAX_BYTES_PER_ITEM
@@ -0,0 +1,104 @@
+import asyncio
+import json
+from decimal import Decimal
+
+import pytest
+
+from blockapi.v2.json_stream import (
+    JsonItemStream,
+    JsonPointerNotFound,
+    UnexpectedJsonValue,
+    aiter_json_items,
+    iter_json_items,
+    parse_pointer,
+)
+
+DOCUMENT = {
+    'jsonrpc': '2.0',
+    'id': 1,
+    'skipped': [{'a': [1, 2, {'b': '}],'}]}],
+    'result': [
+        {'pubkey': f'key{i}', 'name': 'ž"\\' * i, 'lamports': 2282880, 'x': None}
+        for i in range(50)
+    ]
+    + [12345, -1.5e3, True, None, 'a,b'],
+}
+
+
+def _chunks(text: str, size: int) -> list[bytes]:
+    data = text.encode()
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def test_parse_pointer():
+    assert parse_pointer('') == []
+    assert parse_pointer('/result/0/a~1b~0c') == ['result', '0', 'a/b~c']
+
+    with pytest.raises(ValueError):
+        parse_pointer('result')
+
+
+@pytest.mark.parametrize('size', [1, 3, 64, 10_000])
+def test_iter_items_of_pointer(size):
+    chunks = _chunks(json.dumps(DOCUMENT, indent=1), size)
+
+    assert list(iter_json_items(chunks, '/result')) == DOCUMENT['result']
+    assert list(iter_json_items(chunks, '/skipped/0/a')) == [1, 2, {'b': '}],'}]
+
+
+def test_iter_top_level_array():
+    chunks = _chunks('[{"a": 1}, 2, [3]]', 2)
+
+    assert list(iter_json_items(chunks)) == [{'a': 1}, 2, [3]]
+
+
+def test_items_are_returned_as_soon_as_complete():
+    stream = JsonItemStream('/result')
+
+    assert stream.feed(b'{"result": [{"a": 1}, 12') == [{'a': 1}]
+    assert stream.feed(b'3, ') == [123]
+    assert stream.feed(b'"x"]}') == ['x']
+    assert stream.close() == []
+
+
+def test_json_kwargs_are_passed_to_decoder():
+    items = iter_json_items([b'[1.10, 2]'], parse_float=Decimal)
+
+    assert list(items) == [Decimal('1.10'), 2]
+
+
+def test_empty_and_null_values():
+    assert list(iter_json_items([b'[]'])) == []
+    assert list(iter_json_items([b'{"result": null}'], '/result')) == []
+
+
+def test_unexpected_value_is_available_on_error():
+    with pytest.raises(UnexpectedJsonValue) as e:
+        list(iter_json_items([b'{"message": "rate limited"}']))
+
+    assert e.value.value == {'message': 'rate limited'}
+
+
+def test_missing_pointer():
+    with pytest.raises(JsonPointerNotFound):
+        list(iter_json_items([b'{"a": 1}'], '/result'))
+
+    with pytest.raises(JsonPointerNotFound):
+        list(iter_json_items([b'[1]'], '/1'))
+
+
+@pytest.mark.parametrize('text', ['[1, 2', '[1 2]', '{"result": [1}'])
+def test_invalid_document(text):
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_items([text.encode()], '/result' if '{' in text else ''))
+
+
+def test_aiter_json_items():
+    async def chunks():
+        for chunk in _chunks(json.dumps(DOCUMENT), 7):
+            yield chunk
+
+    async def collect():
+        return [item async for item in aiter_json_items(chunks(), '/result')]
+
+    assert asyncio.run(collect()) == DOCUMENT['result']
@@ -0,0 +1,129 @@
+import pytest
+
+from blockapi.test.v2.api.fake_sleep_provider import FakeSleepProvider
+from blockapi.v2.base import CustomizableBlockchainApi
+from blockapi.v2.metrics import (
+    Histogram,
+    HistogramAggregator,
+    IRequestObserver,
+    PrometheusExporter,
+    RequestMetrics,
+)
+from blockapi.v2.models import ApiOptions, Blockchain
+
+
+class InstrumentedApi(CustomizableBlockchainApi):
+    coin = None
+    api_options = ApiOptions(
+        blockchain=Blockchain.ETHEREUM,
+        base_url='https://instrumented/',
+    )
+
+    supported_requests = {'get_balance': 'balance/{address}'}
+
+
+class RecordingObserver(IRequestObserver):
+    def __init__(self):
+        self.metrics = []
+
+    def on_request(self, metrics: RequestMetrics) -> None:
+        self.metrics.append(metrics)
+
+
+class FailingObserver(IRequestObserver):
+    def on_request(self, metrics: RequestMetrics) -> None:
+        raise RuntimeError('observer failed')
+
+
+@pytest.fixture
+def observer():
+    return RecordingObserver()
+
+
+@pytest.fixture
+def api(observer):
+    api = InstrumentedApi(sleep_provider=FakeSleepProvider())
+    api.observers = [FailingObserver(), observer]
+    return api
+
+
+def test_get_data_reports_metrics(api, observer, requests_mock):
+    requests_mock.get('https://instrumented/balance/0x1', text='{"balance": 1}')
+
+    result = api.get_data('get_balance', address='0x1')
+
+    assert result.data == {'balance': 1}
+    (metrics,) = observer.metrics
+    assert metrics.api == 'InstrumentedApi'
+    assert metrics.request_method == 'get_balance'
+    assert metrics.status_code == 200
+    assert metrics.response_bytes == 14
+    assert metrics.retries == 0
+    assert metrics.errors == 0
+    assert metrics.duration >= metrics.decode_time > 0
+
+
+def test_get_data_reports_retries_and_sleep(api, observer, requests_mock):
+    requests_mock.get(
+        'https://instrumented/balance/0x1',
+        [
+            {'status_code': 429, 'headers': {'Retry-After': '3'}},
+            {'status_code': 200, 'json': {}},
+        ],
+    )
+
+    api.get_data('get_balance', address='0x1')
+
+    (metrics,) = observer.metrics
+    assert metrics.retries == 1
+    assert metrics.sleep_time == 3
+    assert metrics.status_code == 200
+
+
+def test_get_data_reports_failure(api, observer, requests_mock):
+    requests_mock.get('https://instrumented/balance/0x1', status_code=404)
+
+    api.get_data('get_balance', address='0x1')
+
+    (metrics,) = observer.metrics
+    assert metrics.status_code == 404
+    assert metrics.errors == 1
+
+
+def test_histogram_quantile():
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.05, 0.5, 5.0):
+        histogram.observe(value)
+
+    assert histogram.cumulative_counts() == [2, 3, 4]
+    assert histogram.quantile(0.5) == 0.1
+    assert histogram.quantile(0.75) == 1.0
+    assert histogram.quantile(1.0) == float('inf')
+
+
+def test_aggregator_and_exporter():
+    aggregator = HistogramAggregator(buckets=(0.1, 1.0))
+    for duration, status in ((0.05, 200), (0.5, 200), (2.0, 429)):
+        aggregator.on_request(
+            RequestMetrics(
+                api='DebankApi',
+                request_method='get_balance',
+                status_code=status,
+                duration=duration,
+                sleep_time=1.5,
+                response_bytes=100,
+            )
+        )
+
+    assert aggregator.requests('DebankApi', 'get_balance') == {200: 2, 429: 1}
+    assert aggregator.counter('sleep_time', 'DebankApi', 'get_balance') == 4.5
+    assert aggregator.histogram('duration', 'DebankApi', 'get_balance').count == 3
+
+    lines = PrometheusExporter(aggregator).render().splitlines()
+    labels = 'api="DebankApi",request_method="get_balance"'
+    assert f'blockapi_request_duration_seconds_bucket{{{labels},le="0.1"}} 1' in lines
+    assert f'blockapi_request_duration_seconds_bucket{{{labels},le="1.0"}} 2' in lines
+    assert f'blockapi_request_duration_seconds_bucket{{{labels},le="+Inf"}} 3' in lines
+    assert f'blockapi_request_duration_seconds_count{{{labels}}} 3' in lines
+    assert f'blockapi_response_bytes_total{{{labels}}} 300.0' in lines
+    assert f'blockapi_requests_total{{{labels},status="429"}} 1' in lines
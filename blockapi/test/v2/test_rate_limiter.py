@@ -0,0 +1,96 @@
+import asyncio
+import threading
+
+import pytest
+
+from blockapi.v2.rate_limiter import TokenBucket, get_rate_limiter, reset_rate_limiters
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_bucket_allows_burst_then_paces(clock):
+    bucket = TokenBucket(rate=2, burst=3, clock=clock)
+
+    assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+    assert bucket.reserve() == 0.5
+    assert bucket.reserve() == 1.0
+
+
+def test_bucket_refills_up_to_burst(clock):
+    bucket = TokenBucket(rate=1, burst=2, clock=clock)
+    bucket.reserve()
+    bucket.reserve()
+
+    clock.now = 10
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 1
+
+
+def test_bucket_rejects_invalid_arguments():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+    with pytest.raises(ValueError):
+        TokenBucket(rate=1, burst=0)
+
+
+def test_bucket_serializes_concurrent_callers(clock):
+    bucket = TokenBucket(rate=10, burst=1, clock=clock)
+    waits = []
+
+    def reserve():
+        waits.append(bucket.reserve())
+
+    threads = [threading.Thread(target=reserve) for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert sorted(waits) == pytest.approx([0, 0.1, 0.2, 0.3, 0.4])
+
+
+def test_acquire_async_waits():
+    bucket = TokenBucket(rate=100, burst=1)
+
+    async def acquire_twice():
+        return [await bucket.acquire_async(), await bucket.acquire_async()]
+
+    first, second = asyncio.run(acquire_twice())
+    assert first == 0
+    assert 0 < second <= 0.01
+
+
+def test_get_rate_limiter_is_shared_per_key():
+    reset_rate_limiters()
+    bucket = get_rate_limiter('https://api/', 0.5)
+
+    assert bucket is get_rate_limiter('https://api/', 0.5)
+    assert bucket is not get_rate_limiter('https://other/', 0.5)
+    assert bucket.rate == 2
+
+
+def test_get_rate_limiter_respects_rate_of_each_caller():
+    reset_rate_limiters()
+    slow = get_rate_limiter('https://api/', 0.5)
+    fast = get_rate_limiter('https://api/', 0.1, burst=5)
+
+    assert slow.rate == 2
+    assert (fast.rate, fast.burst) == (10, 5)
+    assert get_rate_limiter('https://api/', 0.5) is slow
+
+
+def test_get_rate_limiter_disabled_without_rate_limit():
+    assert get_rate_limiter('https://api/', 0) is None
@@ -0,0 +1,71 @@
+import pytest
+
+from blockapi.v2.api import BlockchairBitcoinApi, BlockchairDogecoinApi, SolanaApi
+from blockapi.v2.session_pool import (
+    SessionPool,
+    get_origin,
+    get_session_pool,
+    set_session_pool,
+)
+
+
+@pytest.fixture
+def session_pool():
+    pool = SessionPool()
+    previous = set_session_pool(pool)
+    yield pool
+    set_session_pool(previous)
+    pool.close()
+
+
+def test_get_origin():
+    assert get_origin('https://api.blockchair.com/bitcoin/') == (
+        'https://api.blockchair.com'
+    )
+    assert get_origin('HTTP://Localhost:8080/x?y=1') == 'http://localhost:8080'
+    assert get_origin('fake_base') == 'fake_base'
+
+
+def test_pool_reuses_session_per_origin(session_pool):
+    first = session_pool.get('https://api.blockchair.com/bitcoin/')
+
+    assert session_pool.get('https://api.blockchair.com/dogecoin/') is first
+    assert session_pool.get('https://api.mainnet-beta.solana.com/') is not first
+
+
+def test_instances_share_pooled_session(session_pool):
+    btc = BlockchairBitcoinApi()
+    doge = BlockchairDogecoinApi()
+    sol = SolanaApi()
+
+    assert btc._session is doge._session
+    assert btc._session is not sol._session
+    assert get_session_pool() is session_pool
+
+    stats = session_pool.stats()
+    assert stats.sessions_created == 2
+    assert stats.session_hits == 1
+
+
+def test_pool_stats_count_connections(session_pool):
+    session = session_pool.get('https://api.blockchair.com/')
+
+    class FakeConnectionPool:
+        num_requests = 5
+        num_connections = 2
+
+    pools = session.get_adapter('https://api.blockchair.com/').poolmanager.pools
+    pools['fake'] = FakeConnectionPool()
+
+    stats = session_pool.stats()
+    assert stats.requests_sent == 5
+    assert stats.connections_created == 2
+    assert stats.connections_reused == 3
+
+
+def test_close_clears_sessions(session_pool):
+    session = session_pool.get('https://api.blockchair.com/')
+    session_pool.close()
+
+    assert session_pool.get('https://api.blockchair.com/') is not session
+    assert session_pool.stats().sessions_created == 1
@@ -0,0 +1,174 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+from requests import Response
+
+from blockapi.v2.base import CustomizableBlockchainApi
+from blockapi.v2.models import ApiOptions, Blockchain
+from blockapi.v2.single_flight import SingleFlight, get_single_flight
+
+
+class CoalescedApi(CustomizableBlockchainApi):
+    coin = None
+    api_options = ApiOptions(
+        blockchain=Blockchain.ETHEREUM,
+        base_url='https://coalesced/',
+    )
+
+    supported_requests = {'get_balance': 'balance/{address}'}
+
+
+def _release_after(flight: SingleFlight, coalesced: int, release: threading.Event):
+    deadline = time.monotonic() + 1
+    while flight.coalesced < coalesced and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+    release.set()
+
+
+def _run_concurrently(fn, count: int, started: threading.Event, release):
+    with ThreadPoolExecutor(count) as executor:
+        futures = [executor.submit(fn) for _ in range(count)]
+        started.wait(1)
+        release()
+        return [f.result(timeout=1) for f in futures]
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        started.set()
+        release.wait(1)
+        return 'result'
+
+    results = _run_concurrently(
+        lambda: flight.do('key', fetch),
+        4,
+        started,
+        lambda: _release_after(flight, 3, release),
+    )
+
+    assert results == ['result'] * 4
+    assert len(calls) == 1
+    assert flight.coalesced == 3
+
+
+def test_sequential_calls_are_not_coalesced():
+    flight = SingleFlight()
+
+    assert flight.do('key', lambda: 1) == 1
+    assert flight.do('key', lambda: 2) == 2
+    assert flight.coalesced == 0
+
+
+def test_exception_is_propagated_and_key_released():
+    flight = SingleFlight()
+
+    def fail():
+        raise ValueError('boom')
+
+    with pytest.raises(ValueError):
+        flight.do('key', fail)
+
+    assert flight.do('key', lambda: 'ok') == 'ok'
+
+
+def test_async_calls_share_one_execution():
+    flight = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return 'result'
+
+    async def main():
+        return await asyncio.gather(
+            *(flight.do_async('key', fetch) for _ in range(5)),
+            flight.do_async('other', fetch),
+        )
+
+    results = asyncio.run(main())
+
+    assert results == ['result'] * 6
+    assert len(calls) == 2
+    assert flight.coalesced == 4
+
+
+def test_cancelled_waiter_does_not_cancel_shared_call():
+    flight = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        return 'result'
+
+    async def main():
+        first = asyncio.ensure_future(flight.do_async('key', fetch))
+        second = asyncio.ensure_future(flight.do_async('key', fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(main()) == 'result'
+
+
+def _json_response(content: bytes) -> Response:
+    response = Response()
+    response.status_code = 200
+    response.headers['Content-Type'] = 'application/json'
+    response._content = content
+    return response
+
+
+def test_get_data_coalesces_identical_requests():
+    api = CoalescedApi()
+    flight = get_single_flight()
+    coalesced = flight.coalesced + 2
+    started = threading.Event()
+    release = threading.Event()
+    urls = []
+
+    def fake_get(url, **kwargs):
+        urls.append(url)
+        started.set()
+        release.wait(1)
+        return _json_response(b'{"balance": 1}')
+
+    with patch.object(api._session, 'get', side_effect=fake_get):
+        results = _run_concurrently(
+            lambda: api.get_data('get_balance', address='0x1'),
+            3,
+            started,
+            lambda: _release_after(flight, coalesced, release),
+        )
+
+    assert [r.data for r in results] == [{'balance': 1}] * 3
+    assert results[0].data is not results[1].data
+    assert urls == ['https://coalesced/balance/0x1']
+
+
+def test_get_data_without_coalescing():
+    api = CoalescedApi()
+    api.coalesce_requests = False
+
+    assert api._get_coalesce_key('GET', 'https://coalesced/', None, None) is None
+
+
+def test_coalesce_key_depends_on_auth_and_headers():
+    api = CoalescedApi()
+    key = api._get_coalesce_key('GET', 'https://coalesced/', {'a': 1}, None)
+
+    assert key != api._get_coalesce_key(
+        'GET', 'https://coalesced/', {'a': 1}, {'AccessKey': 'x'}
+    )
+    api._auth = ('key', '')
+    assert key != api._get_coalesce_key('GET', 'https://coalesced/', {'a': 1}, None)
@@ -0,0 +1,152 @@
+"""
+Pluggable JSON codec. The fastest installed backend (orjson, ujson) is used
+for decoding, with the standard library as fallback:
+
+- whenever parse hooks are requested (e.g. `parse_float=Decimal`), which only
+  the standard library supports,
+- for documents that may hold integers beyond 64 bits, which orjson would
+  silently turn into floats,
+- when the fast backend rejects the document, so results and errors are the
+  same regardless of the backend.
+
+Encoding always uses the standard library: the fast backends differ in
+separators, NaN and enum output, so payloads (e.g. `FetchResult.json()`,
+cached responses) would depend on what's installed.
+"""
+
+import json
+from decimal import Decimal
+from typing import Any, Callable, Optional, Union
+
+# Decimal-preserving parse options, e.g. for `json_parse_args`
+DECIMAL_PARSE_ARGS = dict(parse_float=Decimal)
+
+# keep numbers as their original strings
+STRING_PARSE_ARGS = dict(parse_int=lambda x: x, parse_float=lambda x: x)
+
+# maps digits to '0', keeps '"' and '.', everything else to ' ', so long
+# digit runs can be found with C-speed bytes operations
+_DIGITS_TABLE = bytes(
+    i if i in b'".' else (0x30 if 0x30 <= i <= 0x39 else 0x20) for i in range(256)
+)
+_LONG_RUN = b'0' * 19
+
+JsonData = Union[bytes, bytearray, str]
+
+
+class JsonCodec:
+    name = 'json'
+
+    def loads(self, data: JsonData, **parse_args) -> Any:
+        return json.loads(data, **parse_args)
+
+    def dumps(self, obj: Any, default: Optional[Callable] = None) -> str:
+        return json.dumps(obj, default=default)
+
+
+class OrjsonCodec(JsonCodec):
+    name = 'orjson'
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+
+    def loads(self, data: JsonData, **parse_args) -> Any:
+        if parse_args or _may_have_long_ints(data):
+            return super().loads(data, **parse_args)
+
+        try:
+            return self._orjson.loads(data)
+        except self._orjson.JSONDecodeError:
+            # e.g. NaN, which the standard library accepts
+            return super().loads(data)
+
+
+class UjsonCodec(JsonCodec):
+    name = 'ujson'
+
+    def __init__(self):
+        import ujson
+
+        self._ujson = ujson
+
+    def loads(self, data: JsonData, **parse_args) -> Any:
+        if parse_args or _may_have_long_ints(data):
+            return super().loads(data, **parse_args)
+
+        try:
+            return self._ujson.loads(data)
+        except ValueError:
+            return super().loads(data)
+
+
+def _may_have_long_ints(data: JsonData) -> bool:
+    """
+    Whether the document may hold an integer of 19+ digits. Runs of digits
+    starting a string ('"123...') or a fraction ('.123...') are skipped.
+    """
+    if isinstance(data, str):
+        data = data.encode()
+
+    digits = data.translate(_DIGITS_TABLE)
+    start = digits.find(_LONG_RUN)
+    while start != -1:
+        if start == 0 or digits[start - 1] not in b'".':
+            return True
+
+        end = start + len(_LONG_RUN)
+        while end < len(digits) and digits[end] == 0x30:
+            end += 1
+
+        start = digits.find(_LONG_RUN, end)
+
+    return False
+
+
+CODECS = {
+    'orjson': OrjsonCodec,
+    'ujson': UjsonCodec,
+    'json': JsonCodec,
+}
+
+
+def create_codec(name: Optional[str] = None) -> JsonCodec:
+    """
+    Create codec by name, or the fastest installed one.
+    """
+    if name is not None:
+        return CODECS[name]()
+
+    for codec_class in CODECS.values():
+        try:
+            return codec_class()
+        except ImportError:
+            continue
+
+
+_codec = create_codec()
+
+
+def get_codec() -> JsonCodec:
+    return _codec
+
+
+def set_codec(codec: Union[str, JsonCodec]) -> JsonCodec:
+    """
+    Replace the process-wide codec, returns the previous one.
+    """
+    global _codec
+    if isinstance(codec, str):
+        codec = create_codec(codec)
+
+    previous, _codec = _codec, codec
+    return previous
+
+
+def loads(data: JsonData, **parse_args) -> Any:
+    return _codec.loads(data, **parse_args)
+
+
+def dumps(obj: Any, default: Optional[Callable] = None) -> str:
+    return _codec.dumps(obj, default=default)
@@ -1,9 +1,15 @@
-from decimal import Decimal, InvalidOperation
+from decimal import Decimal, InvalidOperation, getcontext
 from numbers import Number
-from typing import Optional, Union
+from typing import Iterable, Optional, Union
 
 SupportsNumber = Union[str, Number]
 
+# 10 ** n, for token decimals up to this many
+MAX_CACHED_DECIMALS = 255
+_POWERS_OF_TEN = tuple(10**n for n in range(MAX_CACHED_DECIMALS + 1))
+# Decimal 10 ** -n, exact
+_DECIMAL_SCALES = tuple(Decimal(1).scaleb(-n) for n in range(MAX_CACHED_DECIMALS + 1))
+
 
 def to_int(number: Union[int, str]):
     return int(number)
@@ -18,7 +24,14 @@ def to_decimal(number: Union[int, float, str, Decimal]) -> Decimal:
     >>> Decimal('1.01')
     Decimal('1.01')
     """
-    if isinstance(number, Decimal):
+    # exact types first, subclasses (bool, enums) take the checks below
+    if (number_type := type(number)) is float:
+        return Decimal(repr(number))
+    elif number_type is Decimal:
+        return number
+    elif number_type is int or number_type is str:
+        return Decimal(number)
+    elif isinstance(number, Decimal):
         return number
     elif isinstance(number, float):
         return Decimal(str(number))
@@ -32,6 +45,72 @@ def raw_to_decimals(raw: Union[int, str], decimals: Union[int, str]) -> Decimal:
     """
     Conversion of raw (gwei/satoshi/...) format to decimals.
     """
+    int_raw = raw if type(raw) is int else _as_int(raw)
+    if (
+        int_raw is not None
+        and type(decimals) is int
+        and 0 <= decimals <= MAX_CACHED_DECIMALS
+        and -(limit := _exact_limit()) < int_raw < limit
+    ):
+        return _scale_int(int_raw, decimals)
+
+    return _raw_to_decimals(raw, decimals)
+
+
+def raw_to_decimals_many(
+    raws: Iterable[Union[int, str]], decimals: Union[int, str]
+) -> list[Decimal]:
+    """
+    `raw_to_decimals` of many raw amounts with the same decimals.
+    """
+    int_decimals = _as_int(decimals)
+    if int_decimals is None or not 0 <= int_decimals <= MAX_CACHED_DECIMALS:
+        return [_raw_to_decimals(raw, decimals) for raw in raws]
+
+    limit = _exact_limit()
+    return [
+        (
+            _scale_int(int_raw, int_decimals)
+            if (int_raw := _as_int(raw)) is not None and -limit < int_raw < limit
+            else _raw_to_decimals(raw, decimals)
+        )
+        for raw in raws
+    ]
+
+
+def _as_int(raw) -> Optional[int]:
+    if type(raw) is int:
+        return raw
+
+    if type(raw) is str and raw.isascii() and raw.isdigit():
+        return int(raw)
+
+    return None
+
+
+def _exact_limit() -> int:
+    """Raw amounts below this are multiplied without rounding."""
+    precision = getcontext().prec
+    if precision <= MAX_CACHED_DECIMALS:
+        return _POWERS_OF_TEN[precision]
+
+    return 10**precision
+
+
+def _scale_int(raw: int, decimals: int) -> Decimal:
+    """
+    Same as `_raw_to_decimals` for raw amounts within context precision,
+    where the product is exact: integral results divided in integers,
+    others multiplied by a cached scale and normalized.
+    """
+    unit = _POWERS_OF_TEN[decimals]
+    if not raw % unit:
+        return Decimal(raw // unit)
+
+    return (Decimal(raw) * _DECIMAL_SCALES[decimals]).normalize()
+
+
+def _raw_to_decimals(raw: Union[int, str], decimals: Union[int, str]) -> Decimal:
     raw_ = to_decimal(raw)
     decimals_ = to_decimal(decimals)
     res = raw_ * pow(10, -decimals_)
@@ -42,6 +42,19 @@ class BlockchairApi(BlockchainApi, BalanceMixin, ITransactions, ABC):
             limit=self._limit,
         )
 
+    async def fetch_balances_async(self, address: str) -> FetchResult:
+        address_type = self._get_address_type(address)
+
+        return await self.get_data_async(
+            'get_dashboard',
+            extra=dict(address_type=address_type),
+            address=address,
+            symbol=self.coin.symbol,
+            address_type=address_type,
+            offset=self._offset,
+            limit=self._limit,
+        )
+
     def parse_balances(self, fetch_result: FetchResult) -> ParseResult:
         if not fetch_result.data:
             return ParseResult()
@@ -4,12 +4,13 @@ from collections import defaultdict
 from decimal import Decimal
 from typing import Iterable, Optional, Union
 
-from requests import Session
-
+from blockapi.utils import json as json_codec
 from blockapi.utils.num import to_decimal
 from blockapi.v2.base import ApiOptions, BlockchainApi, IBalance, ISleepProvider
+from blockapi.v2.cache import IResponseCache, get_with_cache
 from blockapi.v2.coins import COIN_ATOM, COIN_CELESTIA, COIN_DYDX, COIN_OSMOSIS
 from blockapi.v2.models import AssetType, BalanceItem, Blockchain, Coin, CoinInfo
+from blockapi.v2.session_pool import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -18,8 +19,12 @@ class CosmosTokenMapLoader:
     NATIVE_TOKEN_DATA_JSON = 'https://raw.githubusercontent.com/PulsarDefi/IBC-Token-Data-Cosmos/main/native_token_data.min.json'
     IBC_DATA_JSON = 'https://raw.githubusercontent.com/PulsarDefi/IBC-Token-Data-Cosmos/main/ibc_data.min.json'
 
-    def __init__(self):
-        self._session = Session()
+    # token data changes rarely and is served with ETag, revalidate hourly
+    cache_ttl = 60 * 60
+
+    def __init__(self, response_cache: Optional[IResponseCache] = None):
+        self._session = get_session(self.NATIVE_TOKEN_DATA_JSON)
+        self._response_cache = response_cache
         self._tokens_map = defaultdict(dict)
 
     @property
@@ -31,16 +36,14 @@ class CosmosTokenMapLoader:
         return self._tokens_map
 
     def parse_native_tokens(self):
-        response = self._session.get(self.NATIVE_TOKEN_DATA_JSON)
-        data = response.json()
+        data = self._get_json(self.NATIVE_TOKEN_DATA_JSON)
 
         for key, value in data.items():
             native_denom, chain = key.split('__')
             self._tokens_map[chain][native_denom] = value
 
     def parse_ibc_data(self):
-        response = self._session.get(self.IBC_DATA_JSON)
-        data = response.json()
+        data = self._get_json(self.IBC_DATA_JSON)
 
         for key, value in data.items():
             ibc_denom, chain = key.split('__')
@@ -68,6 +71,16 @@ class CosmosTokenMapLoader:
 
             self._tokens_map[chain][ibc_denom] = native_token_value
 
+    def _get_json(self, url: str) -> dict:
+        def send(conditional_headers: dict):
+            return self._session.get(url, headers=conditional_headers)
+
+        if self._response_cache is None:
+            return json_codec.loads(send({}).content)
+
+        response = get_with_cache(self._response_cache, url, self.cache_ttl, send)
+        return json_codec.loads(response.content)
+
 
 class CosmosApiBase(BlockchainApi, IBalance, metaclass=ABCMeta):
     """
@@ -111,7 +124,9 @@ class CosmosApiBase(BlockchainApi, IBalance, metaclass=ABCMeta):
     @property
     def blockchain_tokens_map(self) -> dict[str, dict]:
         if not self._tokens_map:
-            self._tokens_map = CosmosTokenMapLoader().tokens_map
+            self._tokens_map = CosmosTokenMapLoader(
+                response_cache=self.response_cache
+            ).tokens_map
 
         return self._tokens_map[self.TOKENS_MAP_BLOCKCHAIN_KEY]
 
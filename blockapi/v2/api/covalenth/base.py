@@ -5,6 +5,7 @@ from typing import Dict
 from eth_utils import to_checksum_address
 
 from blockapi.v2.base import BlockchainApi, IBalance, ISleepProvider
+from blockapi.v2.coin_index import coin_index
 from blockapi.v2.models import BalanceItem, Coin, CoinInfo
 
 logger = logging.getLogger(__name__)
@@ -41,7 +42,7 @@ class CovalentApiBase(BlockchainApi, IBalance, metaclass=ABCMeta):
         super().__init__(api_key, sleep_provider=sleep_provider)
 
         # Set http basic auth for requests.
-        self._session.auth = (api_key, "")
+        self._auth = (api_key, "")
 
     def get_balance(self, address: str) -> [BalanceItem]:
         response = self.get('get_balance', chain_id=self.CHAIN_ID, address=address)
@@ -86,7 +87,13 @@ class CovalentApiBase(BlockchainApi, IBalance, metaclass=ABCMeta):
                         raw_balance.get('contract_address')
                     ),
                     standards=raw_balance.get("supports_erc", []),
-                    info=CoinInfo(logo_url=raw_balance.get("logo_url")),
+                    info=CoinInfo(
+                        logo_url=raw_balance.get("logo_url"),
+                        coingecko_id=coin_index.get_coingecko_id(
+                            self.api_options.blockchain,
+                            raw_balance.get('contract_address'),
+                        ),
+                    ),
                 )
 
             balances.append(
@@ -1,8 +1,25 @@
+import asyncio
+import contextvars
+import json
 import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from decimal import Decimal
-from functools import lru_cache
-from typing import Dict, Iterable, List, Optional, Union
+from pathlib import Path
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
 
 import attr
 from pydantic import BaseModel, validator
@@ -11,10 +28,9 @@ from blockapi.utils.address import make_checksum_address
 from blockapi.utils.datetime import parse_dt
 from blockapi.utils.num import decimals_to_raw
 from blockapi.v2.api.debank_maps import (
-    COINGECKO_IDS_BY_CONTRACTS,
+    COINGECKO_ID_BY_CONTRACT,
     DEBANK_APP_CHAIN_MAP,
     DEBANK_ASSET_TYPES,
-    NATIVE_COIN_MAP,
     REWARD_ASSET_TYPE_MAP,
 )
 from blockapi.v2.base import (
@@ -25,7 +41,8 @@ from blockapi.v2.base import (
     ISleepProvider,
 )
 from blockapi.v2.blockchain_mapping import get_blockchain_from_debank_chain
-from blockapi.v2.coin_mapping import symbol_to_coin_map
+from blockapi.v2.coin_index import coin_index
+from blockapi.v2.json_stream import UnexpectedJsonValue
 from blockapi.v2.models import (
     AssetType,
     BalanceItem,
@@ -67,6 +84,79 @@ class DebankModelBalanceItem(BaseModel):
     raw_value: Optional[dict] = None
 
 
+class DebankBalanceRecord:
+    """
+    Lightweight stand-in for `DebankModelBalanceItem`. Built by `read` only
+    from items of plain values the model would accept unchanged (strings,
+    integral decimals, int or float amounts), so it never accepts or
+    coerces anything the model wouldn't.
+    """
+
+    __slots__ = (
+        'id',
+        'chain',
+        'name',
+        'symbol',
+        'display_symbol',
+        'optimized_symbol',
+        'decimals',
+        'logo_url',
+        'protocol_id',
+        'time_at',
+        'amount',
+        'raw_amount',
+        'raw_value',
+    )
+
+    def __init__(self, item: dict):
+        get = item.get
+        self.id = item['id']
+        self.chain = item['chain']
+        self.name = item['name']
+        self.symbol = item['symbol']
+        self.display_symbol = get('display_symbol')
+        self.optimized_symbol = get('optimized_symbol')
+        self.decimals = item['decimals']
+        self.logo_url = get('logo_url')
+        self.protocol_id = get('protocol_id')
+        self.time_at = _opt_float(get('time_at'))
+        self.amount = float(item['amount'])
+        self.raw_amount = _opt_float(get('raw_amount'))
+        self.raw_value = item
+
+    @classmethod
+    def read(cls, item: dict) -> Optional['DebankBalanceRecord']:
+        """Record of the item, None if it needs validation by the model."""
+        get = item.get
+        if (
+            type(get('id')) is str
+            and type(get('chain')) is str
+            and type(get('name')) is str
+            and type(get('symbol')) is str
+            and type(get('display_symbol')) in _OPT_STR
+            and type(get('optimized_symbol')) in _OPT_STR
+            and type(get('logo_url')) in _OPT_STR
+            and type(get('protocol_id')) in _OPT_STR
+            and type(get('decimals')) is int
+            and type(get('amount')) in _NUMBER
+            and type(get('time_at')) in _OPT_NUMBER
+            and type(get('raw_amount')) in _OPT_NUMBER
+        ):
+            return cls(item)
+
+        return None
+
+
+# types read as they are, anything else is validated by the model
+_OPT_STR = frozenset((str, type(None)))
+_NUMBER = frozenset((int, float))
+_OPT_NUMBER = _NUMBER | {type(None)}
+
+
+def _opt_float(value) -> Optional[float]:
+    return None if value is None else float(value)
+
+
 class DebankModelPoolItemDetail(BaseModel):
     description: Optional[str] = None
     health_rate: Optional[float] = None
@@ -240,13 +330,41 @@ class DebankUsageParser:
 
 
 class DebankProtocolCache:
-    def __init__(self, timeout: int = 3600):
+    """
+    Protocols by id, refreshed after `timeout` seconds.
+
+    With `refresh_ahead` (seconds before expiry) the refresh starts in the
+    background once that window is reached, while the current, possibly
+    expired, protocols are served; only an empty cache is loaded inline.
+    A failed background refresh is retried after `RETRY_INTERVAL` seconds.
+
+    With `snapshot_path` protocols are kept in a JSON file, so a new cache
+    starts warm. Processes sharing the file pick up each other's refreshes
+    instead of downloading the list again.
+    """
+
+    RETRY_INTERVAL = 60
+
+    def __init__(
+        self,
+        timeout: int = 3600,
+        refresh_ahead: Optional[int] = None,
+        snapshot_path: Optional[Union[str, Path]] = None,
+    ):
         self._timeout: int = timeout
+        self._refresh_ahead = refresh_ahead
+        self._snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self._snapshot_mtime: Optional[float] = None
         self._data: Dict[str, Protocol] = {}
         # Naive local time on purpose: _timelimit is only ever compared against
         # other datetime.now() values here (cache TTL), never mixed with the
         # tz-aware datetimes used elsewhere, so there is no naive/aware hazard.
         self._timelimit = datetime.now()
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._load_snapshot()
 
     def invalidate(self):
         self._timelimit = datetime.now()
@@ -254,9 +372,160 @@ class DebankProtocolCache:
     def needs_update(self) -> bool:
         return datetime.now() >= self._timelimit
 
+    def needs_refresh(self) -> bool:
+        ahead = timedelta(seconds=self._refresh_ahead or 0)
+        return datetime.now() >= self._timelimit - ahead
+
     def update(self, data: Dict[str, Protocol]) -> None:
-        self._timelimit = datetime.now() + timedelta(seconds=self._timeout)
+        self._set(data, datetime.now() + timedelta(seconds=self._timeout))
+        self._save_snapshot()
+
+    def refresh(self, load: Callable[[], Dict[str, Protocol]]) -> None:
+        """
+        Update protocols with `load()` if needed, in a background thread
+        when refreshing ahead.
+        """
+        if not self.needs_refresh() or self._load_snapshot():
+            return
+
+        if not self._refresh_in_background():
+            self.update(load())
+            return
+
+        if self._start_refresh():
+            self._refresh_thread = threading.Thread(
+                target=self._run_refresh,
+                args=(load,),
+                name='debank-protocol-refresh',
+                daemon=True,
+            )
+            self._refresh_thread.start()
+
+    async def refresh_async(
+        self, load: Callable[[], Awaitable[Dict[str, Protocol]]]
+    ) -> None:
+        """Asyncio variant of `refresh`, refreshing ahead in a task."""
+        if not self.needs_refresh() or self._load_snapshot():
+            return
+
+        if not self._refresh_in_background():
+            self.update(await load())
+            return
+
+        if self._start_refresh():
+
+            async def run():
+                try:
+                    self._finish_refresh(await load())
+                except Exception as e:
+                    self._finish_refresh({}, e)
+
+            self._refresh_task = asyncio.get_running_loop().create_task(run())
+
+    def _refresh_in_background(self) -> bool:
+        return self._refresh_ahead is not None and bool(self._data)
+
+    def _start_refresh(self) -> bool:
+        with self._lock:
+            if self._refreshing:
+                return False
+
+            self._refreshing = True
+            return True
+
+    def _run_refresh(self, load: Callable[[], Dict[str, Protocol]]) -> None:
+        try:
+            self._finish_refresh(load())
+        except Exception as e:
+            self._finish_refresh({}, e)
+
+    def _finish_refresh(
+        self, data: Dict[str, Protocol], error: Optional[Exception] = None
+    ) -> None:
+        try:
+            if data:
+                self.update(data)
+            else:
+                # keep serving current protocols
+                logger.warning('DeBank protocols refresh failed: %s', error)
+                retry_in = self._refresh_ahead + self.RETRY_INTERVAL
+                self._timelimit = datetime.now() + timedelta(seconds=retry_in)
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def _set(self, data: Dict[str, Protocol], timelimit: datetime) -> None:
         self._data = data
+        self._timelimit = timelimit
+
+    def _load_snapshot(self) -> bool:
+        """
+        Load protocols from the snapshot if it changed since seen last,
+        e.g. refreshed by another process. Returns whether loaded fresh ones.
+        """
+        try:
+            mtime = self._snapshot_path.stat().st_mtime
+        except (AttributeError, OSError):
+            return False
+
+        if mtime == self._snapshot_mtime:
+            return False
+
+        try:
+            with self._snapshot_path.open(encoding='utf-8') as f:
+                data = {
+                    item['protocol_id']: self._protocol_from_snapshot(item)
+                    for item in json.load(f)
+                }
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning('Invalid DeBank protocols snapshot: %s', e)
+            return False
+
+        self._snapshot_mtime = mtime
+        timelimit = datetime.fromtimestamp(mtime) + timedelta(seconds=self._timeout)
+        self._set(data, timelimit)
+        return not self.needs_refresh()
+
+    def _save_snapshot(self) -> None:
+        if self._snapshot_path is None or not self._data:
+            return
+
+        items = [
+            attr.asdict(p, value_serializer=self._serialize_value)
+            for p in self._data.values()
+        ]
+        directory = self._snapshot_path.parent
+        try:
+            # atomic replace, readers never see a partial file
+            with tempfile.NamedTemporaryFile(
+                'w', dir=directory, suffix='.tmp', delete=False, encoding='utf-8'
+            ) as f:
+                json.dump(items, f)
+
+            os.replace(f.name, self._snapshot_path)
+            self._snapshot_mtime = self._snapshot_path.stat().st_mtime
+        except OSError as e:
+            logger.warning('Cannot save DeBank protocols snapshot: %s', e)
+
+    @staticmethod
+    def _serialize_value(instance, field, value):
+        if isinstance(value, Blockchain):
+            return value.value
+
+        if isinstance(value, Decimal):
+            return str(value)
+
+        return value
+
+    @staticmethod
+    def _protocol_from_snapshot(item: dict) -> Protocol:
+        return Protocol(
+            **{
+                **item,
+                'chain': Blockchain(item['chain']),
+                'user_deposit': Decimal(item['user_deposit']),
+            }
+        )
 
     def get(self, key: str) -> Optional[Protocol]:
         protocol = self._data.get(key)
@@ -266,21 +535,61 @@ class DebankProtocolCache:
         return protocol
 
 
-@lru_cache
 def get_coingecko_id(contract, symbol) -> Optional[CoingeckoId]:
-    return next(
-        (
-            it.coingecko_id
-            for it in COINGECKO_IDS_BY_CONTRACTS
-            if it.symbol == symbol and contract in it.contracts
-        ),
-        None,
-    )
+    return COINGECKO_ID_BY_CONTRACT.get((contract, symbol))
+
+
+class DebankCoinTable:
+    """
+    Coins of DeBank balance items by (chain, contract, protocol id, symbol),
+    so the same token is built (and its address checksummed) once, not per
+    item. Oldest entries are dropped beyond `max_entries`. Thread-safe:
+    entries are immutable and dict operations atomic.
+    """
+
+    def __init__(self, max_entries: int = 100000):
+        self.max_entries = max_entries
+        self._data: Dict[tuple, Coin] = {}
+
+    def get(self, key: tuple) -> Optional[Coin]:
+        return self._data.get(key)
+
+    def set(self, key: tuple, coin: Coin) -> None:
+        if len(self._data) >= self.max_entries:
+            try:
+                del self._data[next(iter(self._data))]
+            except (KeyError, StopIteration, RuntimeError):
+                pass
+
+        self._data[key] = coin
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
 
 
 class DebankBalanceParser:
-    def __init__(self, protocol_cache: DebankProtocolCache):
+    """
+    Items are validated by `DebankModelBalanceItem` once per schema (set of
+    keys), then read as `DebankBalanceRecord` where their values are plain,
+    by the model otherwise. Coins are shared through the coin table.
+    """
+
+    default_coin_table = DebankCoinTable()
+
+    MAX_VALIDATED_SCHEMAS = 1000
+
+    def __init__(
+        self,
+        protocol_cache: DebankProtocolCache,
+        coin_table: Optional[DebankCoinTable] = None,
+    ):
         self._protocols = protocol_cache
+        self._coins = coin_table if coin_table is not None else self.default_coin_table
+        # key sets validated by the model already
+        self._validated_schemas: set[frozenset] = set()
 
     def parse(
         self,
@@ -294,18 +603,32 @@ class DebankBalanceParser:
 
         items = []
         for item in response:
-            balance_item = DebankModelBalanceItem(**item)
-            balance_item.raw_value = item
-
+            balance_item = self.read_item(item)
             balance = self.parse_item(balance_item, asset_type, is_wallet, pool_info)
             if balance is not None:
                 items.append(balance)
 
         return items
 
+    def read_item(
+        self, item: dict
+    ) -> Union[DebankModelBalanceItem, DebankBalanceRecord]:
+        schema = frozenset(item)
+        if schema in self._validated_schemas and (
+            record := DebankBalanceRecord.read(item)
+        ):
+            return record
+
+        balance_item = DebankModelBalanceItem(**item)
+        balance_item.raw_value = item
+        if len(self._validated_schemas) < self.MAX_VALIDATED_SCHEMAS:
+            self._validated_schemas.add(schema)
+
+        return balance_item
+
     def parse_item(
         self,
-        balance_item: DebankModelBalanceItem,
+        balance_item: Union[DebankModelBalanceItem, DebankBalanceRecord],
         asset_type: AssetType = AssetType.AVAILABLE,
         is_wallet: bool = True,
         pool_info: Optional[PoolInfo] = None,
@@ -361,14 +684,32 @@ class DebankBalanceParser:
 
         return balance
 
-    def get_coin(self, balance_item: DebankModelBalanceItem) -> Coin:
+    def get_coin(
+        self, balance_item: Union[DebankModelBalanceItem, DebankBalanceRecord]
+    ) -> Coin:
+        # symbol picks native coins, e.g. ETH and PERP both use contract 'eth'
+        key = (
+            balance_item.chain,
+            balance_item.id,
+            balance_item.protocol_id,
+            self.get_symbol(balance_item),
+        )
+        if (coin := self._coins.get(key)) is None:
+            coin = self._build_coin(balance_item)
+            self._coins.set(key, coin)
+
+        return coin
+
+    def _build_coin(
+        self, balance_item: Union[DebankModelBalanceItem, DebankBalanceRecord]
+    ) -> Coin:
         contract = balance_item.id
         blockchain = get_blockchain_from_debank_chain(balance_item.chain)
         symbol = self.get_symbol(balance_item)
 
         coingecko_id = get_coingecko_id(contract, symbol)
 
-        coin = NATIVE_COIN_MAP.get((blockchain, coingecko_id))
+        coin = coin_index.get_by_coingecko_id(blockchain, coingecko_id)
         if coin and coin.protocol_id == balance_item.protocol_id:
             return coin
 
@@ -388,7 +729,9 @@ class DebankBalanceParser:
         )
 
     @staticmethod
-    def get_symbol(raw_balance: DebankModelBalanceItem) -> str:
+    def get_symbol(
+        raw_balance: Union[DebankModelBalanceItem, DebankBalanceRecord],
+    ) -> str:
         if raw_balance.optimized_symbol == MIST_SYMBOL:
             return MIST_SYMBOL
 
@@ -414,14 +757,15 @@ class DebankPortfolioParser:
         self._balance_parser = balance_parser
 
     def parse(self, response: Union[list, dict]) -> list[Pool]:
-        items = []
-        if response:
-            for item in response:
-                portfolio = DebankModelPortfolio(**item)
-                parsed = self.parse_items(portfolio)
-                items.extend(parsed)
+        return list(self.iter_parse(response or []))
 
-        return items
+    def iter_parse(self, response: Iterable[dict]) -> Iterator[Pool]:
+        """
+        Parse protocols one by one, e.g. as streamed by `iter_data`.
+        """
+        for item in response:
+            portfolio = DebankModelPortfolio(**item)
+            yield from self.parse_items(portfolio)
 
     def parse_items(self, raw_portfolio: DebankModelPortfolio) -> List[Pool]:
         root_protocol = self._protocol_parser.parse_item(raw_portfolio)
@@ -559,7 +903,7 @@ class DebankPortfolioParser:
 
     def _get_tokens(self, raw_balances: list[dict]):
         symbols = [
-            self._balance_parser.get_symbol(DebankModelBalanceItem(**b))
+            self._balance_parser.get_symbol(self._balance_parser.read_item(b))
             for b in raw_balances
         ]
 
@@ -688,7 +1032,7 @@ class DebankAppParser:
     ) -> list[BalanceItem]:
         balances = []
         for token in item.asset_token_list or []:
-            coin = symbol_to_coin_map.get(token.symbol)
+            coin = coin_index.get_by_symbol(token.symbol)
             if not coin:
                 logger.error(
                     f'No coin mapping found for app deposit token {token.symbol} in chain {chain}. Skipping.'
@@ -744,10 +1088,19 @@ class DebankApi(CustomizableBlockchainApi, BalanceMixin, IPortfolio):
         'get_protocol_for_address': (
             '/v1/user/protocol?id={address}&protocol_id={protocol_id}'
         ),
+        'get_used_chains': '/v1/user/used_chain_list?id={address}',
+    }
+
+    # used only when `response_cache` is set
+    cache_ttls = {
+        'get_chains': 24 * 60 * 60,
+        'get_protocols': 60 * 60,
     }
 
     default_protocol_cache = DebankProtocolCache()
 
+    CHAIN_CONCURRENCY = 8
+
     def __init__(
         self,
         api_key: str,
@@ -755,10 +1108,18 @@ class DebankApi(CustomizableBlockchainApi, BalanceMixin, IPortfolio):
         protocol_cache: Optional[DebankProtocolCache] = None,
         base_url: Optional[str] = None,
         sleep_provider: ISleepProvider = None,
+        balances_by_chain: bool = False,
+        chain_concurrency: Optional[int] = None,
     ):
+        """
+        With `balances_by_chain`, `fetch_balances` uses
+        `fetch_balances_by_chain` instead of the all chains endpoint.
+        """
         super().__init__(base_url=base_url, sleep_provider=sleep_provider)
 
         self._is_all = bool(is_all)
+        self._balances_by_chain = balances_by_chain
+        self._chain_concurrency = chain_concurrency or self.CHAIN_CONCURRENCY
         self._headers = {'AccessKey': api_key}
         self._protocol_cache = protocol_cache or self.default_protocol_cache
         self._balance_parser = DebankBalanceParser(self._protocol_cache)
@@ -771,6 +1132,9 @@ class DebankApi(CustomizableBlockchainApi, BalanceMixin, IPortfolio):
         self._app_parser = DebankAppParser()
 
     def fetch_balances(self, address: str) -> FetchResult:
+        if self._balances_by_chain:
+            return self.fetch_balances_by_chain(address)
+
         return self.get_data(
             'get_balance',
             headers=self._headers,
@@ -778,6 +1142,17 @@ class DebankApi(CustomizableBlockchainApi, BalanceMixin, IPortfolio):
             is_all=self._is_all,
         )
 
+    async def fetch_balances_async(self, address: str) -> FetchResult:
+        if self._balances_by_chain:
+            return await self.fetch_balances_by_chain_async(address)
+
+        return await self.get_data_async(
+            'get_balance',
+            headers=self._headers,
+            address=address,
+            is_all=self._is_all,
+        )
+
     def fetch_pools(self, address: str) -> FetchResult:
         return self.get_data(
             'get_portfolio',
@@ -785,6 +1160,13 @@ class DebankApi(CustomizableBlockchainApi, BalanceMixin, IPortfolio):
             address=address,
         )
 
+    async def fetch_pools_async(self, address: str) -> FetchResult:
+        return await self.get_data_async(
+            'get_portfolio',
+            headers=self._headers,
+            address=address,
+        )
+
     def fetch_debank_apps(self, address: str) -> FetchResult:
         return self.get_data(
             'get_complex_app_list',
@@ -801,6 +1183,78 @@ class DebankApi(CustomizableBlockchainApi, BalanceMixin, IPortfolio):
             is_all=self._is_all,
         )
 
+    async def fetch_token_list_for_chain_async(
+        self, address: str, chain_id: str
+    ) -> FetchResult:
+        return await self.get_data_async(
+            'get_token_list_for_chain',
+            headers=self._headers,
+            address=address,
+            chain_id=chain_id,
+            is_all=self._is_all,
+        )
+
+    def fetch_used_chains(self, address: str) -> FetchResult:
+        return self.get_data(
+            'get_used_chains',
+            headers=self._headers,
+            address=address,
+        )
+
+    async def fetch_used_chains_async(self, address: str) -> FetchResult:
+        return await self.get_data_async(
+            'get_used_chains',
+            headers=self._headers,
+            address=address,
+        )
+
+    def fetch_balances_by_chain(self, address: str) -> FetchResult:
+        """
+        Fetch balances chain by chain, up to `chain_concurrency` chains at
+        once, merged into one result for `parse_balances`. Only chains the
+        address was active on (`used_chain_list`) and known to
+        `DebankChainParser` are fetched. Failed chains are logged and kept
+        in `extra['failed_chains']`, not in `errors`, so the balances of the
+        others are still parsed; `parse_balances` reports them in its
+        `errors`.
+        """
+        used_chains = self.fetch_used_chains(address)
+        chain_ids = self._get_used_chain_ids(used_chains)
+        if chain_ids is None:
+            return used_chains
+
+        workers = max(min(self._chain_concurrency, len(chain_ids)), 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # in the caller's context, e.g. for request observers
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self.fetch_token_list_for_chain,
+                    address,
+                    chain_id,
+                )
+                for chain_id in chain_ids
+            ]
+            results = [f.result() for f in futures]
+
+        return self._merge_chain_results(chain_ids, results)
+
+    async def fetch_balances_by_chain_async(self, address: str) -> FetchResult:
+        """Asyncio variant of `fetch_balances_by_chain`."""
+        used_chains = await self.fetch_used_chains_async(address)
+        chain_ids = self._get_used_chain_ids(used_chains)
+        if chain_ids is None:
+            return used_chains
+
+        semaphore = asyncio.Semaphore(max(self._chain_concurrency, 1))
+
+        async def fetch(chain_id: str) -> FetchResult:
+            async with semaphore:
+                return await self.fetch_token_list_for_chain_async(address, chain_id)
+
+        results = await asyncio.gather(*(fetch(c) for c in chain_ids))
+        return self._merge_chain_results(chain_ids, results)
+
     def fetch_protocol_for_address(self, address: str, protocol_id: str) -> FetchResult:
         return self.get_data(
             'get_protocol_for_address',
@@ -826,7 +1280,10 @@ class DebankApi(CustomizableBlockchainApi, BalanceMixin, IPortfolio):
             return ParseResult(errors=[error])
 
         self._maybe_update_protocols()
-        return ParseResult(data=self._balance_parser.parse(fetch_result.data))
+        return ParseResult(
+            data=self._balance_parser.parse(fetch_result.data),
+            errors=(fetch_result.extra or {}).get('failed_chains'),
+        )
 
     def parse_pools(self, fetch_result: FetchResult) -> ParseResult:
         if error := self._get_error(fetch_result.data):
@@ -853,6 +1310,13 @@ class DebankApi(CustomizableBlockchainApi, BalanceMixin, IPortfolio):
 
         return self._protocol_parser.parse(response)
 
+    async def get_protocols_async(self) -> Dict[str, Protocol]:
+        response = await self.get_async('get_protocols', headers=self._headers)
+        if self._has_error(response):
+            return {}
+
+        return self._protocol_parser.parse(response)
+
     def parse_debank_apps(self, fetch_result: FetchResult) -> ParseResult:
         if error := self._get_error(fetch_result.data):
             return ParseResult(errors=[error])
@@ -875,6 +1339,47 @@ class DebankApi(CustomizableBlockchainApi, BalanceMixin, IPortfolio):
 
         return self._portfolio_parser.parse(response)
 
+    async def get_portfolio_async(self, address: str) -> List[Pool]:
+        await self._maybe_update_protocols_async()
+        response = await self.get_async(
+            'get_portfolio', headers=self._headers, address=address
+        )
+        if self._has_error(response):
+            return []
+
+        return self._portfolio_parser.parse(response)
+
+    def iter_portfolio(self, address: str) -> Iterator[Pool]:
+        """
+        Streaming variant of `get_portfolio`: pools are parsed while the
+        response is being read, so large portfolios aren't held in memory.
+        """
+        self._maybe_update_protocols()
+        items = self.iter_data('get_portfolio', headers=self._headers, address=address)
+        try:
+            yield from self._portfolio_parser.iter_parse(items)
+        except UnexpectedJsonValue as e:
+            if not self._has_error(e.value):
+                raise
+
+    async def iter_portfolio_async(self, address: str) -> AsyncIterator[Pool]:
+        await self._maybe_update_protocols_async()
+        items = self.iter_data_async(
+            'get_portfolio', headers=self._headers, address=address
+        )
+        try:
+            async for item in items:
+                for pool in self._portfolio_parser.iter_parse([item]):
+                    yield pool
+        except UnexpectedJsonValue as e:
+            if not self._has_error(e.value):
+                raise
+
+    async def get_balance_async(self, address: str) -> list[BalanceItem]:
+        # refresh protocols up front, so parse_balances doesn't block the loop
+        await self._maybe_update_protocols_async()
+        return await super().get_balance_async(address)
+
     def get_usage(self) -> Optional[DebankUsage]:
         response = self.get('usage', headers=self._headers)
         if self._has_error(response):
@@ -883,8 +1388,39 @@ class DebankApi(CustomizableBlockchainApi, BalanceMixin, IPortfolio):
         return self._usage_parser.parse(response)
 
     def _maybe_update_protocols(self):
-        if self._protocol_cache.needs_update():
-            self._protocol_cache.update(self.get_protocols())
+        self._protocol_cache.refresh(self.get_protocols)
+
+    async def _maybe_update_protocols_async(self):
+        await self._protocol_cache.refresh_async(self.get_protocols_async)
+
+    def _get_used_chain_ids(self, fetch_result: FetchResult) -> Optional[list[str]]:
+        """Ids of used chains to fetch, None if the lookup failed."""
+        if fetch_result.errors or self._get_error(fetch_result.data):
+            return None
+
+        return [
+            chain['id']
+            for chain in fetch_result.data or []
+            if get_blockchain_from_debank_chain(chain['id'])
+        ]
+
+    def _merge_chain_results(
+        self, chain_ids: list[str], results: list[FetchResult]
+    ) -> FetchResult:
+        data = []
+        failed = []
+        for chain_id, result in zip(chain_ids, results):
+            if error := result.errors or self._get_error(result.data):
+                logger.warning(
+                    'DeBank balances of chain %s failed: %s', chain_id, error
+                )
+                failed.append(dict(chain=chain_id, error=error))
+            else:
+                data.extend(result.data or [])
+
+        return FetchResult(
+            data=data, extra=dict(failed_chains=failed) if failed else None
+        )
 
     @staticmethod
     def _has_error(response: Union[List, Dict]) -> bool:
@@ -1,12 +1,4 @@
-# noinspection PyUnresolvedReferences
-from blockapi.v2.coins import *
-from blockapi.v2.models import (
-    AssetType,
-    Blockchain,
-    Coin,
-    CoingeckoId,
-    CoingeckoMapping,
-)
+from blockapi.v2.models import AssetType, Blockchain, CoingeckoId, CoingeckoMapping
 
 DEBANK_ASSET_TYPES = {
     'deposit': AssetType.DEPOSITED,
@@ -23,18 +15,6 @@ REWARD_ASSET_TYPE_MAP = {
     AssetType.LOCKED: AssetType.REWARDS,
 }
 
-ALL_COINS = [
-    var
-    for var_name, var in globals().items()
-    if isinstance(var, Coin) and var_name.startswith("COIN_")
-]
-
-NATIVE_COIN_MAP: dict[tuple[Blockchain, CoingeckoId], Coin] = {
-    (coin.blockchain, coin.info.coingecko_id): coin
-    for coin in ALL_COINS
-    if coin.info and coin.info.coingecko_id
-}
-
 # From DeBank API /v1/app_protocol/list endpoint (docs.cloud.debank.com)
 DEBANK_APP_CHAIN_MAP: dict[str, Blockchain] = {
     'hyperliquid': Blockchain.HYPERLIQUID,
@@ -122,3 +102,11 @@ COINGECKO_IDS_BY_CONTRACTS: list[CoingeckoMapping] = [
         symbol='WAN', coingecko_id=CoingeckoId.WANCHAIN, contracts={'wan'}
     ),
 ]
+
+# (DeBank contract, symbol) -> CoinGecko id, first mapping wins
+COINGECKO_ID_BY_CONTRACT: dict[tuple[str, str], CoingeckoId] = {}
+for _mapping in COINGECKO_IDS_BY_CONTRACTS:
+    for _contract in _mapping.contracts:
+        COINGECKO_ID_BY_CONTRACT.setdefault(
+            (_contract, _mapping.symbol), _mapping.coingecko_id
+        )
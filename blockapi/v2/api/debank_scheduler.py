@@ -0,0 +1,299 @@
+"""
+Unit-budget aware refresh of DeBank wallets.
+
+DeBank charges units per request. `DebankUnitTracker` counts the requests
+`DebankApi` makes by request method, and attributes their estimated units
+to the wallet being refreshed. `DebankScheduler` refreshes the most valuable
+and stalest wallets first, and refreshes fewer wallets when the remaining
+units (`DebankApi.get_usage`) run low.
+"""
+
+import contextvars
+import logging
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+import attr
+
+from blockapi.v2.api.debank import DebankApi
+from blockapi.v2.metrics import IRequestObserver, RequestMetrics
+from blockapi.v2.models import BalanceItem, ParseResult
+
+logger = logging.getLogger(__name__)
+
+# Estimated units per call; calibrated against `get_usage` by the scheduler,
+# override with `unit_costs` when the plan's prices are known.
+DEFAULT_UNIT_COSTS = {
+    'get_balance': 1.0,
+    'get_portfolio': 1.0,
+    'get_token_list_for_chain': 1.0,
+    'get_used_chains': 1.0,
+    'get_protocol_for_address': 1.0,
+    'get_complex_app_list': 1.0,
+    'get_protocols': 1.0,
+    'get_chains': 1.0,
+}
+
+_current_wallet = contextvars.ContextVar('debank_current_wallet', default=None)
+
+
+class DebankUnitTracker(IRequestObserver):
+    """
+    Estimated units consumed by request method and by wallet. Requests are
+    attributed to the wallet of the enclosing `wallet` block.
+    """
+
+    def __init__(
+        self,
+        unit_costs: Optional[dict[str, float]] = None,
+        default_cost: float = 1.0,
+    ):
+        self.unit_costs = {**DEFAULT_UNIT_COSTS, **(unit_costs or {})}
+        self.default_cost = default_cost
+        self.calls: dict[str, int] = defaultdict(int)
+        self.units: dict[str, float] = defaultdict(float)
+        self.wallet_units: dict[str, float] = defaultdict(float)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def wallet(self, address: str) -> Iterator[None]:
+        token = _current_wallet.set(address)
+        try:
+            yield
+        finally:
+            _current_wallet.reset(token)
+
+    def on_request(self, metrics: RequestMetrics) -> None:
+        units = self.unit_costs.get(metrics.request_method, self.default_cost)
+        with self._lock:
+            self.calls[metrics.request_method] += 1
+            self.units[metrics.request_method] += units
+            if (address := _current_wallet.get()) is not None:
+                self.wallet_units[address] += units
+
+    @property
+    def total_units(self) -> float:
+        with self._lock:
+            return sum(self.units.values())
+
+
+@attr.s(auto_attribs=True, slots=True)
+class WalletState:
+    address: str
+    value_usd: float = 0.0
+    min_interval: float = 0.0
+    refreshed_at: Optional[float] = None
+    refreshes: int = 0
+
+
+@attr.s(auto_attribs=True, slots=True, frozen=True)
+class WalletCost:
+    address: str
+    value_usd: float
+    refreshes: int
+    units: float
+    units_per_refresh: float
+
+
+class DebankScheduler:
+    """
+    Refreshes balances of registered wallets through `api`, in order of
+    priority: wallet value times time since its last refresh, never
+    refreshed wallets first. Wallets refreshed less than `min_interval`
+    seconds ago are not due.
+
+    Each `run_once` spends at most the remaining units above `reserve`,
+    and only `throttled_share` of them once fewer than `low_budget` units
+    remain. Remaining units are read with `get_usage` every
+    `usage_check_interval` seconds, estimated from tracked requests in
+    between; each check also calibrates the unit estimates.
+    """
+
+    def __init__(
+        self,
+        api: DebankApi,
+        reserve: float = 0.0,
+        low_budget: float = 100000.0,
+        throttled_share: float = 0.1,
+        usage_check_interval: float = 300.0,
+        unit_costs: Optional[dict[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.api = api
+        self.reserve = reserve
+        self.low_budget = low_budget
+        self.throttled_share = throttled_share
+        self.usage_check_interval = usage_check_interval
+        self.tracker = DebankUnitTracker(unit_costs)
+        # scoped to this api instance, observers are class-level by default
+        api.observers = [*api.observers, self.tracker]
+        self._clock = clock
+        self._wallets: dict[str, WalletState] = {}
+        self._lock = threading.Lock()
+        # (checked at, remaining units, tracked units then)
+        self._usage: Optional[tuple[float, float, float]] = None
+        # measured / estimated units
+        self.unit_scale = 1.0
+
+    def add_wallet(
+        self,
+        address: str,
+        value_usd: Optional[float] = None,
+        min_interval: Optional[float] = None,
+    ) -> None:
+        """Register a wallet or update its value or minimal refresh interval."""
+        with self._lock:
+            wallet = self._wallets.setdefault(address, WalletState(address))
+            if value_usd is not None:
+                wallet.value_usd = value_usd
+            if min_interval is not None:
+                wallet.min_interval = min_interval
+
+    def remove_wallet(self, address: str) -> None:
+        with self._lock:
+            self._wallets.pop(address, None)
+
+    def due_wallets(self) -> list[str]:
+        """Wallets due for refresh, most important first."""
+        now = self._clock()
+        with self._lock:
+            due = [
+                w
+                for w in self._wallets.values()
+                if w.refreshed_at is None or now - w.refreshed_at >= w.min_interval
+            ]
+
+        return [w.address for w in sorted(due, key=self._priority, reverse=True)]
+
+    def remaining_units(self) -> Optional[float]:
+        """Remaining units, None if unknown (usage lookup failed)."""
+        now = self._clock()
+        if self._usage is None or now - self._usage[0] >= self.usage_check_interval:
+            self._check_usage(now)
+
+        if self._usage is None:
+            return None
+
+        _, balance, tracked = self._usage
+        spent = (self.tracker.total_units - tracked) * self.unit_scale
+        return balance - spent
+
+    def refresh(self, address: str) -> ParseResult:
+        """
+        Fetch and parse balances of a wallet, updating its state. A failed
+        fetch keeps the wallet's value and refresh time, so it stays due.
+        """
+        with self.tracker.wallet(address):
+            fetch_result = self.api.fetch_balances(address)
+            if not fetch_result.errors:
+                parsed = self.api.parse_balances(fetch_result)
+
+        with self._lock:
+            wallet = self._wallets.setdefault(address, WalletState(address))
+            # units were spent either way
+            wallet.refreshes += 1
+            if fetch_result.errors:
+                return ParseResult(errors=fetch_result.errors)
+
+            wallet.refreshed_at = self._clock()
+            if not parsed.errors:
+                wallet.value_usd = self._get_value_usd(parsed.data or [])
+
+        return parsed
+
+    def run_once(self, max_wallets: Optional[int] = None) -> dict[str, ParseResult]:
+        """
+        Refresh due wallets by priority while the budget allows, returns
+        results by address.
+        """
+        allowance = self._get_allowance()
+        costs = {c.address: c.units_per_refresh for c in self.report() if c.refreshes}
+        results = {}
+        for address in self.due_wallets()[:max_wallets]:
+            cost = self._expected_cost(address, costs)
+            if allowance is not None:
+                if cost > allowance:
+                    logger.info('DeBank unit budget exhausted, %s postponed', address)
+                    break
+
+                allowance -= cost
+
+            results[address] = self.refresh(address)
+
+        return results
+
+    def report(self) -> list[WalletCost]:
+        """Units spent per wallet, most expensive first."""
+        with self._lock:
+            wallets = list(self._wallets.values())
+
+        costs = []
+        for wallet in wallets:
+            units = self.tracker.wallet_units.get(wallet.address, 0.0)
+            units *= self.unit_scale
+            costs.append(
+                WalletCost(
+                    address=wallet.address,
+                    value_usd=wallet.value_usd,
+                    refreshes=wallet.refreshes,
+                    units=units,
+                    units_per_refresh=(
+                        units / wallet.refreshes if wallet.refreshes else 0.0
+                    ),
+                )
+            )
+
+        return sorted(costs, key=lambda c: c.units, reverse=True)
+
+    def _priority(self, wallet: WalletState) -> float:
+        if wallet.refreshed_at is None:
+            return float('inf')
+
+        staleness = self._clock() - wallet.refreshed_at
+        return max(wallet.value_usd, 1.0) * staleness
+
+    def _get_allowance(self) -> Optional[float]:
+        if (remaining := self.remaining_units()) is None:
+            return None
+
+        allowance = max(remaining - self.reserve, 0.0)
+        if remaining < self.low_budget:
+            allowance *= self.throttled_share
+
+        return allowance
+
+    def _expected_cost(self, address: str, costs: dict[str, float]) -> float:
+        """Units per refresh measured for the wallet, or the highest one."""
+        if address in costs:
+            return costs[address]
+
+        if costs:
+            return max(costs.values())
+
+        return self.tracker.unit_costs['get_balance'] * self.unit_scale
+
+    def _check_usage(self, now: float) -> None:
+        usage = self.api.get_usage()
+        if usage is None:
+            return
+
+        balance = float(usage.balance)
+        tracked = self.tracker.total_units
+        if self._usage is not None:
+            _, previous_balance, previous_tracked = self._usage
+            estimated = tracked - previous_tracked
+            spent = previous_balance - balance
+            # a top-up makes the spent units meaningless
+            if estimated > 0 and spent > 0:
+                self.unit_scale = spent / estimated
+
+        self._usage = (now, balance, tracked)
+
+    @staticmethod
+    def _get_value_usd(balances: list[BalanceItem]) -> float:
+        return sum(
+            float(b.raw.get('price') or 0) * float(b.balance) for b in balances if b.raw
+        )
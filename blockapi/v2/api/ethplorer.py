@@ -3,6 +3,7 @@ from typing import Dict, Iterable, Optional
 from eth_utils import to_checksum_address
 
 from blockapi.v2.base import ApiOptions, BalanceMixin, BlockchainApi, ISleepProvider
+from blockapi.v2.coin_index import coin_index
 from blockapi.v2.coins import COIN_ETH
 from blockapi.v2.models import (
     BalanceItem,
@@ -84,7 +85,12 @@ class EthplorerApi(BlockchainApi, BalanceMixin):
                         if info.get('image')
                         else None
                     ),
-                    coingecko_id=info.get('coingecko'),
+                    coingecko_id=(
+                        info.get('coingecko')
+                        or coin_index.get_coingecko_id(
+                            self.api_options.blockchain, info['address']
+                        )
+                    ),
                     website=info.get('website'),
                 ),
             )
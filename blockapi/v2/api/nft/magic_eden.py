@@ -40,6 +40,7 @@ class MagicEdenApi(BlockchainApi, INftProvider, INftParser):
         blockchain=blockchain,
         base_url='https://api-mainnet.magiceden.dev/v2/',
         rate_limit=0.5,  # ~2 per second
+        enforce_rate_limit=True,
     )
 
     supported_requests = {
@@ -74,7 +75,6 @@ class MagicEdenApi(BlockchainApi, INftProvider, INftParser):
         items = []
 
         while True:
-            self.sleep_provider.sleep(self.base_url, self.api_options.rate_limit)
             data = self.get_data(
                 'get_nfts',
                 address=address,
@@ -138,8 +138,6 @@ class MagicEdenApi(BlockchainApi, INftProvider, INftParser):
 
     def fetch_collection(self, collection: str) -> FetchResult:
         while True:
-            self.sleep_provider.sleep(self.base_url, self.api_options.rate_limit)
-
             data = self.get_data(
                 'get_collection',
                 slug=collection,
@@ -193,7 +191,6 @@ class MagicEdenApi(BlockchainApi, INftProvider, INftParser):
         items = []
 
         while True:
-            self.sleep_provider.sleep(self.base_url, self.api_options.rate_limit)
             logger.info(f'get_pools: {collection} offset={offset} limit={limit}')
             data = self.get_data(
                 'get_pools', slug=collection, offset=offset, limit=limit
@@ -290,7 +287,6 @@ class MagicEdenApi(BlockchainApi, INftProvider, INftParser):
         items = []
 
         while True:
-            self.sleep_provider.sleep(self.base_url, self.api_options.rate_limit)
             data = self.get_data(
                 'get_listings',
                 slug=collection,
@@ -76,6 +76,7 @@ class OpenSeaApi(BlockchainApi, INftProvider, INftParser):
         blockchain=Blockchain.ETHEREUM,
         base_url='https://api.opensea.io/',
         rate_limit=0.75,  # 4 requests per 3 seconds
+        enforce_rate_limit=True,
     )
 
     supported_requests = {
@@ -263,7 +264,6 @@ class OpenSeaApi(BlockchainApi, INftProvider, INftParser):
         item_count = 0
 
         while True:
-            self.sleep_provider.sleep(self.base_url, self.api_options.rate_limit)
             page_count += 1
             logger.debug(f'Fetching page {page_count} of {key} from {cursor}')
             fetched, next_cursor = fetch_method(key, cursor)
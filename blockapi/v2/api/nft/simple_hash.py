@@ -70,6 +70,11 @@ class SimpleHashApi(BlockchainApi, INftProvider, INftParser):
         '&include_nft_details={include_nft_details}',
     }
 
+    # used only when `response_cache` is set
+    cache_ttls = {
+        'get_collection': 60 * 60,
+    }
+
     supported_blockchains_map = {}
 
     def __init__(self, blockchain, api_key, sleep_provider):
@@ -97,6 +102,18 @@ class SimpleHashApi(BlockchainApi, INftProvider, INftParser):
             extra=dict(address=address),
         )
 
+    async def fetch_nfts_async(
+        self, address: str, cursor: Optional[str] = None
+    ) -> FetchResult:
+        return await self.get_data_async(
+            'get_nfts',
+            headers=self.headers,
+            params=dict(cursor=cursor) if cursor else None,
+            chain=self.simplehash_blockchains,
+            address=address,
+            extra=dict(address=address),
+        )
+
     def parse_nfts(self, fetch_result: FetchResult) -> ParseResult:
         if not fetch_result or not fetch_result.data:
             return ParseResult(errors=fetch_result.errors if fetch_result else None)
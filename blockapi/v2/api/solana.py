@@ -1,11 +1,26 @@
-import json
+import asyncio
+import base64
+import hashlib
+import itertools
 import logging
-from typing import Optional, Union
-
-from cytoolz import reduceby
+import sqlite3
+import struct
+import threading
+import time
+from abc import ABC
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+import attr
+import base58
+from cytoolz import partition_all, reduceby
 from requests import Response
 from requests.exceptions import RequestException
 
+from blockapi.utils import json as json_codec
 from blockapi.utils.user_agent import get_random_user_agent
 from blockapi.v2.base import (
     ApiException,
@@ -16,6 +31,7 @@ from blockapi.v2.base import (
     InvalidAddressException,
     ISleepProvider,
 )
+from blockapi.v2.coin_index import coin_index
 from blockapi.v2.coins import COIN_SOL
 from blockapi.v2.models import (
     NFT_STANDARDS,
@@ -30,6 +46,321 @@ from blockapi.v2.models import (
 
 logger = logging.getLogger(__name__)
 
+# SPL Token account: mint, owner, amount (u64), Token-2022 accounts extend it
+_TOKEN_ACCOUNT = struct.Struct('<32s32sQ')
+
+
+@lru_cache(maxsize=65536)
+def _encode_pubkey(key: bytes) -> str:
+    return base58.b58encode(key).decode()
+
+
+class IDasAssetCache(ABC):
+    """
+    DAS asset metadata by mint. Mints unknown to DAS are stored as `{}`
+    (negative entries) and expire after the shorter `negative_ttl`, so they
+    are looked up again once metadata may have appeared. Supports the dict
+    operations `SolanaApi` uses, a plain dict works as an unbounded cache.
+    """
+
+    def __init__(self, ttl: float, negative_ttl: float):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+
+    def get(self, mint: str, default: Optional[dict] = None) -> Optional[dict]:
+        raise NotImplementedError
+
+    def update(self, assets: dict[str, dict]) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def items(self, limit: Optional[int] = None) -> list[tuple[str, dict]]:
+        """
+        Fresh entries, most recently used first.
+        """
+        raise NotImplementedError
+
+    def __contains__(self, mint: str) -> bool:
+        return self.get(mint) is not None
+
+    def __getitem__(self, mint: str) -> dict:
+        if (asset := self.get(mint)) is None:
+            raise KeyError(mint)
+
+        return asset
+
+    def __setitem__(self, mint: str, asset: dict) -> None:
+        self.update({mint: asset})
+
+    def load_snapshot(self, path: Union[str, Path]) -> int:
+        """
+        Pre-warm from a snapshot (JSON list of DAS assets), e.g. of the most
+        popular mints saved by another process. Returns count of assets.
+        """
+        assets = json_codec.loads(Path(path).read_bytes())
+        self.update({a['id']: a for a in assets if a.get('id')})
+        return len(assets)
+
+    def save_snapshot(self, path: Union[str, Path], limit: Optional[int] = None) -> int:
+        """
+        Save up to `limit` most recently used assets (negative entries
+        excluded) for `load_snapshot`. Returns count of assets.
+        """
+        assets = [asset for _, asset in self.items() if asset][:limit]
+        Path(path).write_text(json_codec.dumps(assets))
+        return len(assets)
+
+    def _expires_at(self, asset: dict) -> float:
+        return time.time() + (self.ttl if asset else self.negative_ttl)
+
+
+class DasAssetCache(IDasAssetCache):
+    """
+    Bounded in-memory LRU cache, thread-safe.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 100000,
+        ttl: float = 7 * 86400,
+        negative_ttl: float = 3600,
+    ):
+        super().__init__(ttl, negative_ttl)
+        self.max_entries = max_entries
+        self._data: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, mint: str, default: Optional[dict] = None) -> Optional[dict]:
+        with self._lock:
+            if (entry := self._data.get(mint)) is None:
+                return default
+
+            expires_at, asset = entry
+            if expires_at <= time.time():
+                del self._data[mint]
+                return default
+
+            self._data.move_to_end(mint)
+            return asset
+
+    def update(self, assets: dict[str, dict]) -> None:
+        with self._lock:
+            for mint, asset in assets.items():
+                self._data[mint] = (self._expires_at(asset), asset)
+                self._data.move_to_end(mint)
+
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def items(self, limit: Optional[int] = None) -> list[tuple[str, dict]]:
+        now = time.time()
+        with self._lock:
+            items = [
+                (mint, asset)
+                for mint, (expires_at, asset) in reversed(self._data.items())
+                if expires_at > now
+            ]
+
+        return items[:limit]
+
+    def __len__(self):
+        return len(self._data)
+
+
+class SqliteDasAssetCache(IDasAssetCache):
+    """
+    On-disk LRU cache, survives restarts and can be shared by worker
+    processes on the same host.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 1000000,
+        ttl: float = 7 * 86400,
+        negative_ttl: float = 3600,
+    ):
+        super().__init__(ttl, negative_ttl)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock, self._db:
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS das_assets ('
+                'mint TEXT PRIMARY KEY, asset TEXT, expires_at REAL, '
+                'accessed_at REAL)'
+            )
+            self._db.execute(
+                'CREATE INDEX IF NOT EXISTS das_assets_accessed_at '
+                'ON das_assets (accessed_at)'
+            )
+
+    def get(self, mint: str, default: Optional[dict] = None) -> Optional[dict]:
+        now = time.time()
+        with self._lock, self._db:
+            row = self._db.execute(
+                'SELECT asset, expires_at FROM das_assets WHERE mint = ?', (mint,)
+            ).fetchone()
+            if row is None:
+                return default
+
+            asset, expires_at = row
+            if expires_at <= now:
+                self._db.execute('DELETE FROM das_assets WHERE mint = ?', (mint,))
+                return default
+
+            self._db.execute(
+                'UPDATE das_assets SET accessed_at = ? WHERE mint = ?', (now, mint)
+            )
+
+        return json_codec.loads(asset)
+
+    def update(self, assets: dict[str, dict]) -> None:
+        now = time.time()
+        rows = [
+            (mint, json_codec.dumps(asset), self._expires_at(asset), now)
+            for mint, asset in assets.items()
+        ]
+        with self._lock, self._db:
+            self._db.executemany(
+                'INSERT OR REPLACE INTO das_assets VALUES (?, ?, ?, ?)', rows
+            )
+            self._db.execute(
+                'DELETE FROM das_assets WHERE mint IN ('
+                'SELECT mint FROM das_assets ORDER BY accessed_at DESC '
+                'LIMIT -1 OFFSET ?)',
+                (self.max_entries,),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._db:
+            self._db.execute('DELETE FROM das_assets')
+
+    def items(self, limit: Optional[int] = None) -> list[tuple[str, dict]]:
+        with self._lock:
+            rows = self._db.execute(
+                'SELECT mint, asset FROM das_assets WHERE expires_at > ? '
+                'ORDER BY accessed_at DESC LIMIT ?',
+                (time.time(), -1 if limit is None else limit),
+            ).fetchall()
+
+        return [(mint, json_codec.loads(asset)) for mint, asset in rows]
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute('SELECT COUNT(*) FROM das_assets').fetchone()[0]
+
+    def close(self) -> None:
+        self._db.close()
+
+
+class StakeAccountCache:
+    """
+    Stake accounts withdrawable by an owner, valid for the epoch they were
+    looked up in: delegations change at epoch boundaries. Owners without
+    stake accounts are cached too, so lookups for them are skipped for the
+    rest of the epoch. The current epoch is re-checked after
+    `epoch_check_interval` seconds. Bounded LRU, thread-safe.
+    """
+
+    def __init__(self, max_entries: int = 100000, epoch_check_interval: float = 300):
+        self.max_entries = max_entries
+        self.epoch_check_interval = epoch_check_interval
+        self._data: OrderedDict[str, tuple[int, list[str]]] = OrderedDict()
+        self._epoch: Optional[tuple[float, int]] = None
+        self._lock = threading.Lock()
+
+    def get(self, owner: str, epoch: int) -> Optional[list[str]]:
+        with self._lock:
+            if (entry := self._data.get(owner)) is None:
+                return None
+
+            if entry[0] != epoch:
+                del self._data[owner]
+                return None
+
+            self._data.move_to_end(owner)
+            return entry[1]
+
+    def set(self, owner: str, epoch: int, accounts: list[str]) -> None:
+        with self._lock:
+            self._data[owner] = (epoch, accounts)
+            self._data.move_to_end(owner)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def get_epoch(self) -> Optional[int]:
+        """Epoch seen within `epoch_check_interval`, if any."""
+        with self._lock:
+            if self._epoch is None:
+                return None
+
+            checked_at, epoch = self._epoch
+            if time.time() - checked_at > self.epoch_check_interval:
+                return None
+
+            return epoch
+
+    def set_epoch(self, epoch: int) -> None:
+        with self._lock:
+            self._epoch = (time.time(), epoch)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._epoch = None
+
+
+class TokenAccountStateCache:
+    """
+    Last seen slot and data hashes of token accounts by owner, for
+    incremental refresh. Bounded LRU, thread-safe.
+    """
+
+    def __init__(self, max_entries: int = 100000):
+        self.max_entries = max_entries
+        self._data: OrderedDict[str, tuple[int, dict[str, bytes]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, owner: str) -> Optional[tuple[int, dict[str, bytes]]]:
+        with self._lock:
+            if (entry := self._data.get(owner)) is not None:
+                self._data.move_to_end(owner)
+
+            return entry
+
+    def set(self, owner: str, slot: int, hashes: dict[str, bytes]) -> None:
+        with self._lock:
+            self._data[owner] = (slot, hashes)
+            self._data.move_to_end(owner)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+@attr.s(auto_attribs=True, slots=True, frozen=True)
+class TokenAccountChanges:
+    """
+    Token balances that moved since the previous refresh of an owner, by
+    token account address. Accounts closed or emptied are `removed`.
+    """
+
+    slot: int
+    added: dict[str, BalanceItem] = attr.ib(factory=dict)
+    changed: dict[str, BalanceItem] = attr.ib(factory=dict)
+    removed: list[str] = attr.ib(factory=list)
+    errors: Optional[list[str]] = None
+
 
 class SolanaApi(CustomizableBlockchainApi, BalanceMixin):
     """Solana JSON-RPC client with DAS metadata integration.
@@ -52,12 +383,27 @@ class SolanaApi(CustomizableBlockchainApi, BalanceMixin):
     To get full NFT coverage, use a dedicated NFT provider such as
     ``MagicEdenSolanaApi`` alongside this API.
 
+    Batching
+    --------
+    With ``batch_requests=True`` the independent calls of a balance fetch
+    (``getBalance``, both ``getTokenAccountsByOwner`` and the stake lookup)
+    go out as one JSON-RPC batch, and ``fetch_balances_many`` batches them
+    for many owners at once. The endpoint must support JSON-RPC batches.
+
+    Incremental refresh
+    -------------------
+    ``fetch_token_account_changes`` reports only token accounts added,
+    changed or removed since the previous call for the owner, so callers
+    re-parse and persist just the balances that moved.
+
     Caching architecture
     --------------------
     ``_das_cache`` is a **class-level** attribute shared across all instances.
     This is intentional: DAS metadata is global and rarely changes. Sharing it
     avoids redundant RPC calls when multiple ``SolanaApi`` instances coexist
-    (e.g. one per user request in a web service).
+    (e.g. one per user request in a web service). It's bounded (LRU) and
+    entries expire; pass ``das_cache=SqliteDasAssetCache(path)`` to share
+    metadata between worker processes and keep it across restarts.
     """
 
     # ── Configuration ──────────────────────────────────────────
@@ -79,11 +425,25 @@ class SolanaApi(CustomizableBlockchainApi, BalanceMixin):
     TOKEN_2022_PROGRAM_ID = 'TokenzQdBNbLqP5VEhdkAS6EPFLC1PHnBqCXEpPxuEb'
     STAKE_PROGRAM_ID = 'Stake11111111111111111111111111111111111111'
     STAKE_AUTHORITY_OFFSET = 44
+    STAKE_ACCOUNT_SIZE = 200
+    # Mint::decimals (u8)
+    MINT_DECIMALS_OFFSET = 44
+    # StakeStateV2::Stake delegation.stake (u64), zero for undelegated accounts
+    DELEGATED_STAKE_OFFSET = 156
+    MAX_MULTIPLE_ACCOUNTS = 100
     DAS_BATCH_SIZE = 1000
+    DAS_CONCURRENCY = 4
+    RPC_BATCH_SIZE = 100
     _JSONRPC_INVALID_PARAMS = -32602
 
     # Class-level cache: shared across instances to avoid redundant DAS RPCs.
-    _das_cache: dict[str, dict] = {}
+    _das_cache: IDasAssetCache = DasAssetCache()
+
+    # Class-level too, used by `filtered_stake_lookup`.
+    _stake_accounts = StakeAccountCache()
+
+    # Class-level, used by `fetch_token_account_changes`.
+    _token_account_states = TokenAccountStateCache()
 
     # ── Initialization ─────────────────────────────────────────
 
@@ -92,41 +452,220 @@ class SolanaApi(CustomizableBlockchainApi, BalanceMixin):
         base_url: Optional[str] = None,
         include_nfts: bool = False,
         sleep_provider: ISleepProvider = None,
+        batch_requests: bool = False,
+        das_cache: Optional[IDasAssetCache] = None,
+        das_concurrency: Optional[int] = None,
+        rate_limit: Optional[float] = None,
+        filtered_stake_lookup: bool = False,
+        skip_stake_addresses: Optional[Iterable[str]] = None,
+        binary_token_accounts: bool = False,
     ):
+        """
+        `das_concurrency` caps DAS chunks fetched at once. `rate_limit`
+        (seconds between requests) paces all requests, e.g. to stay within
+        the quota of the public endpoint; requests aren't paced by default.
+        The limiter is shared by clients of the same base URL and pacing.
+
+        `filtered_stake_lookup` fetches only the delegated amount of stake
+        accounts and remembers them per owner for the epoch, later fetches
+        in the epoch read just those accounts. Stake lookup is skipped for
+        `skip_stake_addresses`, e.g. owners known to have no stake.
+
+        `binary_token_accounts` requests token accounts base64 encoded and
+        decodes them locally, a fraction of the jsonParsed payload. The
+        accounts don't carry decimals, mints without DAS metadata get them
+        from their mint accounts.
+        """
         super().__init__(base_url, sleep_provider=sleep_provider)
         self.include_nfts = include_nfts
-        self._request_id = 0
+        self.batch_requests = batch_requests
+        if das_cache is not None:
+            self._das_cache = das_cache
+        self.das_concurrency = das_concurrency or self.DAS_CONCURRENCY
+        if rate_limit is not None:
+            self.api_options = attr.evolve(
+                self.api_options, rate_limit=rate_limit, enforce_rate_limit=True
+            )
+        self.filtered_stake_lookup = filtered_stake_lookup
+        self.skip_stake_addresses = frozenset(skip_stake_addresses or ())
+        self.binary_token_accounts = binary_token_accounts
+        self._request_ids = itertools.count(1)
 
     # ── Balance API ────────────────────────────────────────────
 
     def fetch_balances(self, address: str) -> FetchResult:
-        """Fetch native SOL, token accounts, DAS metadata, and staking data."""
-        sol_response = self._request('getBalance', [address])
+        """
+        Fetch native SOL, token accounts, DAS metadata, and staking data.
+        Mints whose DAS metadata couldn't be fetched are listed in
+        `extra['das_errors']`, their balances are still parsed as plain SPL
+        tokens.
+        """
+        if self.batch_requests:
+            calls, staking = self._balance_calls([address])
+            results, mints = self._split_balance_responses(
+                [address], staking, self._request_batch(calls), raise_errors=True
+            )
+            das_errors, decimals = self._fetch_mint_metadata(mints)
+            return self._finish_balances_result(results[address], das_errors, decimals)
 
+        sol_response = self._request('getBalance', [address])
         raw_token_balances = self._request(
-            'getTokenAccountsByOwner',
-            [
-                address,
-                {'programId': self.TOKEN_PROGRAM_ID},
-                {'encoding': 'jsonParsed'},
-            ],
+            *self._token_accounts_request(address, self.TOKEN_PROGRAM_ID)
         )
         raw_token2022_balances = self._request(
-            'getTokenAccountsByOwner',
-            [
-                address,
-                {'programId': self.TOKEN_2022_PROGRAM_ID},
-                {'encoding': 'jsonParsed'},
-            ],
+            *self._token_accounts_request(address, self.TOKEN_2022_PROGRAM_ID)
         )
 
         mint_addresses = self._collect_mint_addresses(
             raw_token_balances, raw_token2022_balances
         )
-        self._fetch_das_assets(mint_addresses)
+        das_errors, decimals = self._fetch_mint_metadata(mint_addresses)
 
         raw_staked_sol = self._fetch_staked_sol(address)
 
+        fetch_result = self._build_balances_result(
+            sol_response, raw_token_balances, raw_token2022_balances, raw_staked_sol
+        )
+        return self._finish_balances_result(fetch_result, das_errors, decimals)
+
+    async def fetch_balances_async(self, address: str) -> FetchResult:
+        """Asyncio variant of `fetch_balances`; independent calls run concurrently."""
+        if self.batch_requests:
+            calls, staking = self._balance_calls([address])
+            responses = await self._request_batch_async(calls)
+            results, mints = self._split_balance_responses(
+                [address], staking, responses, raise_errors=True
+            )
+            das_errors, decimals = await self._fetch_mint_metadata_async(mints)
+            return self._finish_balances_result(results[address], das_errors, decimals)
+
+        (
+            sol_response,
+            raw_token_balances,
+            raw_token2022_balances,
+            raw_staked_sol,
+        ) = await asyncio.gather(
+            self._request_async('getBalance', [address]),
+            self._request_async(
+                *self._token_accounts_request(address, self.TOKEN_PROGRAM_ID)
+            ),
+            self._request_async(
+                *self._token_accounts_request(address, self.TOKEN_2022_PROGRAM_ID)
+            ),
+            self._fetch_staked_sol_async(address),
+        )
+
+        mint_addresses = self._collect_mint_addresses(
+            raw_token_balances, raw_token2022_balances
+        )
+        das_errors, decimals = await self._fetch_mint_metadata_async(mint_addresses)
+
+        fetch_result = self._build_balances_result(
+            sol_response, raw_token_balances, raw_token2022_balances, raw_staked_sol
+        )
+        return self._finish_balances_result(fetch_result, das_errors, decimals)
+
+    def fetch_balances_many(self, addresses: list[str]) -> dict[str, FetchResult]:
+        """
+        Fetch balances of many owners at once: their RPC calls go out in
+        JSON-RPC batches and DAS metadata is fetched once for all mints.
+        RPC errors of an address (e.g. invalid address) don't fail the
+        others, they're reported in its `FetchResult.errors`, as are mints
+        whose metadata couldn't be fetched.
+        """
+        addresses = list(dict.fromkeys(addresses))
+        calls, staking = self._balance_calls(addresses)
+        results, mints = self._split_balance_responses(
+            addresses, staking, self._request_batch(calls)
+        )
+        das_errors, decimals = self._fetch_mint_metadata(mints)
+        return {
+            a: self._finish_balances_result(r, das_errors, decimals)
+            for a, r in results.items()
+        }
+
+    async def fetch_balances_many_async(
+        self, addresses: list[str]
+    ) -> dict[str, FetchResult]:
+        """Asyncio variant of `fetch_balances_many`."""
+        addresses = list(dict.fromkeys(addresses))
+        calls, staking = self._balance_calls(addresses)
+        results, mints = self._split_balance_responses(
+            addresses, staking, await self._request_batch_async(calls)
+        )
+        das_errors, decimals = await self._fetch_mint_metadata_async(mints)
+        return {
+            a: self._finish_balances_result(r, das_errors, decimals)
+            for a, r in results.items()
+        }
+
+    def _balance_calls(
+        self, addresses: list[str]
+    ) -> tuple[list[tuple[str, list]], list[str]]:
+        """
+        Independent RPC calls of balance fetches for batching: three per
+        address, then stake lookups of addresses not skipped. Returns the
+        calls and addresses with stake lookup.
+        """
+        calls = []
+        for address in addresses:
+            calls.append(('getBalance', [address]))
+            calls.append(self._token_accounts_request(address, self.TOKEN_PROGRAM_ID))
+            calls.append(
+                self._token_accounts_request(address, self.TOKEN_2022_PROGRAM_ID)
+            )
+
+        staking = [a for a in addresses if a not in self.skip_stake_addresses]
+        calls.extend(self._staked_sol_request(address) for address in staking)
+        return calls, staking
+
+    def _token_accounts_request(
+        self, address: str, program_id: str
+    ) -> tuple[str, list]:
+        encoding = 'base64' if self.binary_token_accounts else 'jsonParsed'
+        return (
+            'getTokenAccountsByOwner',
+            [address, {'programId': program_id}, {'encoding': encoding}],
+        )
+
+    def _split_balance_responses(
+        self,
+        addresses: list[str],
+        staking: list[str],
+        responses: list[dict],
+        raise_errors: bool = False,
+    ) -> tuple[dict[str, FetchResult], list[str]]:
+        """
+        Build fetch result of each address from responses of its
+        `_balance_calls`, collect mints of all addresses.
+        """
+        split = 3 * len(addresses)
+        stakes = dict(zip(staking, responses[split:]))
+        results = {}
+        mints = []
+        for address, group in zip(addresses, partition_all(3, responses[:split])):
+            group = (*group, stakes.get(address, {'result': []}))
+            if errors := [r['error'] for r in group if 'error' in r]:
+                if raise_errors:
+                    self._raise_rpc_error(errors[0])
+
+                results[address] = FetchResult(
+                    errors=[e.get('message', '') for e in errors]
+                )
+                continue
+
+            mints.extend(self._collect_mint_addresses(group[1], group[2]))
+            results[address] = self._build_balances_result(*group)
+
+        return results, mints
+
+    @staticmethod
+    def _build_balances_result(
+        sol_response: dict,
+        raw_token_balances: dict,
+        raw_token2022_balances: dict,
+        raw_staked_sol: dict,
+    ) -> FetchResult:
         return FetchResult(
             data=sol_response,
             extra=dict(
@@ -138,6 +677,9 @@ class SolanaApi(CustomizableBlockchainApi, BalanceMixin):
 
     def parse_balances(self, fetch_result: FetchResult) -> ParseResult:
         """Parse fetched data into a list of BalanceItems."""
+        if fetch_result.errors and not fetch_result.extra:
+            return ParseResult(errors=fetch_result.errors)
+
         raw_staked_sol = fetch_result.extra['raw_staked_sol']
 
         balances = []
@@ -151,6 +693,7 @@ class SolanaApi(CustomizableBlockchainApi, BalanceMixin):
                 self._parse_rent_reserve(staked_sol_balance, raw_staked_sol)
             )
 
+        mint_decimals = fetch_result.extra.get('mint_decimals') or {}
         all_raw_tokens = (
             fetch_result.extra['raw_token_balances']['result']['value']
             + fetch_result.extra['raw_token2022_balances']['result']['value']
@@ -158,13 +701,14 @@ class SolanaApi(CustomizableBlockchainApi, BalanceMixin):
         token_balances = [
             b
             for raw in all_raw_tokens
-            if (b := self._parse_token_balance(raw)) is not None
+            if (b := self._parse_token_balance(raw, mint_decimals)) is not None
         ]
 
         if token_balances:
             balances.extend(self.merge_balances_with_same_coin(token_balances))
 
-        return ParseResult(data=balances)
+        errors = (fetch_result.errors or []) + fetch_result.extra.get('das_errors', [])
+        return ParseResult(data=balances, errors=errors or None)
 
     def get_coin(self, fetch_params: tuple[str, int]) -> Coin:
         """Fetch and build a Coin for a given contract address and decimals."""
@@ -185,6 +729,167 @@ class SolanaApi(CustomizableBlockchainApi, BalanceMixin):
             ).values()
         )
 
+    # ── Incremental refresh ────────────────────────────────────
+
+    def fetch_token_account_changes(self, address: str) -> FetchResult:
+        """
+        Token accounts of the owner added, changed or removed since its
+        previous call, compared by hashes of their data remembered per
+        owner; the first call reports all accounts as added. Metadata is
+        fetched for mints of added and changed accounts only. A response
+        from a node behind the remembered slot reports no changes. Parse
+        with `parse_token_account_changes`.
+        """
+        calls = self._token_account_calls(address)
+        if self.batch_requests:
+            responses = self._request_batch(calls)
+            self._raise_first_rpc_error(responses)
+        else:
+            responses = [self._request(*call) for call in calls]
+
+        fetch_result, state = self._diff_token_accounts(address, responses)
+        mints = self._changed_mints(fetch_result)
+        das_errors, decimals = self._fetch_mint_metadata(mints)
+        fetch_result = self._finish_changes_result(
+            fetch_result, mints, das_errors, decimals
+        )
+        # only once the changes are complete, a failure reports them again
+        self._commit_token_account_state(address, state)
+        return fetch_result
+
+    async def fetch_token_account_changes_async(self, address: str) -> FetchResult:
+        """Asyncio variant of `fetch_token_account_changes`."""
+        calls = self._token_account_calls(address)
+        if self.batch_requests:
+            responses = await self._request_batch_async(calls)
+            self._raise_first_rpc_error(responses)
+        else:
+            responses = await asyncio.gather(
+                *(self._request_async(*call) for call in calls)
+            )
+
+        fetch_result, state = self._diff_token_accounts(address, responses)
+        mints = self._changed_mints(fetch_result)
+        das_errors, decimals = await self._fetch_mint_metadata_async(mints)
+        fetch_result = self._finish_changes_result(
+            fetch_result, mints, das_errors, decimals
+        )
+        self._commit_token_account_state(address, state)
+        return fetch_result
+
+    def parse_token_account_changes(
+        self, fetch_result: FetchResult
+    ) -> TokenAccountChanges:
+        """Parse changed token accounts into BalanceItems."""
+        mint_decimals = fetch_result.extra.get('mint_decimals') or {}
+
+        def parse(accounts: dict[str, dict]) -> dict[str, BalanceItem]:
+            return {
+                pubkey: b
+                for pubkey, raw in accounts.items()
+                if (b := self._parse_token_balance(raw, mint_decimals)) is not None
+            }
+
+        return TokenAccountChanges(
+            slot=fetch_result.data['slot'],
+            added=parse(fetch_result.data['added']),
+            changed=parse(fetch_result.data['changed']),
+            removed=fetch_result.data['removed'],
+            errors=fetch_result.errors,
+        )
+
+    def _token_account_calls(self, address: str) -> list[tuple[str, list]]:
+        return [
+            self._token_accounts_request(address, self.TOKEN_PROGRAM_ID),
+            self._token_accounts_request(address, self.TOKEN_2022_PROGRAM_ID),
+        ]
+
+    def _raise_first_rpc_error(self, responses: list[dict]) -> None:
+        if errors := [r['error'] for r in responses if 'error' in r]:
+            self._raise_rpc_error(errors[0])
+
+    def _diff_token_accounts(
+        self, owner: str, responses: list[dict]
+    ) -> tuple[FetchResult, Optional[tuple[int, dict[str, bytes]]]]:
+        """
+        Compare token accounts with the owner's state; returns the changes
+        and the new state to commit, None if there's nothing to commit.
+        """
+        slot = min(r['result'].get('context', {}).get('slot', 0) for r in responses)
+        previous_slot, previous = self._token_account_states.get(owner) or (-1, {})
+        if slot < previous_slot:
+            logger.debug('Node at slot %d is behind slot %d', slot, previous_slot)
+            fetch_result = FetchResult(
+                data=dict(slot=previous_slot, added={}, changed={}, removed=[]),
+                extra={},
+            )
+            return fetch_result, None
+
+        hashes = {}
+        added, changed = {}, {}
+        for response in responses:
+            for account in response['result'].get('value', []):
+                mint, amount, _ = self._read_token_account(account)
+                if not amount or not mint:
+                    continue
+
+                pubkey = account['pubkey']
+                hashes[pubkey] = digest = self._hash_account_data(account)
+                if pubkey not in previous:
+                    added[pubkey] = account
+                elif previous[pubkey] != digest:
+                    changed[pubkey] = account
+
+        fetch_result = FetchResult(
+            data=dict(
+                slot=slot,
+                added=added,
+                changed=changed,
+                removed=[p for p in previous if p not in hashes],
+            ),
+            extra={},
+        )
+        return fetch_result, (slot, hashes)
+
+    def _commit_token_account_state(
+        self, owner: str, state: Optional[tuple[int, dict[str, bytes]]]
+    ) -> None:
+        if state is not None:
+            self._token_account_states.set(owner, *state)
+
+    @staticmethod
+    def _hash_account_data(account: dict) -> bytes:
+        data = account['account']['data']
+        if isinstance(data, list):
+            data = data[0]
+        else:
+            data = json_codec.dumps(data)
+
+        return hashlib.blake2b(data.encode(), digest_size=16).digest()
+
+    def _changed_mints(self, fetch_result: FetchResult) -> list[str]:
+        return [
+            mint
+            for accounts in (fetch_result.data['added'], fetch_result.data['changed'])
+            for account in accounts.values()
+            if (mint := self._read_token_account(account)[0])
+        ]
+
+    @staticmethod
+    def _finish_changes_result(
+        fetch_result: FetchResult,
+        mints: list[str],
+        das_errors: dict[str, str],
+        mint_decimals: dict[str, int],
+    ) -> FetchResult:
+        if mint_decimals:
+            fetch_result.extra['mint_decimals'] = mint_decimals
+
+        if errors := [das_errors[m] for m in dict.fromkeys(mints) if m in das_errors]:
+            fetch_result.errors = errors
+
+        return fetch_result
+
     # ── Token processing ───────────────────────────────────────
 
     def _collect_mint_addresses(self, *token_responses: dict) -> list[str]:
@@ -192,19 +897,23 @@ class SolanaApi(CustomizableBlockchainApi, BalanceMixin):
         mints = []
         for response in token_responses:
             for account in response.get('result', {}).get('value', []):
-                info = self._extract_token_info(account)
-                amount = int(info.get('tokenAmount', {}).get('amount', 0))
-                mint = info.get('mint')
+                mint, amount, _ = self._read_token_account(account)
                 if amount > 0 and mint:
                     mints.append(mint)
         return mints
 
     def _resolve_coin(self, mint: str, decimals: int) -> Coin:
-        """Resolve a Coin for a mint address, trying DAS cache first."""
+        """
+        Resolve a Coin for a mint address, trying DAS cache first, then
+        the known coins.
+        """
         if das_asset := self._das_cache.get(mint):
             if coin := self._build_coin_from_das_asset(das_asset):
                 return coin
 
+        if coin := coin_index.get_by_contract(Blockchain.SOLANA, mint):
+            return coin
+
         return Coin.from_api(
             blockchain=Blockchain.SOLANA,
             decimals=decimals,
@@ -212,16 +921,20 @@ class SolanaApi(CustomizableBlockchainApi, BalanceMixin):
             standards=['SPL'],
         )
 
-    def _parse_token_balance(self, raw: dict) -> Optional[BalanceItem]:
-        """Parse a single token account into a BalanceItem."""
-        info = self._extract_token_info(raw)
-        token_amount = info.get('tokenAmount', {})
-        balance_raw = int(token_amount.get('amount', 0))
+    def _parse_token_balance(
+        self, raw: dict, mint_decimals: Optional[dict[str, int]] = None
+    ) -> Optional[BalanceItem]:
+        """
+        Parse a single token account into a BalanceItem. `mint_decimals`
+        are used for base64 accounts, which don't carry decimals.
+        """
+        mint, balance_raw, decimals = self._read_token_account(raw)
         if balance_raw == 0:
             return None
 
-        mint = info.get('mint')
-        decimals = int(token_amount.get('decimals', 0))
+        if decimals is None:
+            decimals = (mint_decimals or {}).get(mint, 0)
+
         coin = self._resolve_coin(mint, decimals)
 
         if coin.is_nft and not self.include_nfts:
@@ -236,6 +949,31 @@ class SolanaApi(CustomizableBlockchainApi, BalanceMixin):
             raw=raw,
         )
 
+    def _read_token_account(
+        self, account: dict
+    ) -> tuple[Optional[str], int, Optional[int]]:
+        """
+        Mint, raw amount and decimals of a token account, either jsonParsed
+        or base64 encoded; the latter has no decimals (None).
+        """
+        data = account.get('account', {}).get('data')
+        if isinstance(data, list):
+            # [base64 data, 'base64'], Token-2022 extensions follow the base
+            raw = base64.b64decode(data[0])
+            if len(raw) < _TOKEN_ACCOUNT.size:
+                return None, 0, None
+
+            mint, _, amount = _TOKEN_ACCOUNT.unpack_from(raw)
+            return _encode_pubkey(mint), amount, None
+
+        info = self._extract_token_info(account)
+        token_amount = info.get('tokenAmount', {})
+        return (
+            info.get('mint'),
+            int(token_amount.get('amount', 0)),
+            int(token_amount.get('decimals', 0)),
+        )
+
     @staticmethod
     def _extract_token_info(account: dict) -> dict:
         """Extract parsed token info from an account response."""
@@ -243,38 +981,177 @@ class SolanaApi(CustomizableBlockchainApi, BalanceMixin):
             account.get('account', {}).get('data', {}).get('parsed', {}).get('info', {})
         )
 
+    # ── Mint metadata ──────────────────────────────────────────
+
+    def _fetch_mint_metadata(
+        self, mint_addresses: list[str]
+    ) -> tuple[dict[str, str], dict[str, int]]:
+        """
+        Fetch DAS metadata of mints, and with `binary_token_accounts` the
+        decimals of mints DAS doesn't know. Returns DAS errors by mint and
+        decimals by mint.
+        """
+        das_errors = self._fetch_das_assets(mint_addresses)
+        decimals = {}
+        for chunk in self._mint_decimals_chunks(mint_addresses):
+            response = self._request(*self._mint_decimals_request(chunk))
+            decimals.update(self._parse_mint_decimals(chunk, response))
+
+        return das_errors, decimals
+
+    async def _fetch_mint_metadata_async(
+        self, mint_addresses: list[str]
+    ) -> tuple[dict[str, str], dict[str, int]]:
+        """Asyncio variant of `_fetch_mint_metadata`."""
+        das_errors = await self._fetch_das_assets_async(mint_addresses)
+        chunks = self._mint_decimals_chunks(mint_addresses)
+        responses = await asyncio.gather(
+            *(self._request_async(*self._mint_decimals_request(c)) for c in chunks)
+        )
+        decimals = {}
+        for chunk, response in zip(chunks, responses):
+            decimals.update(self._parse_mint_decimals(chunk, response))
+
+        return das_errors, decimals
+
+    def _mint_decimals_chunks(self, mint_addresses: list[str]) -> list[tuple]:
+        """Mints needing decimals from their mint account, in request-sized chunks."""
+        if not self.binary_token_accounts:
+            return []
+
+        missing = dict.fromkeys(m for m in mint_addresses if not self._das_cache.get(m))
+        return list(partition_all(self.MAX_MULTIPLE_ACCOUNTS, missing))
+
+    def _mint_decimals_request(self, mints: tuple) -> tuple[str, list]:
+        return (
+            'getMultipleAccounts',
+            [
+                list(mints),
+                {
+                    'encoding': 'base64',
+                    'dataSlice': {'offset': self.MINT_DECIMALS_OFFSET, 'length': 1},
+                },
+            ],
+        )
+
+    @staticmethod
+    def _parse_mint_decimals(mints: tuple, response: dict) -> dict[str, int]:
+        values = response.get('result', {}).get('value') or []
+        return {
+            mint: raw[0]
+            for mint, account in zip(mints, values)
+            if account and (raw := base64.b64decode(account['data'][0]))
+        }
+
+    def _finish_balances_result(
+        self,
+        fetch_result: FetchResult,
+        das_errors: dict[str, str],
+        mint_decimals: dict[str, int],
+    ) -> FetchResult:
+        if mint_decimals and fetch_result.extra:
+            fetch_result.extra['mint_decimals'] = mint_decimals
+
+        return self._add_das_errors(fetch_result, das_errors)
+
     # ── DAS integration ────────────────────────────────────────
 
-    def _fetch_das_assets(self, mint_addresses: list[str]) -> None:
-        """Batch-fetch token metadata via DAS and populate cache."""
+    def _fetch_das_assets(self, mint_addresses: list[str]) -> dict[str, str]:
+        """
+        Batch-fetch token metadata via DAS and populate cache, up to
+        `das_concurrency` chunks at once. Returns errors by mint for chunks
+        that failed; successful chunks are kept.
+        """
+        chunks = self._uncached_das_chunks(mint_addresses)
+        if len(chunks) <= 1 or self.das_concurrency <= 1:
+            results = [self._fetch_das_chunk(chunk) for chunk in chunks]
+        else:
+            workers = min(self.das_concurrency, len(chunks))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(self._fetch_das_chunk, chunks))
+
+        return {mint: error for errors in results for mint, error in errors.items()}
+
+    async def _fetch_das_assets_async(
+        self, mint_addresses: list[str]
+    ) -> dict[str, str]:
+        """Asyncio variant of `_fetch_das_assets`."""
+        semaphore = asyncio.Semaphore(max(self.das_concurrency, 1))
+
+        async def fetch(chunk: list[str]) -> dict[str, str]:
+            async with semaphore:
+                return await self._fetch_das_chunk_async(chunk)
+
+        results = await asyncio.gather(
+            *(fetch(chunk) for chunk in self._uncached_das_chunks(mint_addresses))
+        )
+        return {mint: error for errors in results for mint, error in errors.items()}
+
+    def _fetch_das_chunk(self, chunk: list[str]) -> dict[str, str]:
+        try:
+            response = self._request('getAssetBatch', self._das_batch_params(chunk))
+        except (ApiException, RequestException) as e:
+            return self._das_chunk_failed(chunk, e)
+
+        self._store_das_assets(chunk, response)
+        return {}
+
+    async def _fetch_das_chunk_async(self, chunk: list[str]) -> dict[str, str]:
+        try:
+            response = await self._request_async(
+                'getAssetBatch', self._das_batch_params(chunk)
+            )
+        except (ApiException, RequestException) as e:
+            return self._das_chunk_failed(chunk, e)
+
+        self._store_das_assets(chunk, response)
+        return {}
+
+    @staticmethod
+    def _das_chunk_failed(chunk: list[str], error: Exception) -> dict[str, str]:
+        logger.warning('DAS getAssetBatch failed for %d mints: %s', len(chunk), error)
+        return {mint: f'DAS metadata of {mint} unavailable: {error}' for mint in chunk}
+
+    def _add_das_errors(
+        self, fetch_result: FetchResult, das_errors: dict[str, str]
+    ) -> FetchResult:
+        """List mints of the fetch result whose metadata failed in its extra."""
+        if not das_errors or not fetch_result.extra:
+            return fetch_result
+
+        mints = self._collect_mint_addresses(
+            fetch_result.extra['raw_token_balances'],
+            fetch_result.extra['raw_token2022_balances'],
+        )
+        if errors := [das_errors[m] for m in dict.fromkeys(mints) if m in das_errors]:
+            fetch_result.extra['das_errors'] = errors
+
+        return fetch_result
+
+    def _uncached_das_chunks(self, mint_addresses: list[str]) -> list[list[str]]:
+        """Split mints missing from the DAS cache into batch-sized chunks."""
         uncached = list(
             dict.fromkeys(m for m in mint_addresses if m not in self._das_cache)
         )
-        if not uncached:
-            return
+        return [
+            uncached[i : i + self.DAS_BATCH_SIZE]
+            for i in range(0, len(uncached), self.DAS_BATCH_SIZE)
+        ]
 
-        for i in range(0, len(uncached), self.DAS_BATCH_SIZE):
-            chunk = uncached[i : i + self.DAS_BATCH_SIZE]
-            try:
-                response = self._request(
-                    'getAssetBatch',
-                    {'ids': chunk, 'options': {'showFungible': True}},
-                )
-            except (ApiException, RequestException) as e:
-                logger.warning('DAS getAssetBatch failed: %s', e)
+    @staticmethod
+    def _das_batch_params(chunk: list[str]) -> dict:
+        return {'ids': chunk, 'options': {'showFungible': True}}
+
+    def _store_das_assets(self, chunk: list[str], response: dict) -> None:
+        """Cache assets returned for a chunk; unknown mints get an empty entry."""
+        assets = dict.fromkeys(chunk, {})
+        for asset in response.get('result', []):
+            if asset is None:
                 continue
+            if mint := asset.get('id'):
+                assets[mint] = asset
 
-            results = response.get('result', [])
-            for asset in results:
-                if asset is None:
-                    continue
-                if mint := asset.get('id'):
-                    self._das_cache[mint] = asset
-
-            returned = {asset['id'] for asset in results if asset and asset.get('id')}
-            for mint in chunk:
-                if mint not in self._das_cache:
-                    self._das_cache[mint] = {}
+        self._das_cache.update(assets)
 
     def _build_coin_from_das_asset(self, asset: dict) -> Optional[Coin]:
         """Build a Coin from a DAS asset response."""
@@ -314,26 +1191,117 @@ class SolanaApi(CustomizableBlockchainApi, BalanceMixin):
 
     def _fetch_staked_sol(self, address: str) -> dict:
         """Fetch staked SOL accounts for a given address."""
-        return self._request(
-            method='getProgramAccounts',
-            params=[
+        if address in self.skip_stake_addresses:
+            return {'result': []}
+
+        if not self.filtered_stake_lookup:
+            return self._request(*self._staked_sol_request(address))
+
+        if (epoch := self._stake_accounts.get_epoch()) is None:
+            epoch = self._request('getEpochInfo', [])['result']['epoch']
+            self._stake_accounts.set_epoch(epoch)
+
+        accounts = self._stake_accounts.get(address, epoch)
+        if accounts is None or len(accounts) > self.MAX_MULTIPLE_ACCOUNTS:
+            response = self._request(*self._staked_sol_request(address))
+            self._remember_stake_accounts(address, epoch, response)
+            return response
+
+        if not accounts:
+            return {'result': []}
+
+        response = self._request(*self._stake_accounts_request(accounts))
+        return self._as_program_accounts(accounts, response)
+
+    async def _fetch_staked_sol_async(self, address: str) -> dict:
+        """Asyncio variant of `_fetch_staked_sol`."""
+        if address in self.skip_stake_addresses:
+            return {'result': []}
+
+        if not self.filtered_stake_lookup:
+            return await self._request_async(*self._staked_sol_request(address))
+
+        if (epoch := self._stake_accounts.get_epoch()) is None:
+            response = await self._request_async('getEpochInfo', [])
+            epoch = response['result']['epoch']
+            self._stake_accounts.set_epoch(epoch)
+
+        accounts = self._stake_accounts.get(address, epoch)
+        if accounts is None or len(accounts) > self.MAX_MULTIPLE_ACCOUNTS:
+            response = await self._request_async(*self._staked_sol_request(address))
+            self._remember_stake_accounts(address, epoch, response)
+            return response
+
+        if not accounts:
+            return {'result': []}
+
+        response = await self._request_async(*self._stake_accounts_request(accounts))
+        return self._as_program_accounts(accounts, response)
+
+    def _staked_sol_request(self, address: str) -> tuple[str, list]:
+        """Build getProgramAccounts method and params for stake accounts."""
+        authority_filter = {
+            'memcmp': {
+                'offset': self.STAKE_AUTHORITY_OFFSET,
+                'bytes': address,
+                'encoding': 'base58',
+            }
+        }
+        if self.filtered_stake_lookup:
+            return (
+                'getProgramAccounts',
+                [
+                    self.STAKE_PROGRAM_ID,
+                    {
+                        'filters': [
+                            {'dataSize': self.STAKE_ACCOUNT_SIZE},
+                            authority_filter,
+                        ],
+                        **self._delegated_stake_options(),
+                    },
+                ],
+            )
+
+        return (
+            'getProgramAccounts',
+            [
                 self.STAKE_PROGRAM_ID,
                 {
-                    'filters': [
-                        {
-                            'memcmp': {
-                                'offset': self.STAKE_AUTHORITY_OFFSET,
-                                'bytes': address,
-                                'encoding': 'base58',
-                            }
-                        }
-                    ],
+                    'filters': [authority_filter],
                     'encoding': 'jsonParsed',
                     'commitment': 'finalized',
                 },
             ],
         )
 
+    def _stake_accounts_request(self, accounts: list[str]) -> tuple[str, list]:
+        return 'getMultipleAccounts', [accounts, self._delegated_stake_options()]
+
+    def _delegated_stake_options(self) -> dict:
+        """Request only the delegated stake field of stake accounts."""
+        return {
+            'encoding': 'base64',
+            'dataSlice': {'offset': self.DELEGATED_STAKE_OFFSET, 'length': 8},
+            'commitment': 'finalized',
+        }
+
+    def _remember_stake_accounts(self, owner: str, epoch: int, response: dict) -> None:
+        accounts = [r['pubkey'] for r in response.get('result') or []]
+        self._stake_accounts.set(owner, epoch, accounts)
+
+    @staticmethod
+    def _as_program_accounts(accounts: list[str], response: dict) -> dict:
+        """Shape getMultipleAccounts response like getProgramAccounts one."""
+        values = response.get('result', {}).get('value') or []
+        return {
+            'result': [
+                {'pubkey': pubkey, 'account': account}
+                for pubkey, account in zip(accounts, values)
+                # closed since the lookup
+                if account is not None
+            ]
+        }
+
     # ── Balance parsing ────────────────────────────────────────
 
     def _parse_sol_balance(self, response: dict) -> Optional[BalanceItem]:
@@ -355,12 +1323,7 @@ class SolanaApi(CustomizableBlockchainApi, BalanceMixin):
             return None
 
         balance_raw = sum(
-            int(
-                (r['account']['data']['parsed']['info'].get('stake') or {})
-                .get('delegation', {})
-                .get('stake', 0)
-            )
-            for r in response['result']
+            self._get_delegated_stake(r['account']) for r in response['result']
         )
 
         return BalanceItem.from_api(
@@ -370,6 +1333,22 @@ class SolanaApi(CustomizableBlockchainApi, BalanceMixin):
             raw=response['result'],
         )
 
+    def _get_delegated_stake(self, account: dict) -> int:
+        data = account['data']
+        if isinstance(data, list):
+            # [base64 data, 'base64'], sliced to the delegated stake field
+            raw = base64.b64decode(data[0])
+            if len(raw) == self.STAKE_ACCOUNT_SIZE:
+                raw = raw[self.DELEGATED_STAKE_OFFSET :]
+
+            return int.from_bytes(raw[:8], 'little')
+
+        return int(
+            (data['parsed']['info'].get('stake') or {})
+            .get('delegation', {})
+            .get('stake', 0)
+        )
+
     def _parse_rent_reserve(
         self, staked_sol: BalanceItem, raw_staked_sol: dict
     ) -> BalanceItem:
@@ -391,25 +1370,118 @@ class SolanaApi(CustomizableBlockchainApi, BalanceMixin):
     # ── Infrastructure ─────────────────────────────────────────
 
     def _request(self, method: str, params: Union[list, dict]) -> dict:
-        """Send a JSON-RPC request to the Solana RPC endpoint."""
-        self._request_id += 1
-        body = json.dumps(
+        """
+        Send a JSON-RPC request to the Solana RPC endpoint. RPC reads are
+        idempotent, concurrent identical calls are coalesced.
+        """
+        return self.post(
+            body=self._build_rpc_body(method, params),
+            headers={'Content-Type': 'application/json'},
+            coalesce_key=[method, params],
+        )
+
+    async def _request_async(self, method: str, params: Union[list, dict]) -> dict:
+        """Asyncio variant of `_request`."""
+        return await self.post_async(
+            body=self._build_rpc_body(method, params),
+            headers={'Content-Type': 'application/json'},
+            coalesce_key=[method, params],
+        )
+
+    def _request_batch(self, calls: list[tuple[str, Union[list, dict]]]) -> list[dict]:
+        """
+        Send JSON-RPC calls as batches of up to `RPC_BATCH_SIZE` calls per
+        HTTP request. Responses are correlated by id and returned in the
+        order of `calls`; per-call errors are left in the responses.
+        """
+        responses = []
+        for chunk in partition_all(self.RPC_BATCH_SIZE, calls):
+            body, ids = self._build_rpc_batch_body(chunk)
+            response = self.post(
+                body=body,
+                headers={'Content-Type': 'application/json'},
+                coalesce_key=['batch', chunk],
+            )
+            responses.extend(self._correlate_batch_response(ids, response))
+
+        return responses
+
+    async def _request_batch_async(
+        self, calls: list[tuple[str, Union[list, dict]]]
+    ) -> list[dict]:
+        """Asyncio variant of `_request_batch`; batches are sent concurrently."""
+
+        async def send(chunk: tuple) -> list[dict]:
+            body, ids = self._build_rpc_batch_body(chunk)
+            response = await self.post_async(
+                body=body,
+                headers={'Content-Type': 'application/json'},
+                coalesce_key=['batch', chunk],
+            )
+            return self._correlate_batch_response(ids, response)
+
+        batches = await asyncio.gather(
+            *(send(chunk) for chunk in partition_all(self.RPC_BATCH_SIZE, calls))
+        )
+        return [response for batch in batches for response in batch]
+
+    @staticmethod
+    def _build_rpc_batch_body(
+        calls: tuple[tuple[str, Union[list, dict]], ...],
+    ) -> tuple[str, list[int]]:
+        """
+        Ids are positions within the batch, so identical batches have
+        identical bodies and a coalesced response correlates for every
+        caller sharing it.
+        """
+        ids = list(range(len(calls)))
+        requests = [
             {
                 'jsonrpc': '2.0',
-                'id': self._request_id,
+                'id': request_id,
+                'method': method,
+                'params': params,
+            }
+            for request_id, (method, params) in zip(ids, calls)
+        ]
+        return json_codec.dumps(requests), ids
+
+    @staticmethod
+    def _correlate_batch_response(ids: list[int], response: list) -> list[dict]:
+        """Order batch responses (which may come in any order) by request id."""
+        if not isinstance(response, list):
+            raise ApiException('Unexpected JSON-RPC batch response.')
+
+        by_id = {r.get('id'): r for r in response if isinstance(r, dict)}
+        try:
+            return [by_id[i] for i in ids]
+        except KeyError as e:
+            raise ApiException(f'Missing JSON-RPC batch response for id {e}.')
+
+    def _build_rpc_body(self, method: str, params: Union[list, dict]) -> str:
+        return json_codec.dumps(
+            {
+                'jsonrpc': '2.0',
+                'id': next(self._request_ids),
                 'method': method,
                 'params': params,
             }
         )
-        return self.post(body=body, headers={'Content-Type': 'application/json'})
 
     def _opt_raise_on_other_error(self, response: Response) -> None:
         """Raise ApiException or InvalidAddressException on RPC errors."""
-        json_response = response.json()
-        if 'error' not in json_response:
+        # skip decoding successful (possibly large) results twice
+        if b'"error"' not in response.content:
+            return
+
+        json_response = json_codec.loads(response.content)
+        # errors of batched calls are handled per call
+        if not isinstance(json_response, dict) or 'error' not in json_response:
             return
 
-        error = json_response['error']
+        self._raise_rpc_error(json_response['error'])
+
+    def _raise_rpc_error(self, error: dict) -> None:
         message = error.get('message', '')
 
         if (
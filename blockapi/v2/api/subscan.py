@@ -1,10 +1,10 @@
-import json
 from abc import ABC
 from decimal import Decimal
 from typing import Iterable, List, Optional
 
 from requests import Response
 
+from blockapi.utils import json as json_codec
 from blockapi.utils.num import decimals_to_raw, safe_opt_decimal, to_decimal
 from blockapi.v2.base import (
     ApiException,
@@ -38,7 +38,7 @@ class SubscanApi(BlockchainApi, BalanceMixin, ABC):
     }
 
     def fetch_balances(self, address: str) -> FetchResult:
-        body = json.dumps({'key': address})
+        body = json_codec.dumps({'key': address})
         response = self._post('get_balance', body=body)
         return FetchResult(data=response)
 
@@ -109,7 +109,7 @@ class SubscanApi(BlockchainApi, BalanceMixin, ABC):
         continuous_count = 0
 
         while True:
-            response = self._post('get_rewards', body=json.dumps(body))
+            response = self._post('get_rewards', body=json_codec.dumps(body))
             total_count = response['data']['count']
             continuous_count += len(response['data']['list'])
 
@@ -133,7 +133,7 @@ class SubscanApi(BlockchainApi, BalanceMixin, ABC):
         return self.post(request_method, body=body, headers=headers)
 
     def _opt_raise_on_other_error(self, response: Response) -> None:
-        json_response = response.json()
+        json_response = json_codec.loads(response.content)
         code = json_response.get('code')
 
         if code == 10004:
@@ -0,0 +1,323 @@
+"""
+Columnar container of balances, for aggregating many of them without
+building a `BalanceItem` (and its merged `raw`) per addition:
+
+    batch = BalanceBatch.from_items(parse_result.data)
+    totals = batch.filter(asset_types=[AssetType.AVAILABLE]).sum_by('coin')
+    balances = totals.to_items()
+
+Coins, protocols and asset types are stored once and referenced from rows
+by integer codes (`array`), amounts as `Decimal` columns so sums are exact.
+Filters and aggregations are plain Python loops over the columns, not
+vectorized; numpy and Arrow aren't dependencies of this package.
+"""
+
+from array import array
+from decimal import Decimal
+from typing import Any, Callable, Hashable, Iterable, Optional, Union
+
+from blockapi.v2.models import (
+    AssetType,
+    BalanceItem,
+    Coin,
+    CoinContract,
+    ParseResult,
+    Protocol,
+)
+
+GROUP_KEYS = ('coin', 'protocol', 'asset_type', 'is_wallet')
+
+_ZERO = Decimal(0)
+
+# values of rows without raw, last_updated and pool_info columns; a new
+# raw dict per row, items must not share a mutable payload
+_EMPTY_EXTRA = dict(raw=dict, last_updated=lambda: None, pool_info=lambda: None)
+
+
+def _coin_key(coin: Union[Coin, CoinContract]) -> Hashable:
+    if isinstance(coin, CoinContract):
+        return coin.blockchain, coin.contract, coin.decimals
+
+    return coin.blockchain, coin.address, coin.protocol_id, coin.symbol, coin.decimals
+
+
+class _Codes:
+    """Distinct values and their codes, in order of first appearance."""
+
+    def __init__(self, key: Callable[[Any], Hashable] = lambda v: v):
+        self.values: list = []
+        self._key = key
+        self._codes: dict[Hashable, int] = {}
+        # id -> (value, code); the value is kept so its id isn't reused
+        self._by_id: dict[int, tuple[Any, int]] = {}
+
+    def code(self, value) -> int:
+        # identity first: parsers share coin objects
+        if (known := self._by_id.get(id(value))) is not None:
+            return known[1]
+
+        key = self._key(value)
+        if (code := self._codes.get(key)) is None:
+            code = self._codes[key] = len(self.values)
+            self.values.append(value)
+
+        self._by_id[id(value)] = (value, code)
+        return code
+
+
+class BalanceBatch:
+    """
+    Balances as columns. Row `i` holds `coins[coin_codes[i]]` (a `Coin`, or
+    the `CoinContract` of items without coin), `protocols[protocol_codes[i]]`
+    and `asset_types[asset_type_codes[i]]`; the remaining `BalanceItem`
+    fields are kept in per-row lists so `to_items` gives the items back.
+    """
+
+    def __init__(
+        self,
+        coins: list,
+        protocols: list[Optional[Protocol]],
+        asset_types: list[AssetType],
+        coin_codes: array,
+        protocol_codes: array,
+        asset_type_codes: array,
+        balances: list[Decimal],
+        balances_raw: list[Optional[Decimal]],
+        is_wallet: array,
+        extra: Optional[dict[str, list]] = None,
+    ):
+        self.coins = coins
+        self.protocols = protocols
+        self.asset_types = asset_types
+        self.coin_codes = coin_codes
+        self.protocol_codes = protocol_codes
+        self.asset_type_codes = asset_type_codes
+        self.balances = balances
+        self.balances_raw = balances_raw
+        self.is_wallet = is_wallet
+        # raw, last_updated and pool_info columns, absent for aggregates
+        self.extra = extra
+
+    @classmethod
+    def from_items(cls, items: Iterable[BalanceItem]) -> 'BalanceBatch':
+        coins = _Codes(_coin_key)
+        protocols = _Codes()
+        asset_types = _Codes()
+        coin_codes, protocol_codes = array('l'), array('l')
+        asset_type_codes, is_wallet = array('l'), array('b')
+        balances, balances_raw = [], []
+        raws, last_updated, pool_infos = [], [], []
+        for item in items:
+            coin_codes.append(coins.code(item.coin or item.coin_contract))
+            protocol_codes.append(protocols.code(item.protocol))
+            asset_type_codes.append(asset_types.code(item.asset_type))
+            is_wallet.append(item.is_wallet)
+            balances.append(item.balance)
+            balances_raw.append(item.balance_raw)
+            raws.append(item.raw)
+            last_updated.append(item.last_updated)
+            pool_infos.append(item.pool_info)
+
+        return cls(
+            coins=coins.values,
+            protocols=protocols.values,
+            asset_types=asset_types.values,
+            coin_codes=coin_codes,
+            protocol_codes=protocol_codes,
+            asset_type_codes=asset_type_codes,
+            balances=balances,
+            balances_raw=balances_raw,
+            is_wallet=is_wallet,
+            extra=dict(raw=raws, last_updated=last_updated, pool_info=pool_infos),
+        )
+
+    @classmethod
+    def from_parse_result(cls, result: ParseResult) -> 'BalanceBatch':
+        return cls.from_items(
+            item for item in result.data or [] if isinstance(item, BalanceItem)
+        )
+
+    @classmethod
+    def concat(cls, batches: Iterable['BalanceBatch']) -> 'BalanceBatch':
+        """One batch of rows of all given batches, with codes remapped."""
+        coins = _Codes(_coin_key)
+        protocols = _Codes()
+        asset_types = _Codes()
+        columns = dict(
+            coin_codes=array('l'),
+            protocol_codes=array('l'),
+            asset_type_codes=array('l'),
+            balances=[],
+            balances_raw=[],
+            is_wallet=array('b'),
+        )
+        extra = dict(raw=[], last_updated=[], pool_info=[])
+        for batch in batches:
+            for name, values, codes in (
+                ('coin_codes', batch.coins, coins),
+                ('protocol_codes', batch.protocols, protocols),
+                ('asset_type_codes', batch.asset_types, asset_types),
+            ):
+                remap = [codes.code(v) for v in values]
+                columns[name].extend(remap[c] for c in getattr(batch, name))
+
+            for name in ('balances', 'balances_raw', 'is_wallet'):
+                columns[name].extend(getattr(batch, name))
+
+            for name, values in extra.items():
+                values.extend(
+                    batch.extra[name]
+                    if batch.extra is not None
+                    else [_EMPTY_EXTRA[name]() for _ in range(len(batch))]
+                )
+
+        return cls(
+            coins=coins.values,
+            protocols=protocols.values,
+            asset_types=asset_types.values,
+            extra=extra,
+            **columns,
+        )
+
+    def __len__(self) -> int:
+        return len(self.balances)
+
+    def take(self, rows: Iterable[int]) -> 'BalanceBatch':
+        """Batch of given rows; coins, protocols and asset types are shared."""
+        rows = list(rows)
+        extra = None
+        if self.extra is not None:
+            extra = {k: [v[i] for i in rows] for k, v in self.extra.items()}
+
+        return BalanceBatch(
+            coins=self.coins,
+            protocols=self.protocols,
+            asset_types=self.asset_types,
+            coin_codes=array('l', [self.coin_codes[i] for i in rows]),
+            protocol_codes=array('l', [self.protocol_codes[i] for i in rows]),
+            asset_type_codes=array('l', [self.asset_type_codes[i] for i in rows]),
+            balances=[self.balances[i] for i in rows],
+            balances_raw=[self.balances_raw[i] for i in rows],
+            is_wallet=array('b', [self.is_wallet[i] for i in rows]),
+            extra=extra,
+        )
+
+    def filter(
+        self,
+        asset_types: Optional[Iterable[AssetType]] = None,
+        coins: Optional[Iterable[Union[Coin, CoinContract]]] = None,
+        protocols: Optional[Iterable[Optional[Protocol]]] = None,
+        is_wallet: Optional[bool] = None,
+        min_balance: Optional[Decimal] = None,
+    ) -> 'BalanceBatch':
+        """Rows matching all given conditions."""
+        masks = []
+        if asset_types is not None:
+            masks.append(
+                (self.asset_type_codes, self._codes_of(self.asset_types, asset_types))
+            )
+        if coins is not None:
+            keys = {_coin_key(c) for c in coins}
+            allowed = {i for i, c in enumerate(self.coins) if _coin_key(c) in keys}
+            masks.append((self.coin_codes, allowed))
+        if protocols is not None:
+            masks.append(
+                (self.protocol_codes, self._codes_of(self.protocols, protocols))
+            )
+        if is_wallet is not None:
+            masks.append((self.is_wallet, {int(is_wallet)}))
+
+        rows = range(len(self))
+        for column, allowed in masks:
+            rows = [i for i in rows if column[i] in allowed]
+        if min_balance is not None:
+            rows = [i for i in rows if self.balances[i] >= min_balance]
+
+        return self.take(rows)
+
+    def sum_by(self, *keys: str) -> 'BalanceBatch':
+        """
+        One row per group of `keys` (default 'coin'), with summed balances.
+        Aggregated rows have no raw payload, update time or pool info.
+        """
+        keys = keys or ('coin',)
+        if unknown := set(keys) - set(GROUP_KEYS):
+            raise ValueError(f'Unknown group keys: {", ".join(sorted(unknown))}')
+
+        columns = [
+            self.coin_codes,
+            self.protocol_codes,
+            self.asset_type_codes,
+            self.is_wallet,
+        ]
+        # grouped columns keep their value, the others take the first row's
+        selected = [GROUP_KEYS.index(k) for k in keys]
+        groups: dict[tuple, list] = {}
+        for codes, balance, raw in zip(zip(*columns), self.balances, self.balances_raw):
+            key = tuple(codes[i] for i in selected)
+            if (group := groups.get(key)) is None:
+                groups[key] = [codes, balance, raw]
+            else:
+                group[1] += balance
+                if raw is not None:
+                    group[2] = raw if group[2] is None else group[2] + raw
+
+        rows = list(groups.values())
+        return BalanceBatch(
+            coins=self.coins,
+            protocols=self.protocols,
+            asset_types=self.asset_types,
+            coin_codes=array('l', [r[0][0] for r in rows]),
+            protocol_codes=array('l', [r[0][1] for r in rows]),
+            asset_type_codes=array('l', [r[0][2] for r in rows]),
+            balances=[r[1] for r in rows],
+            balances_raw=[r[2] for r in rows],
+            is_wallet=array('b', [r[0][3] for r in rows]),
+        )
+
+    def totals(self, key: str = 'coin') -> dict[Any, Decimal]:
+        """Summed balance by coin, protocol, asset type or is_wallet."""
+        batch = self.sum_by(key)
+        values = {
+            'coin': (batch.coins, batch.coin_codes),
+            'protocol': (batch.protocols, batch.protocol_codes),
+            'asset_type': (batch.asset_types, batch.asset_type_codes),
+            'is_wallet': ([False, True], batch.is_wallet),
+        }
+        lookup, codes = values[key]
+        if key == 'coin':
+            # coins aren't hashable (lists in fields), keyed by their key
+            return {_coin_key(lookup[c]): b for c, b in zip(codes, batch.balances)}
+
+        return {lookup[c]: b for c, b in zip(codes, batch.balances)}
+
+    def to_items(self) -> list[BalanceItem]:
+        extra = self.extra or {}
+        raws = extra.get('raw') or [{} for _ in range(len(self))]
+        last_updated = extra.get('last_updated') or [None] * len(self)
+        pool_infos = extra.get('pool_info') or [None] * len(self)
+        items = []
+        for i, balance in enumerate(self.balances):
+            coin = self.coins[self.coin_codes[i]]
+            is_contract = isinstance(coin, CoinContract)
+            items.append(
+                BalanceItem(
+                    balance=balance,
+                    balance_raw=self.balances_raw[i],
+                    raw=raws[i],
+                    coin=None if is_contract else coin,
+                    coin_contract=coin if is_contract else None,
+                    asset_type=self.asset_types[self.asset_type_codes[i]],
+                    last_updated=last_updated[i],
+                    protocol=self.protocols[self.protocol_codes[i]],
+                    is_wallet=bool(self.is_wallet[i]),
+                    pool_info=pool_infos[i],
+                )
+            )
+
+        return items
+
+    @staticmethod
+    def _codes_of(values: list, selected: Iterable) -> set[int]:
+        selected = set(selected)
+        return {i for i, v in enumerate(values) if v in selected}
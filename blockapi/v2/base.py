@@ -1,15 +1,46 @@
+import asyncio
+import json
 import logging
 import time
 from abc import ABC
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
 from urllib.parse import urljoin
 
-from requests import HTTPError, Response, Session
+import aiohttp
+from requests import HTTPError, Response
 from requests.exceptions import ConnectionError as RequestsConnectionError
 from requests.structures import CaseInsensitiveDict
 
+from blockapi.utils import json as json_codec
 from blockapi.utils.datetime import parse_dt
+from blockapi.v2.cache import (
+    IResponseCache,
+    build_response,
+    get_with_cache,
+    get_with_cache_async,
+    make_cache_key,
+)
+from blockapi.v2.json_stream import aiter_json_items, iter_json_items
+from blockapi.v2.metrics import (
+    IRequestObserver,
+    RequestTimer,
+    add_sleep_time,
+    notify_observers,
+)
 from blockapi.v2.models import (
     ApiOptions,
     BalanceItem,
@@ -19,6 +50,9 @@ from blockapi.v2.models import (
     Pool,
     TransactionItem,
 )
+from blockapi.v2.rate_limiter import TokenBucket, get_rate_limiter
+from blockapi.v2.session_pool import get_async_session, get_session
+from blockapi.v2.single_flight import get_single_flight
 
 logger = logging.getLogger(__name__)
 
@@ -27,11 +61,18 @@ class ISleepProvider(ABC):
     def sleep(self, url: str, seconds: float) -> None:
         raise NotImplementedError
 
+    async def sleep_async(self, url: str, seconds: float) -> None:
+        # `sleep` may block, keep it off the event loop
+        await asyncio.to_thread(self.sleep, url, seconds)
+
 
 class SleepProvider(ISleepProvider):
     def sleep(self, url: str, seconds: float):
         time.sleep(seconds)
 
+    async def sleep_async(self, url: str, seconds: float):
+        await asyncio.sleep(seconds)
+
 
 class CustomizableBlockchainApi(ABC):
     """
@@ -47,8 +88,24 @@ class CustomizableBlockchainApi(ABC):
     # {request_method: request_url}
     supported_requests: Dict[str, str] = {}
 
+    # Opt-in cache of GET responses, e.g. `MemoryResponseCache()`. Only
+    # request methods listed in `cache_ttls` ({request_method: seconds})
+    # are cached.
+    response_cache: Optional[IResponseCache] = None
+    cache_ttls: Dict[str, float] = {}
+
+    # Concurrent identical GET requests (same URL, params, headers and auth)
+    # share one upstream call; POST only when a `coalesce_key` is given.
+    coalesce_requests = True
+
+    # Receive `RequestMetrics` of every `get_data` call, e.g.
+    # `CustomizableBlockchainApi.observers.append(HistogramAggregator())`
+    # to instrument all adapters.
+    observers: List[IRequestObserver] = []
+
     json_parse_args = dict()
     max_rate_limit_retries = 5
+    stream_chunk_size = 64 * 1024
 
     def __init__(
         self,
@@ -57,17 +114,17 @@ class CustomizableBlockchainApi(ABC):
         sleep_provider: Optional[ISleepProvider] = None,
     ):
         self.api_key = api_key
-        self._session = Session()
         self.base_url = base_url or self.api_options.base_url
         self.sleep_provider = sleep_provider
+        # per-request auth, sessions are shared with other instances
+        self._auth = None
 
         if not self.base_url:
             raise NotImplementedError(
                 'api_options.base_url is not set and no base_url was provided'
             )
 
-    def __del__(self):
-        self._session.close()
+        self._session = get_session(self.base_url)
 
     def get(
         self,
@@ -89,88 +146,426 @@ class CustomizableBlockchainApi(ABC):
         params: Optional[dict[str, any]] = None,
         extra: Optional[dict] = None,
         **req_args,
+    ) -> FetchResult:
+        timer = RequestTimer()
+        with timer.activate():
+            result = self._get_data(
+                timer, request_method, headers, params, extra, req_args
+            )
+
+        self._notify_observers(timer, request_method, result)
+        return result
+
+    def _get_data(
+        self,
+        timer: RequestTimer,
+        request_method: str,
+        headers: Optional[dict],
+        params: Optional[dict],
+        extra: Optional[dict],
+        req_args: dict,
     ) -> FetchResult:
         retries = self.max_rate_limit_retries
         while True:
+            retries -= 1
             try:
-                response = self._get_response(request_method, headers, params, req_args)
-                response.raise_for_status()
+                with timer.attempt():
+                    response = self._get_response(
+                        request_method, headers, params, req_args
+                    )
+                timer.set_response(response)
+                outcome = self._check_retry(response, retries, extra)
             except RequestsConnectionError as connection_error:
-                sleep_seconds = 10
-                logger.error(
-                    f'Exception {connection_error} occurred, will try again in {sleep_seconds}'
-                )
+                outcome = self._check_connection_retry(connection_error, retries)
+            except Exception as ex:
+                return self._get_exception_result(ex, extra)
 
-                retries -= 1
+            if outcome is None:
+                with timer.decoding():
+                    return self._get_success_result(response, extra)
 
-                if retries <= 0 or not self.sleep_provider:
-                    return FetchResult(
-                        status_code=1,
-                        errors=[str(connection_error)],
-                        time=datetime.now(timezone.utc),
-                    )
+            if isinstance(outcome, FetchResult):
+                return outcome
+
+            add_sleep_time(outcome)
+            self.sleep_provider.sleep(self.base_url, seconds=outcome)
 
-                self.sleep_provider.sleep(self.base_url, seconds=sleep_seconds)
-                continue
-            except HTTPError:
-                retries -= 1
+    async def get_data_async(
+        self,
+        request_method: str,
+        headers: Optional[dict[str, any]] = None,
+        params: Optional[dict[str, any]] = None,
+        extra: Optional[dict] = None,
+        **req_args,
+    ) -> FetchResult:
+        """
+        Asyncio counterpart of `get_data`, sharing its retry policy.
+        """
+        timer = RequestTimer()
+        with timer.activate():
+            result = await self._get_data_async(
+                timer, request_method, headers, params, extra, req_args
+            )
 
-                retryable = response.status_code == 429 or response.status_code >= 500
+        self._notify_observers(timer, request_method, result)
+        return result
 
-                if retries <= 0 or not retryable or not self.sleep_provider:
-                    # Genuine failure: out of retries, non-retryable status,
-                    # or nothing to pace the retry with. This is the only path
-                    # that surfaces an error to the caller, so log at ERROR.
-                    logger.error(
-                        f"Request failed with http error: {response.status_code}"
+    async def _get_data_async(
+        self,
+        timer: RequestTimer,
+        request_method: str,
+        headers: Optional[dict],
+        params: Optional[dict],
+        extra: Optional[dict],
+        req_args: dict,
+    ) -> FetchResult:
+        retries = self.max_rate_limit_retries
+        while True:
+            retries -= 1
+            try:
+                with timer.attempt():
+                    response = await self._get_response_async(
+                        request_method, headers, params, req_args
                     )
-                    time = self._get_response_time(response.headers)
-                    return FetchResult(
-                        status_code=response.status_code,
-                        headers=self._get_headers_dict(response.headers),
-                        errors=[self._get_reason(response)],
-                        extra=extra,
-                        time=time,
+                timer.set_response(response)
+                outcome = self._check_retry(response, retries, extra)
+            except RequestsConnectionError as connection_error:
+                outcome = self._check_connection_retry(connection_error, retries)
+            except Exception as ex:
+                return self._get_exception_result(ex, extra)
+
+            if outcome is None:
+                with timer.decoding():
+                    return self._get_success_result(response, extra)
+
+            if isinstance(outcome, FetchResult):
+                return outcome
+
+            add_sleep_time(outcome)
+            await self.sleep_provider.sleep_async(self.base_url, seconds=outcome)
+
+    def iter_data(
+        self,
+        request_method: str,
+        pointer: str = '',
+        headers: Optional[dict[str, any]] = None,
+        params: Optional[dict[str, any]] = None,
+        **req_args,
+    ) -> Iterator:
+        """
+        Stream items of the JSON array at `pointer` (RFC 6901, '' for
+        a top-level array), decoded as the body arrives, so peak memory
+        doesn't grow with the response size. Raises ApiException on HTTP
+        errors and `UnexpectedJsonValue` if the pointer doesn't hold an
+        array (e.g. an error object). Not cached, retried nor coalesced.
+        """
+        url = self._build_request_url(request_method, **req_args)
+        self._wait_for_rate_limit()
+        with self._session.get(
+            url, headers=headers, params=params, auth=self._auth, stream=True
+        ) as response:
+            if response.status_code != 200:
+                self._raise_from_response(response)
+
+            yield from iter_json_items(
+                response.iter_content(self.stream_chunk_size),
+                pointer,
+                **self.json_parse_args,
+            )
+
+    async def iter_data_async(
+        self,
+        request_method: str,
+        pointer: str = '',
+        headers: Optional[dict[str, any]] = None,
+        params: Optional[dict[str, any]] = None,
+        **req_args,
+    ) -> AsyncIterator:
+        """
+        Asyncio counterpart of `iter_data`.
+        """
+        url = self._build_request_url(request_method, **req_args)
+        kwargs = {'headers': headers, 'params': params}
+        if self._auth:
+            kwargs['auth'] = aiohttp.BasicAuth(*self._auth)
+
+        kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        await self._wait_for_rate_limit_async()
+        try:
+            async with get_async_session().get(url, **kwargs) as resp:
+                if resp.status != 200:
+                    content = await resp.read()
+                    self._raise_from_response(
+                        build_response(resp.status, resp.headers, content, resp.reason)
                     )
 
-                delay = response.headers.get('retry-after', '60')
-                try:
-                    seconds = int(delay)
-                except ValueError:
-                    seconds = 60
-
-                # Retryable error that will be retried, so this is expected
-                # noise (e.g. 429 throttling) rather than a failure: WARNING.
-                logger.warning(
-                    f'Request failed with retryable http error'
-                    f' {response.status_code}: will retry after {seconds}s'
-                    f' sleep. Remaining attempts {retries}.'
-                )
-                self.sleep_provider.sleep(self.base_url, seconds=seconds)
-                continue
-            except Exception as ex:
-                logger.exception(ex)
+                async for item in aiter_json_items(
+                    resp.content.iter_chunked(self.stream_chunk_size),
+                    pointer,
+                    **self.json_parse_args,
+                ):
+                    yield item
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            raise RequestsConnectionError(str(e) or type(e).__name__) from e
+
+    def _notify_observers(
+        self, timer: RequestTimer, request_method: str, result: FetchResult
+    ) -> None:
+        if not self.observers:
+            return
+
+        metrics = timer.finish(
+            api=type(self).__name__,
+            request_method=request_method,
+            status_code=result.status_code,
+            errors=len(result.errors or []),
+        )
+        notify_observers(self.observers, metrics)
+
+    def _check_retry(
+        self, response: Response, retries: int, extra: Optional[dict]
+    ) -> Union[FetchResult, float, None]:
+        """
+        Returns None for a successful response, a failed FetchResult when
+        the request must not be retried, or the seconds to sleep before
+        the next attempt.
+        """
+        try:
+            response.raise_for_status()
+        except HTTPError:
+            retryable = response.status_code == 429 or response.status_code >= 500
+
+            if retries <= 0 or not retryable or not self.sleep_provider:
+                # Genuine failure: out of retries, non-retryable status,
+                # or nothing to pace the retry with. This is the only path
+                # that surfaces an error to the caller, so log at ERROR.
+                logger.error(f"Request failed with http error: {response.status_code}")
+                time = self._get_response_time(response.headers)
                 return FetchResult(
-                    status_code=2,
-                    headers=dict(),
-                    errors=[f'{type(ex).__name__}: {str(ex)}'],
+                    status_code=response.status_code,
+                    headers=self._get_headers_dict(response.headers),
+                    errors=[self._get_reason(response)],
                     extra=extra,
-                    time=datetime.now(timezone.utc),
+                    time=time,
                 )
 
-            time = self._get_response_time(response.headers)
+            delay = response.headers.get('retry-after', '60')
+            try:
+                seconds = int(delay)
+            except ValueError:
+                seconds = 60
+
+            # Retryable error that will be retried, so this is expected
+            # noise (e.g. 429 throttling) rather than a failure: WARNING.
+            logger.warning(
+                f'Request failed with retryable http error'
+                f' {response.status_code}: will retry after {seconds}s'
+                f' sleep. Remaining attempts {retries}.'
+            )
+            return seconds
+
+        return None
+
+    def _check_connection_retry(
+        self, connection_error: Exception, retries: int
+    ) -> Union[FetchResult, float]:
+        sleep_seconds = 10
+        logger.error(
+            f'Exception {connection_error} occurred, will try again in {sleep_seconds}'
+        )
+
+        if retries <= 0 or not self.sleep_provider:
             return FetchResult(
-                status_code=response.status_code,
-                headers=self._get_headers_dict(response.headers),
-                data=response.json(**self.json_parse_args),
-                extra=extra,
-                time=time,
+                status_code=1,
+                errors=[str(connection_error)],
+                time=datetime.now(timezone.utc),
             )
 
+        return sleep_seconds
+
+    @staticmethod
+    def _get_exception_result(ex: Exception, extra: Optional[dict]) -> FetchResult:
+        logger.exception(ex)
+        return FetchResult(
+            status_code=2,
+            headers=dict(),
+            errors=[f'{type(ex).__name__}: {str(ex)}'],
+            extra=extra,
+            time=datetime.now(timezone.utc),
+        )
+
+    def _get_success_result(
+        self, response: Response, extra: Optional[dict]
+    ) -> FetchResult:
+        time = self._get_response_time(response.headers)
+        return FetchResult(
+            status_code=response.status_code,
+            headers=self._get_headers_dict(response.headers),
+            data=json_codec.loads(response.content, **self.json_parse_args),
+            extra=extra,
+            time=time,
+        )
+
     def _get_response(self, request_method, headers, params, req_args):
         url = self._build_request_url(request_method, **req_args)
-        response = self._session.get(url, headers=headers, params=params)
-        return response
+
+        def send(conditional_headers: dict) -> Response:
+            request_headers = self._merge_headers(headers, conditional_headers)
+
+            def call() -> Response:
+                self._wait_for_rate_limit()
+                return self._session.get(
+                    url, headers=request_headers, params=params, auth=self._auth
+                )
+
+            key = self._get_coalesce_key('GET', url, params, request_headers)
+            return self._single_flight(key, call)
+
+        ttl = self._get_cache_ttl(request_method)
+        if ttl is None:
+            return send({})
+
+        key = make_cache_key(request_method, url, params)
+        return get_with_cache(self.response_cache, key, ttl, send)
+
+    async def _get_response_async(self, request_method, headers, params, req_args):
+        url = self._build_request_url(request_method, **req_args)
+
+        async def send(conditional_headers: dict) -> Response:
+            request_headers = self._merge_headers(headers, conditional_headers)
+
+            def call() -> Awaitable[Response]:
+                return self._send_async(
+                    'GET', url, headers=request_headers, params=params
+                )
+
+            key = self._get_coalesce_key('GET', url, params, request_headers)
+            return await self._single_flight_async(key, call)
+
+        ttl = self._get_cache_ttl(request_method)
+        if ttl is None:
+            return await send({})
+
+        key = make_cache_key(request_method, url, params)
+        return await get_with_cache_async(self.response_cache, key, ttl, send)
+
+    def _get_cache_ttl(self, request_method: str) -> Optional[float]:
+        if self.response_cache is None:
+            return None
+
+        return self.cache_ttls.get(request_method)
+
+    def _get_coalesce_key(
+        self, method: str, url: str, params: Any, headers: Optional[dict]
+    ) -> Optional[str]:
+        if not self.coalesce_requests:
+            return None
+
+        return json.dumps(
+            [method, url, params, headers, self._auth], sort_keys=True, default=str
+        )
+
+    @staticmethod
+    def _single_flight(key: Optional[str], call: Callable[[], Response]) -> Response:
+        if key is None:
+            return call()
+
+        return get_single_flight().do(key, call)
+
+    @staticmethod
+    async def _single_flight_async(
+        key: Optional[str], call: Callable[[], Awaitable[Response]]
+    ) -> Response:
+        if key is None:
+            return await call()
+
+        return await get_single_flight().do_async(key, call)
+
+    @staticmethod
+    def _merge_headers(headers: Optional[dict], extra: dict) -> Optional[dict]:
+        if not extra:
+            return headers
+
+        return {**(headers or {}), **extra}
+
+    async def _send_async(self, method: str, url: str, **kwargs) -> Response:
+        """
+        Send request through the pooled aiohttp session and wrap the result
+        into `requests.Response`, so response handling (error checks, JSON
+        parse args, adapter hooks like `_opt_raise_on_other_error`) is shared
+        with the blocking transport.
+        """
+        if self._auth:
+            kwargs['auth'] = aiohttp.BasicAuth(*self._auth)
+
+        kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        await self._wait_for_rate_limit_async()
+        started = time.perf_counter()
+        try:
+            async with get_async_session().request(method, url, **kwargs) as resp:
+                # headers are received, like `requests.Response.elapsed`
+                elapsed = timedelta(seconds=time.perf_counter() - started)
+                content = await resp.read()
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            raise RequestsConnectionError(str(e) or type(e).__name__) from e
+
+        return build_response(
+            resp.status,
+            resp.headers,
+            content,
+            reason=resp.reason,
+            url=str(resp.url),
+            elapsed=elapsed,
+        )
+
+    @property
+    def rate_limiter(self) -> Optional[TokenBucket]:
+        """
+        Token bucket shared by all instances (and threads) calling the same
+        base URL, paced by `api_options.rate_limit`. None unless the adapter
+        opts in with `api_options.enforce_rate_limit`.
+        """
+        if not isinstance(self.api_options, ApiOptions):
+            return None
+
+        if not self.api_options.enforce_rate_limit:
+            return None
+
+        return get_rate_limiter(
+            self.base_url,
+            self.api_options.rate_limit,
+            self.api_options.rate_limit_burst,
+        )
+
+    def _wait_for_rate_limit(self) -> None:
+        limiter = self.rate_limiter
+        if limiter is None:
+            return
+
+        wait = limiter.reserve()
+        if wait <= 0:
+            return
+
+        add_sleep_time(wait)
+        if self.sleep_provider:
+            self.sleep_provider.sleep(self.base_url, seconds=wait)
+        else:
+            time.sleep(wait)
+
+    async def _wait_for_rate_limit_async(self) -> None:
+        limiter = self.rate_limiter
+        if limiter is None:
+            return
+
+        wait = limiter.reserve()
+        if wait <= 0:
+            return
+
+        add_sleep_time(wait)
+        if self.sleep_provider:
+            await self.sleep_provider.sleep_async(self.base_url, seconds=wait)
+        else:
+            await asyncio.sleep(wait)
 
     def _build_request_url(self, request_method: str, **req_args):
         path_url = self.supported_requests.get(request_method)
@@ -179,12 +574,72 @@ class CustomizableBlockchainApi(ABC):
 
         return urljoin(self.base_url, path_url)
 
-    def post(self, request_method=None, body=None, json=None, headers=None, **req_args):
+    def post(
+        self,
+        request_method=None,
+        body=None,
+        json=None,
+        headers=None,
+        coalesce_key=None,
+        **req_args,
+    ):
         """
-        Call request using json.
+        Call request using json. Concurrent posts with the same `coalesce_key`
+        (e.g. JSON-RPC method and params, without the request id) share one
+        upstream call.
         """
         url = self._build_request_url(request_method, **req_args)
-        response = self._session.post(url, data=body, json=json, headers=headers)
+
+        def call() -> Response:
+            self._wait_for_rate_limit()
+            return self._session.post(
+                url, data=body, json=json, headers=headers, auth=self._auth
+            )
+
+        key = None
+        if coalesce_key is not None:
+            key = self._get_coalesce_key('POST', url, coalesce_key, headers)
+
+        response = self._single_flight(key, call)
+        return self._check_and_get_from_response(response)
+
+    async def get_async(
+        self,
+        request_method: str,
+        headers: Optional[dict[str, any]] = None,
+        params: Optional[dict[str, any]] = None,
+        **req_args,
+    ) -> Dict:
+        """
+        Asyncio counterpart of `get`.
+        """
+        response = await self._get_response_async(
+            request_method, headers, params, req_args
+        )
+        return self._check_and_get_from_response(response)
+
+    async def post_async(
+        self,
+        request_method=None,
+        body=None,
+        json=None,
+        headers=None,
+        coalesce_key=None,
+        **req_args,
+    ):
+        """
+        Asyncio counterpart of `post`.
+        """
+        url = self._build_request_url(request_method, **req_args)
+
+        def call() -> Awaitable[Response]:
+            return self._send_async('POST', url, data=body, json=json, headers=headers)
+
+        key = None
+        if coalesce_key is not None:
+            key = self._get_coalesce_key('POST', url, coalesce_key, headers)
+
+        response = await self._single_flight_async(key, call)
         return self._check_and_get_from_response(response)
 
     def _check_and_get_from_response(self, response: Response) -> Dict:
@@ -192,7 +647,7 @@ class CustomizableBlockchainApi(ABC):
             self._raise_from_response(response)
         self._opt_raise_on_other_error(response)
 
-        return response.json()
+        return json_codec.loads(response.content)
 
     @staticmethod
     def _get_reason(response):
@@ -260,6 +715,9 @@ class IBalance(ABC):
     def get_balance(self, address: str) -> List[BalanceItem]:
         raise NotImplementedError
 
+    async def get_balance_async(self, address: str) -> List[BalanceItem]:
+        return await asyncio.to_thread(self.get_balance, address)
+
 
 class ITransactions(ABC):
     def get_transactions(
@@ -277,6 +735,9 @@ class IPortfolio(ABC):
     def get_portfolio(self, address: str) -> List[Pool]:
         raise NotImplementedError
 
+    async def get_portfolio_async(self, address: str) -> List[Pool]:
+        return await asyncio.to_thread(self.get_portfolio, address)
+
 
 class INftProvider(ABC):
     def fetch_nfts(self, address: str) -> FetchResult:
@@ -291,6 +752,18 @@ class INftProvider(ABC):
     def fetch_listings(self, collection: str) -> FetchResult:
         raise NotImplementedError
 
+    async def fetch_nfts_async(self, address: str) -> FetchResult:
+        return await asyncio.to_thread(self.fetch_nfts, address)
+
+    async def fetch_collection_stats_async(self, collection: str) -> FetchResult:
+        return await asyncio.to_thread(self.fetch_collection_stats, collection)
+
+    async def fetch_offers_async(self, collection: str) -> FetchResult:
+        return await asyncio.to_thread(self.fetch_offers, collection)
+
+    async def fetch_listings_async(self, collection: str) -> FetchResult:
+        return await asyncio.to_thread(self.fetch_listings, collection)
+
 
 class INftParser(ABC):
     def parse_nfts(self, data: FetchResult) -> ParseResult:
@@ -318,6 +791,13 @@ class IBlockchainFetcher(ABC):
     def fetch_balances(self, address: str) -> FetchResult:
         raise NotImplementedError
 
+    async def fetch_balances_async(self, address: str) -> FetchResult:
+        """
+        Falls back to running `fetch_balances` in a worker thread; adapters
+        override it with a native implementation on top of `get_data_async`.
+        """
+        return await asyncio.to_thread(self.fetch_balances, address)
+
 
 class IBlockchainParser(ABC):
     def parse_balances(self, fetch_result: FetchResult) -> ParseResult:
@@ -325,6 +805,8 @@ class IBlockchainParser(ABC):
 
 
 class BalanceMixin(IBalance, IBlockchainParser, IBlockchainFetcher):
+    max_balance_workers: int = 8
+
     def get_balance(self, address: str) -> list[BalanceItem]:
         data = self.fetch_balances(address)
         if data.errors:
@@ -332,3 +814,56 @@ class BalanceMixin(IBalance, IBlockchainParser, IBlockchainFetcher):
 
         parsed = self.parse_balances(data)
         return parsed.data or []
+
+    async def get_balance_async(self, address: str) -> list[BalanceItem]:
+        data = await self.fetch_balances_async(address)
+        if data.errors:
+            raise ApiException(data.errors[0])
+
+        parsed = self.parse_balances(data)
+        return parsed.data or []
+
+    def get_balances(
+        self, addresses: Iterable[str], max_workers: Optional[int] = None
+    ) -> dict[str, ParseResult]:
+        """
+        Fetch and parse balances of many addresses concurrently.
+        Failures are reported in `ParseResult.errors` of given address.
+        """
+        return dict(self.iter_balances(addresses, max_workers=max_workers))
+
+    def iter_balances(
+        self, addresses: Iterable[str], max_workers: Optional[int] = None
+    ) -> Iterator[tuple[str, ParseResult]]:
+        """
+        Yield (address, ParseResult) pairs in order of completion. At most
+        `max_workers` addresses are in flight; requests are paced by
+        the shared `rate_limiter` if the adapter enforces one.
+        """
+        max_workers = max_workers or self.max_balance_workers
+        queue = iter(dict.fromkeys(addresses))
+        pending: dict[Future, str] = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while True:
+                for address in islice(queue, max_workers - len(pending)):
+                    future = executor.submit(self._fetch_and_parse_balances, address)
+                    pending[future] = address
+
+                if not pending:
+                    return
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), future.result()
+
+    def _fetch_and_parse_balances(self, address: str) -> ParseResult:
+        try:
+            data = self.fetch_balances(address)
+            if data.errors:
+                return ParseResult(errors=data.errors)
+
+            return self.parse_balances(data)
+        except Exception as ex:
+            logger.exception(ex)
+            return ParseResult(errors=[f'{type(ex).__name__}: {str(ex)}'])
@@ -1,4 +1,7 @@
 import logging
+import threading
+import time
+from types import MappingProxyType
 from typing import Optional, Union
 
 from blockapi.v2.models import Blockchain
@@ -246,42 +249,132 @@ WORMHOLE_BLOCKCHAINS_MAP = {
 }
 
 
-def _get_chain_mapping(
-    chain: Optional[Union[str, int]], source: str, mapping: dict[str, Blockchain]
-) -> Optional[Blockchain]:
-    if not chain:
+class ChainTable:
+    """
+    Frozen lookup of a provider's chain ids, case insensitive: the explicit
+    `mapping` first, then `Blockchain` values. Unknown ids are remembered
+    and warned about once per `WARNING_INTERVAL` seconds each.
+
+    With `names_are_ids`, the provider also uses `Blockchain` values as its
+    ids and `mapping` lists only the ids that differ, so `chain_id` falls back
+    to the value for blockchains not in `mapping`. The tables don't record
+    which blockchains a provider supports, that's up to the provider.
+    """
+
+    WARNING_INTERVAL = 3600.0
+    MAX_MISSES = 10000
+
+    def __init__(
+        self,
+        source: str,
+        mapping: dict[str, Optional[Blockchain]],
+        names_are_ids: bool = True,
+    ):
+        self.source = source
+        self.names_are_ids = names_are_ids
+        table = {b.value: b for b in Blockchain}
+        table.update((k.lower(), v) for k, v in mapping.items() if v)
+        self._table = MappingProxyType(table)
+
+        reverse = {}
+        for chain, blockchain in mapping.items():
+            if blockchain:
+                reverse.setdefault(blockchain, chain)
+        self._reverse = MappingProxyType(reverse)
+
+        # unknown id -> (last warned at, lookups since)
+        self._misses: dict[str, tuple[float, int]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, chain: Optional[Union[str, int]]) -> Optional[Blockchain]:
+        if not chain:
+            return None
+
+        if (blockchain := self._table.get(chain)) is not None:
+            return blockchain
+
+        chain_lower = chain.lower() if hasattr(chain, 'lower') else str(chain).lower()
+        if (blockchain := self._table.get(chain_lower)) is not None:
+            return blockchain
+
+        self._on_miss(chain, chain_lower)
         return None
 
-    chain_lower = chain.lower() if hasattr(chain, 'lower') else str(chain).lower()
+    def chain_id(self, blockchain: Blockchain) -> Optional[str]:
+        """
+        Provider's chain id of `blockchain`: its `mapping` id, else its value
+        with `names_are_ids` (whether or not the provider supports it), else
+        None.
+        """
+        if (chain := self._reverse.get(blockchain)) is not None:
+            return chain
+
+        return blockchain.value if self.names_are_ids else None
+
+    def _on_miss(self, chain: Union[str, int], chain_lower: str) -> None:
+        now = time.monotonic()
+        with self._lock:
+            warned_at, count = self._misses.get(chain_lower, (None, 0))
+            if warned_at is not None and now - warned_at < self.WARNING_INTERVAL:
+                self._misses[chain_lower] = (warned_at, count + 1)
+                return
 
-    blockchain = mapping.get(chain_lower)
-    if blockchain:
-        return blockchain
+            if warned_at is None and len(self._misses) >= self.MAX_MISSES:
+                del self._misses[next(iter(self._misses))]
 
-    if chain_lower in Blockchain.__members__.values():
-        return Blockchain(chain_lower)
+            self._misses[chain_lower] = (now, 0)
 
-    logger.warning(f'Cannot convert chain id "{chain}" to Blockchain for {source}')
-    return None
+        suppressed = f' ({count} more times since)' if count else ''
+        logger.warning(
+            f'Cannot convert chain id "{chain}" to Blockchain for {self.source}'
+            f'{suppressed}'
+        )
+
+
+DEBANK_CHAINS = ChainTable('DeBank', DEBANK_BLOCKCHAINS_MAP)
+COINGECKO_CHAINS = ChainTable('CoinGecko', COINGECKO_BLOCKCHAINS_MAP)
+CHAIN_ID_CHAINS = ChainTable('Chain ID', CHAIN_ID_BLOCKCHAINS_MAP, names_are_ids=False)
+RANGO_CHAINS = ChainTable('Rango', RANGO_BLOCKCHAINS_MAP)
+WORMHOLE_CHAINS = ChainTable('Wormhole', WORMHOLE_BLOCKCHAINS_MAP)
 
 
 def get_blockchain_from_debank_chain(chain: Optional[str]) -> Optional[Blockchain]:
-    return _get_chain_mapping(chain, 'DeBank', DEBANK_BLOCKCHAINS_MAP)
+    return DEBANK_CHAINS.get(chain)
 
 
 def get_blockchain_from_coingecko_chain(chain: Optional[str]) -> Optional[Blockchain]:
-    return _get_chain_mapping(chain, 'CoinGecko', COINGECKO_BLOCKCHAINS_MAP)
+    return COINGECKO_CHAINS.get(chain)
 
 
 def get_blockchain_from_chain_id(
     chain: Optional[Union[str, int]],
 ) -> Optional[Blockchain]:
-    return _get_chain_mapping(chain, 'Chain ID', CHAIN_ID_BLOCKCHAINS_MAP)
+    return CHAIN_ID_CHAINS.get(chain)
 
 
 def get_blockchain_from_rango_chain(chain: Optional[str]) -> Optional[Blockchain]:
-    return _get_chain_mapping(chain, 'Rango', RANGO_BLOCKCHAINS_MAP)
+    return RANGO_CHAINS.get(chain)
 
 
 def get_blockchain_from_wormhole_chain(chain: Optional[str]) -> Optional[Blockchain]:
-    return _get_chain_mapping(chain, 'Wormhole', WORMHOLE_BLOCKCHAINS_MAP)
+    return WORMHOLE_CHAINS.get(chain)
+
+
+def get_debank_chain(blockchain: Blockchain) -> Optional[str]:
+    return DEBANK_CHAINS.chain_id(blockchain)
+
+
+def get_coingecko_chain(blockchain: Blockchain) -> Optional[str]:
+    return COINGECKO_CHAINS.chain_id(blockchain)
+
+
+def get_chain_id(blockchain: Blockchain) -> Optional[str]:
+    return CHAIN_ID_CHAINS.chain_id(blockchain)
+
+
+def get_rango_chain(blockchain: Blockchain) -> Optional[str]:
+    return RANGO_CHAINS.chain_id(blockchain)
+
+
+def get_wormhole_chain(blockchain: Blockchain) -> Optional[str]:
+    return WORMHOLE_CHAINS.chain_id(blockchain)
@@ -0,0 +1,282 @@
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Awaitable, Callable, Optional
+from urllib.parse import urlencode
+
+import attr
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+
+def build_response(
+    status_code: int,
+    headers: dict,
+    content: bytes,
+    reason: Optional[str] = None,
+    url: Optional[str] = None,
+    elapsed: Optional[timedelta] = None,
+) -> Response:
+    """
+    Build `requests.Response` from raw parts, so responses which didn't come
+    from a requests session are handled like any other response.
+    """
+    response = Response()
+    response.status_code = status_code
+    response.reason = reason
+    response.headers = CaseInsensitiveDict(headers)
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.url = url
+    response._content = content
+    if elapsed is not None:
+        response.elapsed = elapsed
+
+    return response
+
+
+@attr.s(auto_attribs=True, slots=True, frozen=True)
+class CachedResponse:
+    status_code: int
+    headers: dict
+    content: bytes
+    expires_at: float
+    url: Optional[str] = None
+
+    @property
+    def etag(self) -> Optional[str]:
+        return CaseInsensitiveDict(self.headers).get('etag')
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return CaseInsensitiveDict(self.headers).get('last-modified')
+
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    def refreshed(self, ttl: float) -> 'CachedResponse':
+        return attr.evolve(self, expires_at=time.time() + ttl)
+
+    def to_response(self) -> Response:
+        return build_response(
+            self.status_code, self.headers, self.content, reason='OK', url=self.url
+        )
+
+    @classmethod
+    def from_response(cls, response: Response, ttl: float) -> 'CachedResponse':
+        return cls(
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            content=response.content,
+            expires_at=time.time() + ttl,
+            url=response.url,
+        )
+
+
+class IResponseCache(ABC):
+    def get(self, key: str) -> Optional[CachedResponse]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: CachedResponse) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class MemoryResponseCache(IResponseCache):
+    """
+    In-process LRU cache. Stale entries are kept until evicted, so they can
+    be revalidated with ETag / Last-Modified.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._data: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+
+            return value
+
+    def set(self, key: str, value: CachedResponse) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class SqliteResponseCache(IResponseCache):
+    """
+    On-disk LRU cache, survives restarts and can be shared by processes on
+    the same host. `mmap_size` enables memory-mapped reads of the database.
+    """
+
+    def __init__(self, path: str, max_entries: int = 10000, mmap_size: int = 0):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock, self._db:
+            self._db.execute('PRAGMA journal_mode=WAL')
+            if mmap_size:
+                self._db.execute(f'PRAGMA mmap_size={int(mmap_size)}')
+
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS responses ('
+                'key TEXT PRIMARY KEY, status_code INTEGER, headers TEXT, '
+                'content BLOB, expires_at REAL, url TEXT, accessed_at REAL)'
+            )
+            self._db.execute(
+                'CREATE INDEX IF NOT EXISTS responses_accessed_at '
+                'ON responses (accessed_at)'
+            )
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock, self._db:
+            row = self._db.execute(
+                'SELECT status_code, headers, content, expires_at, url '
+                'FROM responses WHERE key = ?',
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+
+            self._db.execute(
+                'UPDATE responses SET accessed_at = ? WHERE key = ?',
+                (time.time(), key),
+            )
+
+        status_code, headers, content, expires_at, url = row
+        return CachedResponse(
+            status_code=status_code,
+            headers=json.loads(headers),
+            content=content,
+            expires_at=expires_at,
+            url=url,
+        )
+
+    def set(self, key: str, value: CachedResponse) -> None:
+        with self._lock, self._db:
+            self._db.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (
+                    key,
+                    value.status_code,
+                    json.dumps(value.headers),
+                    value.content,
+                    value.expires_at,
+                    value.url,
+                    time.time(),
+                ),
+            )
+            self._db.execute(
+                'DELETE FROM responses WHERE key IN ('
+                'SELECT key FROM responses ORDER BY accessed_at DESC '
+                'LIMIT -1 OFFSET ?)',
+                (self.max_entries,),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._db:
+            self._db.execute('DELETE FROM responses WHERE key = ?', (key,))
+
+    def clear(self) -> None:
+        with self._lock, self._db:
+            self._db.execute('DELETE FROM responses')
+
+    def close(self) -> None:
+        self._db.close()
+
+
+def make_cache_key(request_method: str, url: str, params: Optional[dict]) -> str:
+    if not params:
+        return f'{request_method} {url}'
+
+    return f'{request_method} {url} {urlencode(sorted(params.items()))}'
+
+
+def get_conditional_headers(entry: Optional[CachedResponse]) -> dict:
+    if entry is None:
+        return {}
+
+    headers = {}
+    if etag := entry.etag:
+        headers['If-None-Match'] = etag
+
+    if last_modified := entry.last_modified:
+        headers['If-Modified-Since'] = last_modified
+
+    return headers
+
+
+def get_with_cache(
+    cache: IResponseCache,
+    key: str,
+    ttl: float,
+    send: Callable[[dict], Response],
+) -> Response:
+    """
+    Serve fresh entry from cache, otherwise call `send` with conditional
+    request headers and store (or revalidate) the result.
+    """
+    entry = cache.get(key)
+    if entry is not None and entry.is_fresh():
+        return entry.to_response()
+
+    response = send(get_conditional_headers(entry))
+    return _update_cache(cache, key, ttl, entry, response)
+
+
+async def get_with_cache_async(
+    cache: IResponseCache,
+    key: str,
+    ttl: float,
+    send: Callable[[dict], Awaitable[Response]],
+) -> Response:
+    entry = cache.get(key)
+    if entry is not None and entry.is_fresh():
+        return entry.to_response()
+
+    response = await send(get_conditional_headers(entry))
+    return _update_cache(cache, key, ttl, entry, response)
+
+
+def _update_cache(
+    cache: IResponseCache,
+    key: str,
+    ttl: float,
+    entry: Optional[CachedResponse],
+    response: Response,
+) -> Response:
+    if response.status_code == 304 and entry is not None:
+        entry = entry.refreshed(ttl)
+        cache.set(key, entry)
+        return entry.to_response()
+
+    if response.status_code == 200:
+        cache.set(key, CachedResponse.from_response(response, ttl))
+
+    return response
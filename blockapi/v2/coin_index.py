@@ -0,0 +1,83 @@
+"""
+Index of the known coins defined in `blockapi.v2.coins`, built once at
+import, for parsers resolving coins of their items:
+
+    coin = coin_index.get_by_contract(Blockchain.ETHEREUM, contract)
+    coin = coin_index.get_by_coingecko_id(Blockchain.ETHEREUM, coingecko_id)
+
+Where several coins share a key, the one defined first in `coins` wins.
+"""
+
+from types import MappingProxyType
+from typing import Hashable, Iterable, Optional
+
+from blockapi.v2 import coins as _coins_module
+from blockapi.v2.models import Blockchain, Coin
+
+
+def normalize_contract(contract: str) -> str:
+    """Hex (EVM) addresses are case insensitive, others (base58) are not."""
+    return contract.lower() if contract[:2] in ('0x', '0X') else contract
+
+
+class CoinIndex:
+    def __init__(self, coins: Iterable[Coin]):
+        self.coins: tuple[Coin, ...] = tuple(coins)
+        by_contract: dict[tuple[Blockchain, str], Coin] = {}
+        by_symbol: dict[tuple[Optional[Blockchain], str], Coin] = {}
+        by_coingecko_id: dict[tuple[Blockchain, str], Coin] = {}
+        for coin in self.coins:
+            if coin.address:
+                key = (coin.blockchain, normalize_contract(coin.address))
+                by_contract.setdefault(key, coin)
+            if coin.symbol:
+                by_symbol.setdefault((coin.blockchain, coin.symbol), coin)
+                by_symbol.setdefault((None, coin.symbol), coin)
+            if coin.info and coin.info.coingecko_id:
+                key = (coin.blockchain, coin.info.coingecko_id)
+                by_coingecko_id.setdefault(key, coin)
+
+        self._by_contract = MappingProxyType(by_contract)
+        self._by_symbol = MappingProxyType(by_symbol)
+        self._by_coingecko_id = MappingProxyType(by_coingecko_id)
+
+    @classmethod
+    def from_module(cls, module=_coins_module) -> 'CoinIndex':
+        """Index of the `COIN_*` coins of `module`, in order of definition."""
+        return cls(
+            obj
+            for name, obj in vars(module).items()
+            if name.startswith('COIN_') and isinstance(obj, Coin)
+        )
+
+    def get_by_contract(
+        self, blockchain: Optional[Blockchain], contract: Optional[str]
+    ) -> Optional[Coin]:
+        if not contract:
+            return None
+
+        return self._by_contract.get((blockchain, normalize_contract(contract)))
+
+    def get_coingecko_id(
+        self, blockchain: Optional[Blockchain], contract: Optional[str]
+    ) -> Optional[str]:
+        """CoinGecko id of a known coin by its contract."""
+        coin = self.get_by_contract(blockchain, contract)
+        return coin.info.coingecko_id if coin and coin.info else None
+
+    def get_by_symbol(
+        self, symbol: Optional[str], blockchain: Optional[Blockchain] = None
+    ) -> Optional[Coin]:
+        """Coin of `symbol` on `blockchain`, on any blockchain if not given."""
+        return self._by_symbol.get((blockchain, symbol))
+
+    def get_by_coingecko_id(
+        self, blockchain: Optional[Blockchain], coingecko_id: Optional[Hashable]
+    ) -> Optional[Coin]:
+        return self._by_coingecko_id.get((blockchain, coingecko_id))
+
+    def __len__(self) -> int:
+        return len(self.coins)
+
+
+coin_index = CoinIndex.from_module()
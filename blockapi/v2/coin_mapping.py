@@ -1,6 +1,4 @@
-import inspect
-
-from blockapi.v2 import coins as _coins_module
+from blockapi.v2.coin_index import coin_index
 from blockapi.v2.coins import (
     COIN_DAI,
     COIN_ETH,
@@ -11,14 +9,11 @@ from blockapi.v2.coins import (
 )
 from blockapi.v2.models import Blockchain, Coin
 
-# Dynamically collect all COIN_* variables from coins module
-coins: list[Coin] = [
-    obj
-    for name, obj in inspect.getmembers(_coins_module)
-    if name.startswith('COIN_') and isinstance(obj, Coin)
-]
+coins: list[Coin] = list(coin_index.coins)
 
-symbol_to_coin_map: dict[str, Coin] = {coin.symbol: coin for coin in coins}
+symbol_to_coin_map: dict[str, Coin] = {
+    coin.symbol: coin_index.get_by_symbol(coin.symbol) for coin in coins
+}
 
 OPENSEA_COINS: dict[str, Coin] = {
     'ETH': COIN_ETH,
@@ -0,0 +1,124 @@
+"""
+Flyweight registry for the value objects repeated across balances: the same
+token held by thousands of wallets is one `Coin` (with one `CoinInfo`), and
+one `Protocol`, instead of a copy per parsed item.
+
+    registry = InternRegistry()
+    balances = registry.intern_balances(parse_result.data, drop_raw=True)
+
+Objects are looked up by blockchain and address (protocol id for protocols)
+and shared only when equal, so interning never changes values. A different
+object under the same key replaces the stored one, e.g. after its metadata
+changed.
+"""
+
+import threading
+from typing import Hashable, Iterable, Optional, TypeVar
+
+import attr
+
+from blockapi.v2.models import BalanceItem, Coin, CoinInfo, Pool, Protocol
+
+T = TypeVar('T')
+
+# shared by items with dropped raw payload, must not be modified
+NO_RAW: dict = {}
+
+
+class InternTable:
+    """
+    Objects by key, bounded: the oldest entries are dropped beyond
+    `max_entries`. Thread-safe.
+    """
+
+    def __init__(self, max_entries: int = 100000):
+        self.max_entries = max_entries
+        self._data: dict[Hashable, object] = {}
+        self._lock = threading.Lock()
+
+    def intern(self, key: Hashable, obj: T) -> T:
+        """Stored object equal to `obj` under `key`, otherwise store `obj`."""
+        existing = self._data.get(key)
+        if existing is obj or (existing is not None and existing == obj):
+            return existing
+
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.max_entries:
+                del self._data[next(iter(self._data))]
+
+            self._data[key] = obj
+
+        return obj
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class InternRegistry:
+    def __init__(self, max_entries: int = 100000):
+        self._coins = InternTable(max_entries)
+        self._coin_infos = InternTable(max_entries)
+        self._protocols = InternTable(max_entries)
+
+    def coin(self, coin: Optional[Coin]) -> Optional[Coin]:
+        if coin is None:
+            return None
+
+        if (
+            coin.info is not None
+            and (info := self.coin_info(coin.info)) is not coin.info
+        ):
+            coin = attr.evolve(coin, info=info)
+
+        key = (coin.blockchain, coin.address, coin.protocol_id, coin.symbol)
+        return self._coins.intern(key, coin)
+
+    def coin_info(self, info: Optional[CoinInfo]) -> Optional[CoinInfo]:
+        if info is None:
+            return None
+
+        return self._coin_infos.intern((info.coingecko_id, info.logo_url), info)
+
+    def protocol(self, protocol: Optional[Protocol]) -> Optional[Protocol]:
+        if protocol is None:
+            return None
+
+        key = (protocol.chain, protocol.protocol_id)
+        return self._protocols.intern(key, protocol)
+
+    def balance_item(self, item: BalanceItem, drop_raw: bool = False) -> BalanceItem:
+        """
+        Item sharing interned coin and protocol; with `drop_raw` the raw
+        provider payload is replaced by the shared empty `NO_RAW`.
+        """
+        coin = self.coin(item.coin)
+        protocol = self.protocol(item.protocol)
+        raw = NO_RAW if drop_raw else item.raw
+        if coin is item.coin and protocol is item.protocol and raw is item.raw:
+            return item
+
+        return attr.evolve(item, coin=coin, protocol=protocol, raw=raw)
+
+    def intern_balances(
+        self, items: Iterable[BalanceItem], drop_raw: bool = False
+    ) -> list[BalanceItem]:
+        return [self.balance_item(item, drop_raw) for item in items]
+
+    def intern_pools(self, pools: Iterable[Pool], drop_raw: bool = False) -> list[Pool]:
+        return [
+            attr.evolve(
+                pool,
+                protocol=self.protocol(pool.protocol),
+                items=self.intern_balances(pool.items, drop_raw),
+            )
+            for pool in pools
+        ]
+
+    def clear(self) -> None:
+        self._coins.clear()
+        self._coin_infos.clear()
+        self._protocols.clear()
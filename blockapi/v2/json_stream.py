@@ -0,0 +1,265 @@
+import codecs
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, Union
+
+_NEED_DATA = object()
+_WHITESPACE = ' \t\n\r'
+_NUMBER_START = '-0123456789'
+
+
+class JsonStreamError(ValueError):
+    pass
+
+
+class JsonPointerNotFound(JsonStreamError):
+    pass
+
+
+class UnexpectedJsonValue(JsonStreamError):
+    """
+    The value at the pointer is not an array, e.g. an error object returned
+    with status 200. The decoded value is available as `value`.
+    """
+
+    def __init__(self, value: Any):
+        super().__init__(f'Expected JSON array, got {type(value).__name__}')
+        self.value = value
+
+
+def parse_pointer(pointer: str) -> list[str]:
+    """
+    Split RFC 6901 JSON pointer, e.g. '/result/value' or '' for the document.
+    """
+    if not pointer:
+        return []
+
+    if not pointer.startswith('/'):
+        raise ValueError(f'Invalid JSON pointer: {pointer!r}')
+
+    return [
+        part.replace('~1', '/').replace('~0', '~') for part in pointer.split('/')[1:]
+    ]
+
+
+class JsonItemStream:
+    """
+    Incremental decoder of items of the JSON array at `pointer`. Feed it
+    chunks of the document as they arrive and get back the items completed
+    so far; only the item being decoded is held in memory, never the whole
+    document. Sibling values on the way to the pointer are decoded and
+    dropped.
+
+    `json_kwargs` are passed to `json.JSONDecoder`, e.g. `parse_float`.
+    """
+
+    def __init__(self, pointer: str = '', **json_kwargs):
+        self._segments = parse_pointer(pointer)
+        self._decoder = json.JSONDecoder(**json_kwargs)
+        self._text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._pos = 0
+        # chunks not merged into buffer yet, joined only when needed
+        self._pending: list[str] = []
+        self._pending_size = 0
+        self._eof = False
+        self._done = False
+        self._parser = self._parse()
+
+    def feed(self, chunk: Union[bytes, str]) -> list:
+        if isinstance(chunk, bytes):
+            chunk = self._text_decoder.decode(chunk)
+
+        self._pending.append(chunk)
+        self._pending_size += len(chunk)
+        return self._resume()
+
+    def close(self) -> list:
+        """
+        Signal end of the document, return remaining items.
+        """
+        self._pending.append(self._text_decoder.decode(b'', final=True))
+        self._eof = True
+        return self._resume()
+
+    def _merge(self) -> None:
+        # drop consumed text, so the buffer holds the current item only
+        if self._pending:
+            self._buffer = self._buffer[self._pos :] + ''.join(self._pending)
+            self._pos = 0
+            self._pending.clear()
+            self._pending_size = 0
+
+    def _resume(self) -> list:
+        items = []
+        if self._done:
+            return items
+
+        for item in self._parser:
+            if item is _NEED_DATA:
+                return items
+
+            items.append(item)
+
+        self._done = True
+        return items
+
+    def _parse(self):
+        for segment in self._segments:
+            char = yield from self._peek()
+            if char == '{':
+                yield from self._enter_object_member(segment)
+            elif char == '[':
+                yield from self._enter_array_item(segment)
+            else:
+                raise JsonPointerNotFound(f'No {segment!r} in JSON {char!r} value')
+
+        char = yield from self._peek()
+        if char != '[':
+            value = yield from self._read_value()
+            if value is not None:
+                raise UnexpectedJsonValue(value)
+
+            return
+
+        self._pos += 1
+        char = yield from self._peek()
+        if char == ']':
+            return
+
+        while True:
+            item = yield from self._read_value()
+            yield item
+
+            char = yield from self._peek()
+            self._pos += 1
+            if char == ']':
+                return
+
+            if char != ',':
+                self._raise_unexpected("',' or ']'")
+
+    def _enter_object_member(self, name: str):
+        self._pos += 1
+        char = yield from self._peek()
+        while char != '}':
+            key = yield from self._read_value()
+            yield from self._expect(':')
+            if key == name:
+                return
+
+            yield from self._read_value()
+            char = yield from self._peek()
+            self._pos += 1
+            if char == ',':
+                char = yield from self._peek()
+            elif char != '}':
+                self._raise_unexpected("',' or '}'")
+
+        raise JsonPointerNotFound(f'No member {name!r} in JSON object')
+
+    def _enter_array_item(self, index: str):
+        if not index.isdigit():
+            raise JsonPointerNotFound(f'Invalid array index {index!r}')
+
+        self._pos += 1
+        char = yield from self._peek()
+        for _ in range(int(index)):
+            if char == ']':
+                break
+
+            yield from self._read_value()
+            char = yield from self._peek()
+            if char == ',':
+                self._pos += 1
+                char = yield from self._peek()
+            elif char != ']':
+                self._raise_unexpected("',' or ']'")
+
+        if char == ']':
+            raise JsonPointerNotFound(f'No item {index} in JSON array')
+
+    def _read_value(self):
+        yield from self._peek()
+        # retry decoding only once the available text doubled, so an item
+        # spanning many chunks is decoded in amortized linear time
+        retry_at = 0
+        while True:
+            available = len(self._buffer) - self._pos + self._pending_size
+            if available >= retry_at or self._eof:
+                self._merge()
+                try:
+                    value, end = self._decoder.raw_decode(self._buffer, self._pos)
+                except json.JSONDecodeError:
+                    if self._eof:
+                        raise
+                else:
+                    # a number ending the buffer may continue in next chunk
+                    complete = end < len(self._buffer) or (
+                        self._buffer[self._pos] not in _NUMBER_START
+                    )
+                    if complete or self._eof:
+                        self._pos = end
+                        return value
+
+                retry_at = 2 * available
+
+            yield _NEED_DATA
+
+    def _peek(self):
+        """
+        Skip whitespace, return next character ('' at the end).
+        """
+        while True:
+            while (
+                self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE
+            ):
+                self._pos += 1
+
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+
+            if self._pending:
+                self._merge()
+                continue
+
+            if self._eof:
+                return ''
+
+            yield _NEED_DATA
+
+    def _expect(self, char: str):
+        if (yield from self._peek()) != char:
+            self._raise_unexpected(repr(char))
+
+        self._pos += 1
+
+    def _raise_unexpected(self, expected: str):
+        raise json.JSONDecodeError(f'Expecting {expected}', self._buffer, self._pos)
+
+
+def iter_json_items(
+    chunks: Iterable[Union[bytes, str]], pointer: str = '', **json_kwargs
+) -> Iterator[Any]:
+    """
+    Iterate items of the JSON array at `pointer` in a document read in chunks.
+    """
+    stream = JsonItemStream(pointer, **json_kwargs)
+    for chunk in chunks:
+        yield from stream.feed(chunk)
+
+    yield from stream.close()
+
+
+async def aiter_json_items(
+    chunks: AsyncIterable[bytes], pointer: str = '', **json_kwargs
+) -> AsyncIterator[Any]:
+    """
+    Asyncio counterpart of `iter_json_items`.
+    """
+    stream = JsonItemStream(pointer, **json_kwargs)
+    async for chunk in chunks:
+        for item in stream.feed(chunk):
+            yield item
+
+    for item in stream.close():
+        yield item
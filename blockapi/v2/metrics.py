@@ -0,0 +1,361 @@
+import bisect
+import contextvars
+import logging
+import threading
+import time
+from abc import ABC
+from collections import defaultdict
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator, Optional, Sequence
+
+import attr
+from requests import Response
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+
+@attr.s(auto_attribs=True, slots=True, frozen=True)
+class RequestMetrics:
+    """
+    Timings of one `get_data` call, in seconds. `duration` spans all
+    attempts including retry and rate limit sleeps; `ttfb` and `body_time`
+    describe the last attempt. `dns_time` and `connect_time` are reported
+    only by the asyncio transport (requests doesn't expose them), and are
+    None when a pooled connection was reused.
+    """
+
+    api: str
+    request_method: str
+    status_code: int
+    duration: float
+    ttfb: float = 0.0
+    body_time: float = 0.0
+    decode_time: float = 0.0
+    dns_time: Optional[float] = None
+    connect_time: Optional[float] = None
+    sleep_time: float = 0.0
+    retries: int = 0
+    response_bytes: int = 0
+    errors: int = 0
+
+
+class IRequestObserver(ABC):
+    def on_request(self, metrics: RequestMetrics) -> None:
+        raise NotImplementedError
+
+
+_current_timer = contextvars.ContextVar('blockapi_request_timer', default=None)
+
+
+class RequestTimer:
+    """
+    Collects timings of a `get_data` call while it's active. Transport code
+    reports into the active timer via `add_sleep_time` / `add_dns_time` /
+    `add_connect_time`, which works for threads and asyncio tasks alike.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.attempts = 0
+        self.sleep_time = 0.0
+        self.decode_time = 0.0
+        self.dns_time: Optional[float] = None
+        self.connect_time: Optional[float] = None
+        self._response: Optional[Response] = None
+        self._attempt_time = 0.0
+
+    @contextmanager
+    def activate(self) -> Iterator['RequestTimer']:
+        token = _current_timer.set(self)
+        try:
+            yield self
+        finally:
+            _current_timer.reset(token)
+
+    @contextmanager
+    def attempt(self) -> Iterator[None]:
+        self.attempts += 1
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._attempt_time = time.perf_counter() - started
+
+    @contextmanager
+    def decoding(self) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.decode_time += time.perf_counter() - started
+
+    def set_response(self, response: Response) -> None:
+        self._response = response
+
+    def finish(
+        self, api: str, request_method: str, status_code: int, errors: int
+    ) -> RequestMetrics:
+        ttfb = 0.0
+        response_bytes = 0
+        if self._response is not None:
+            ttfb = self._response.elapsed.total_seconds()
+            response_bytes = len(self._response.content or b'')
+
+        return RequestMetrics(
+            api=api,
+            request_method=request_method,
+            status_code=status_code,
+            duration=time.perf_counter() - self.started,
+            ttfb=ttfb,
+            body_time=max(self._attempt_time - ttfb, 0.0) if ttfb else 0.0,
+            decode_time=self.decode_time,
+            dns_time=self.dns_time,
+            connect_time=self.connect_time,
+            sleep_time=self.sleep_time,
+            retries=max(self.attempts - 1, 0),
+            response_bytes=response_bytes,
+            errors=errors,
+        )
+
+
+def add_sleep_time(seconds: float) -> None:
+    if (timer := _current_timer.get()) is not None:
+        timer.sleep_time += seconds
+
+
+def add_dns_time(seconds: float) -> None:
+    if (timer := _current_timer.get()) is not None:
+        timer.dns_time = (timer.dns_time or 0.0) + seconds
+
+
+def add_connect_time(seconds: float) -> None:
+    if (timer := _current_timer.get()) is not None:
+        timer.connect_time = (timer.connect_time or 0.0) + seconds
+
+
+def notify_observers(
+    observers: Sequence[IRequestObserver], metrics: RequestMetrics
+) -> None:
+    for observer in observers:
+        try:
+            observer.on_request(metrics)
+        except Exception:
+            # instrumentation must never break fetching
+            logger.exception('Request observer %r failed', observer)
+
+
+class Histogram:
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative_counts(self) -> list[int]:
+        result = []
+        total = 0
+        for count in self.counts:
+            total += count
+            result.append(total)
+
+        return result
+
+    def quantile(self, q: float) -> float:
+        """
+        Upper bound of the bucket holding given quantile (inf for overflow).
+        """
+        if not self.count:
+            return 0.0
+
+        rank = q * self.count
+        for bound, total in zip(self.buckets, self.cumulative_counts()):
+            if total >= rank:
+                return bound
+
+        return float('inf')
+
+
+class HistogramAggregator(IRequestObserver):
+    """
+    In-process aggregation of request metrics per adapter and request
+    method: latency histograms and counters.
+    """
+
+    HISTOGRAMS = ('duration', 'ttfb', 'body_time', 'decode_time')
+    COUNTERS = ('sleep_time', 'retries', 'response_bytes', 'errors')
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._histograms: dict[tuple, Histogram] = {}
+        self._counters: dict[tuple, float] = defaultdict(float)
+        self._statuses: dict[tuple, int] = defaultdict(int)
+
+    def on_request(self, metrics: RequestMetrics) -> None:
+        labels = (metrics.api, metrics.request_method)
+        with self._lock:
+            for name in self.HISTOGRAMS:
+                self._get_histogram(name, labels).observe(getattr(metrics, name))
+
+            for name in self.COUNTERS:
+                self._counters[(name, *labels)] += getattr(metrics, name)
+
+            self._statuses[(*labels, metrics.status_code)] += 1
+
+    def histogram(self, name: str, api: str, request_method: str) -> Histogram:
+        with self._lock:
+            return self._get_histogram(name, (api, request_method))
+
+    def counter(self, name: str, api: str, request_method: str) -> float:
+        with self._lock:
+            return self._counters.get((name, api, request_method), 0)
+
+    def requests(self, api: str, request_method: str) -> dict[int, int]:
+        with self._lock:
+            return {
+                status: count
+                for (a, m, status), count in self._statuses.items()
+                if (a, m) == (api, request_method)
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+            self._statuses.clear()
+
+    def _get_histogram(self, name: str, labels: tuple) -> Histogram:
+        key = (name, *labels)
+        if (histogram := self._histograms.get(key)) is None:
+            histogram = self._histograms[key] = Histogram(self.buckets)
+
+        return histogram
+
+    def _snapshot(self) -> tuple[dict, dict, dict]:
+        with self._lock:
+            histograms = {
+                key: (h.buckets, h.cumulative_counts(), h.sum, h.count)
+                for key, h in self._histograms.items()
+            }
+            return histograms, dict(self._counters), dict(self._statuses)
+
+
+class PrometheusExporter:
+    """
+    Renders aggregated metrics in Prometheus text exposition format,
+    optionally served over HTTP for scraping.
+    """
+
+    PREFIX = 'blockapi'
+
+    HISTOGRAM_NAMES = {
+        'duration': 'request_duration_seconds',
+        'ttfb': 'request_ttfb_seconds',
+        'body_time': 'request_body_seconds',
+        'decode_time': 'json_decode_seconds',
+    }
+
+    COUNTER_NAMES = {
+        'sleep_time': 'sleep_seconds_total',
+        'retries': 'request_retries_total',
+        'response_bytes': 'response_bytes_total',
+        'errors': 'request_errors_total',
+    }
+
+    def __init__(self, aggregator: HistogramAggregator):
+        self.aggregator = aggregator
+
+    def render(self) -> str:
+        histograms, counters, statuses = self.aggregator._snapshot()
+        lines = []
+
+        for field, name in self.HISTOGRAM_NAMES.items():
+            metric = f'{self.PREFIX}_{name}'
+            lines.append(f'# TYPE {metric} histogram')
+            for (hist_field, api, method), data in sorted(histograms.items()):
+                if hist_field != field:
+                    continue
+
+                buckets, cumulative, total, count = data
+                labels = self._labels(api=api, request_method=method)
+                for bound, value in zip(buckets, cumulative):
+                    bucket_labels = self._labels(
+                        api=api, request_method=method, le=repr(float(bound))
+                    )
+                    lines.append(f'{metric}_bucket{bucket_labels} {value}')
+
+                inf_labels = self._labels(api=api, request_method=method, le='+Inf')
+                lines.append(f'{metric}_bucket{inf_labels} {count}')
+                lines.append(f'{metric}_sum{labels} {total}')
+                lines.append(f'{metric}_count{labels} {count}')
+
+        for field, name in self.COUNTER_NAMES.items():
+            metric = f'{self.PREFIX}_{name}'
+            lines.append(f'# TYPE {metric} counter')
+            for (counter_field, api, method), value in sorted(counters.items()):
+                if counter_field == field:
+                    labels = self._labels(api=api, request_method=method)
+                    lines.append(f'{metric}{labels} {value}')
+
+        metric = f'{self.PREFIX}_requests_total'
+        lines.append(f'# TYPE {metric} counter')
+        for (api, method, status), value in sorted(statuses.items()):
+            labels = self._labels(api=api, request_method=method, status=str(status))
+            lines.append(f'{metric}{labels} {value}')
+
+        return '\n'.join(lines) + '\n'
+
+    def start_http_server(self, port: int, addr: str = '') -> ThreadingHTTPServer:
+        """
+        Serve `render()` on every path from a daemon thread, return the
+        server (call `shutdown()` to stop it).
+        """
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = exporter.render().encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((addr, port), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        return server
+
+    @staticmethod
+    def _labels(**labels: str) -> str:
+        pairs = (f'{k}="{_escape_label(v)}"' for k, v in labels.items())
+        return '{' + ','.join(pairs) + '}'
+
+
+def _escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
@@ -1,4 +1,3 @@
-import json
 from datetime import datetime, timezone
 from decimal import Decimal
 from enum import Enum
@@ -7,6 +6,7 @@ from typing import Dict, List, Literal, Optional, Union
 import attr
 from pydantic import BaseModel, Field
 
+from blockapi.utils import json as json_codec
 from blockapi.utils.datetime import parse_dt
 from blockapi.utils.num import raw_to_decimals, to_decimal, to_int
 
@@ -511,6 +511,10 @@ class ApiOptions:
     base_url: Optional[str]
     rate_limit: float = 0.0
     testnet: bool = False
+    rate_limit_burst: int = 1
+    # pace every request by the shared per-host bucket of `rate_limit`;
+    # otherwise `rate_limit` is informative, adapters use it as they see fit
+    enforce_rate_limit: bool = False
 
     start_offset: Optional[int] = attr.ib(default=None)
     max_items_per_page: Optional[int] = attr.ib(default=None)
@@ -1386,7 +1390,7 @@ class FetchResult:
 
     def json(self):
         d = attr.asdict(self)
-        return json.dumps({k: v for k, v in d.items() if v}, default=str)
+        return json_codec.dumps({k: v for k, v in d.items() if v}, default=str)
 
     @classmethod
     def from_dict(cls, **kwargs):
@@ -0,0 +1,100 @@
+import asyncio
+import threading
+import time
+from typing import Callable, Optional
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at `rate` tokens per second, holding at most `burst`
+    tokens. A caller reserves a token and gets back how long it has to wait
+    for it, so the wait happens outside the lock and concurrent callers
+    (threads or tasks) are served in order at exactly the configured rate.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate <= 0:
+            raise ValueError('rate must be positive')
+
+        if burst < 1:
+            raise ValueError('burst must be at least 1')
+
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: int = 1) -> float:
+        """
+        Take tokens from the bucket and return seconds to wait before they
+        may be used (0 when available right away).
+        """
+        with self._lock:
+            now = self._clock()
+            elapsed = now - self._updated
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+
+            if self._tokens >= 0:
+                return 0.0
+
+            return -self._tokens / self.rate
+
+    def acquire(self, tokens: int = 1) -> float:
+        """
+        Block until tokens are available, return seconds waited.
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+        return wait
+
+    async def acquire_async(self, tokens: int = 1) -> float:
+        """
+        Wait without blocking the event loop, return seconds waited.
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+        return wait
+
+
+_buckets: dict[tuple[str, float, int], TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    key: str, rate_limit: float, burst: int = 1
+) -> Optional[TokenBucket]:
+    """
+    Return process-wide bucket for given key (API base URL) and pacing,
+    created on first use. `rate_limit` is the minimal interval between
+    requests in seconds, the same unit as `ApiOptions.rate_limit`; 0 disables
+    limiting. Clients of one URL configured with different pacing get
+    different buckets, each at its own rate.
+    """
+    if not rate_limit or rate_limit <= 0:
+        return None
+
+    with _buckets_lock:
+        bucket = _buckets.get((key, rate_limit, burst))
+        if bucket is None:
+            bucket = TokenBucket(rate=1 / rate_limit, burst=burst)
+            _buckets[key, rate_limit, burst] = bucket
+
+        return bucket
+
+
+def reset_rate_limiters() -> None:
+    with _buckets_lock:
+        _buckets.clear()
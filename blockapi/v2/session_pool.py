@@ -0,0 +1,212 @@
+import asyncio
+import threading
+import time
+import weakref
+from typing import Iterable, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+import attr
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+from blockapi.v2.metrics import add_connect_time, add_dns_time
+
+ASYNC_CONNECTION_LIMIT = 500
+ASYNC_CONNECTION_LIMIT_PER_HOST = 100
+ASYNC_KEEPALIVE_TIMEOUT = 30
+
+
+@attr.s(auto_attribs=True, slots=True, frozen=True)
+class SessionPoolStats:
+    session_hits: int
+    sessions_created: int
+    requests_sent: int
+    connections_created: int
+
+    @property
+    def connections_reused(self) -> int:
+        return self.requests_sent - self.connections_created
+
+
+def get_origin(url: str) -> str:
+    """
+    Scheme, host and port of URL - sessions are shared per origin, so base
+    URLs differing only in path (e.g. Blockchair chains) reuse connections.
+    """
+    parts = urlsplit(url)
+    if not parts.netloc:
+        return url
+
+    return f'{parts.scheme}://{parts.netloc}'.lower()
+
+
+class SessionPool:
+    """
+    Process-wide pool of `requests.Session` objects keyed by API origin.
+    Sessions keep their connections alive, so short-lived API instances
+    don't pay TCP and TLS setup on every call.
+
+    `requests` speaks HTTP/1.1 only; keep-alive connection reuse is what
+    this pool provides.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 100,
+        pool_block: bool = False,
+    ):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self._sessions: dict[str, Session] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+
+    def get(self, url: str) -> Session:
+        key = get_origin(url)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is not None:
+                self._hits += 1
+                return session
+
+            session = self._create_session()
+            self._sessions[key] = session
+            return session
+
+    def stats(self) -> SessionPoolStats:
+        with self._lock:
+            sessions = list(self._sessions.values())
+            hits = self._hits
+
+        requests_sent = 0
+        connections_created = 0
+        for session in sessions:
+            for pool in self._yield_connection_pools(session):
+                requests_sent += pool.num_requests
+                connections_created += pool.num_connections
+
+        return SessionPoolStats(
+            session_hits=hits,
+            sessions_created=len(sessions),
+            requests_sent=requests_sent,
+            connections_created=connections_created,
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+            self._hits = 0
+
+        for session in sessions:
+            session.close()
+
+    def _create_session(self) -> Session:
+        session = Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    @staticmethod
+    def _yield_connection_pools(session: Session) -> Iterable:
+        adapters = {id(a): a for a in session.adapters.values()}.values()
+        for adapter in adapters:
+            pool_manager = getattr(adapter, 'poolmanager', None)
+            if pool_manager is None:
+                continue
+
+            for key in list(pool_manager.pools.keys()):
+                if (pool := pool_manager.pools.get(key)) is not None:
+                    yield pool
+
+
+_session_pool = SessionPool()
+
+
+def get_session_pool() -> SessionPool:
+    return _session_pool
+
+
+def set_session_pool(pool: SessionPool) -> SessionPool:
+    """
+    Replace the process-wide pool (e.g. with different pool sizes), returns
+    the previous one. Existing API instances keep their sessions.
+    """
+    global _session_pool
+    previous, _session_pool = _session_pool, pool
+    return previous
+
+
+def get_session(url: str) -> Session:
+    return _session_pool.get(url)
+
+
+# One aiohttp session per event loop, shared by all API instances running on
+# that loop; its connector pools connections per host.
+_async_sessions = weakref.WeakKeyDictionary()
+
+
+def get_async_session() -> aiohttp.ClientSession:
+    """
+    Return the pooled aiohttp session of the running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    session = _async_sessions.get(loop)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=ASYNC_CONNECTION_LIMIT,
+                limit_per_host=ASYNC_CONNECTION_LIMIT_PER_HOST,
+                keepalive_timeout=ASYNC_KEEPALIVE_TIMEOUT,
+            ),
+            trace_configs=[_create_timing_trace_config()],
+        )
+        _async_sessions[loop] = session
+
+    return session
+
+
+def _create_timing_trace_config() -> aiohttp.TraceConfig:
+    """
+    Report DNS resolution and connection setup times to the active
+    request timer (see `blockapi.v2.metrics`).
+    """
+
+    async def on_dns_start(session, context, params):
+        context.dns_started = time.perf_counter()
+
+    async def on_dns_end(session, context, params):
+        add_dns_time(time.perf_counter() - context.dns_started)
+
+    async def on_connect_start(session, context, params):
+        context.connect_started = time.perf_counter()
+
+    async def on_connect_end(session, context, params):
+        add_connect_time(time.perf_counter() - context.connect_started)
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_dns_resolvehost_start.append(on_dns_start)
+    trace_config.on_dns_resolvehost_end.append(on_dns_end)
+    trace_config.on_connection_create_start.append(on_connect_start)
+    trace_config.on_connection_create_end.append(on_connect_end)
+    return trace_config
+
+
+async def close_async_session() -> None:
+    """
+    Close the pooled aiohttp session of the running event loop.
+    Call before the loop shuts down, e.g. at the end of a worker's main().
+    """
+    session: Optional[aiohttp.ClientSession] = _async_sessions.pop(
+        asyncio.get_running_loop(), None
+    )
+    if session is not None:
+        await session.close()
@@ -0,0 +1,79 @@
+import asyncio
+import threading
+import weakref
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar('T')
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls with the same key into one: the first caller
+    runs the function, callers arriving while it's in flight wait for and
+    share its result (or exception). Nothing is cached once the call ends.
+
+    Threaded and asyncio callers are coalesced separately; asyncio calls
+    only within the same event loop.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future] = {}
+        self._async_calls = weakref.WeakKeyDictionary()
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        with self._lock:
+            future = self._calls.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = self._calls[key] = Future()
+            else:
+                self.coalesced += 1
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._finish(key)
+            future.set_exception(e)
+            raise
+
+        self._finish(key)
+        future.set_result(result)
+        return result
+
+    def _finish(self, key: Hashable) -> None:
+        with self._lock:
+            self._calls.pop(key, None)
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        loop = asyncio.get_running_loop()
+        calls = self._async_calls.setdefault(loop, {})
+        task = calls.get(key)
+        if task is not None:
+            with self._lock:
+                self.coalesced += 1
+        else:
+            task = calls[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda t: self._finish_async(calls, key, t))
+
+        # one waiter being cancelled must not cancel the shared call
+        return await asyncio.shield(task)
+
+    @staticmethod
+    def _finish_async(calls: dict, key: Hashable, task: asyncio.Future) -> None:
+        calls.pop(key, None)
+        if not task.cancelled():
+            # mark exception as retrieved even if all waiters were cancelled
+            task.exception()
+
+
+_single_flight = SingleFlight()
+
+
+def get_single_flight() -> SingleFlight:
+    return _single_flight